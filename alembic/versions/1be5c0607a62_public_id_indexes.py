@@ -0,0 +1,39 @@
+"""public id indexes
+
+Revision ID: 1be5c0607a62
+Revises: 9877de53b6e3
+Create Date: 2026-10-18 10:03:27.904518
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '1be5c0607a62'
+down_revision = '9877de53b6e3'
+branch_labels = None
+depends_on = None
+
+TABELAS = ('categorias', 'centros_treinamento', 'atletas')
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for tabela in TABELAS:
+            op.create_index(
+                f'ix_{tabela}_id',
+                tabela,
+                ['id'],
+                unique=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for tabela in reversed(TABELAS):
+            op.drop_index(
+                f'ix_{tabela}_id',
+                table_name=tabela,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,40 @@
+"""atletas nome trgm index
+
+Revision ID: 354ab36f4c1d
+Revises: 1be5c0607a62
+Create Date: 2026-10-18 11:26:05.771093
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '354ab36f4c1d'
+down_revision = '1be5c0607a62'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_atletas_nome_trgm',
+            'atletas',
+            ['nome'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'nome': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_atletas_nome_trgm',
+            table_name='atletas',
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
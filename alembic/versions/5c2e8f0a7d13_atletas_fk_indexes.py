@@ -0,0 +1,50 @@
+"""atletas fk indexes
+
+Revision ID: 5c2e8f0a7d13
+Revises: 354ab36f4c1d
+Create Date: 2026-10-18 14:03:27.514820
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '5c2e8f0a7d13'
+down_revision = '354ab36f4c1d'
+branch_labels = None
+depends_on = None
+
+INDICES = {
+    'ix_atletas_categoria_id_created_at_pk_id': [
+        'categoria_id',
+        'created_at',
+        'pk_id',
+    ],
+    'ix_atletas_centro_treinamento_id_created_at_pk_id': [
+        'centro_treinamento_id',
+        'created_at',
+        'pk_id',
+    ],
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for nome, colunas in INDICES.items():
+            op.create_index(
+                nome,
+                'atletas',
+                colunas,
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for nome in INDICES:
+            op.drop_index(
+                nome,
+                table_name='atletas',
+                postgresql_concurrently=True,
+            )
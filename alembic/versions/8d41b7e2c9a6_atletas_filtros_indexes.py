@@ -0,0 +1,54 @@
+"""atletas filtros indexes
+
+Revision ID: 8d41b7e2c9a6
+Revises: 5c2e8f0a7d13
+Create Date: 2026-10-18 16:21:09.377045
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '8d41b7e2c9a6'
+down_revision = '5c2e8f0a7d13'
+branch_labels = None
+depends_on = None
+
+INDICES = {
+    'ix_atletas_nome_pk_id': (['nome', 'pk_id'], None),
+    'ix_atletas_idade_pk_id': (['idade', 'pk_id'], None),
+    'ix_atletas_peso_pk_id': (['peso', 'pk_id'], None),
+    'ix_atletas_created_at_pk_id_sexo_m': (
+        ['created_at', 'pk_id'],
+        sa.text("sexo = 'M'"),
+    ),
+    'ix_atletas_created_at_pk_id_sexo_f': (
+        ['created_at', 'pk_id'],
+        sa.text("sexo = 'F'"),
+    ),
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for nome, (colunas, condicao) in INDICES.items():
+            op.create_index(
+                nome,
+                'atletas',
+                colunas,
+                unique=False,
+                postgresql_where=condicao,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for nome in INDICES:
+            op.drop_index(
+                nome,
+                table_name='atletas',
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,35 @@
+"""atletas keyset index
+
+Revision ID: 9877de53b6e3
+Revises: 12b6aed6a26d
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '9877de53b6e3'
+down_revision = '12b6aed6a26d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_atletas_created_at_pk_id',
+            'atletas',
+            ['created_at', 'pk_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_atletas_created_at_pk_id',
+            table_name='atletas',
+            postgresql_concurrently=True,
+        )
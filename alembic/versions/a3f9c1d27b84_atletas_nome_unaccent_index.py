@@ -0,0 +1,49 @@
+"""atletas nome unaccent index
+
+Revision ID: a3f9c1d27b84
+Revises: 8d41b7e2c9a6
+Create Date: 2026-10-18 18:42:51.106233
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a3f9c1d27b84'
+down_revision = '8d41b7e2c9a6'
+branch_labels = None
+depends_on = None
+
+# `unaccent` é só STABLE; com o dicionário fixo o wrapper pode ser
+# IMMUTABLE e entrar no índice.
+F_UNACCENT = """
+CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+"""
+
+
+def upgrade() -> None:
+    op.execute(F_UNACCENT)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_atletas_nome_unaccent_trgm',
+            'atletas',
+            [sa.text('f_unaccent(nome) gin_trgm_ops')],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_atletas_nome_unaccent_trgm',
+            table_name='atletas',
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+    op.execute('DROP FUNCTION IF EXISTS f_unaccent(text)')
@@ -0,0 +1,386 @@
+"""Benchmark dos caminhos quentes da API de atletas.
+
+Popula o banco de `DB_URL` (já migrado, `make run-migrations`) com
+atletas de `benchmarks.seed` e mede
+latência (p50/p99) e vazão de cada cenário. A API roda no mesmo processo
+(ASGI, sem rede), ou em um servidor já no ar com `--url`. O resultado
+sai em JSON para comparar commits:
+
+    python -m benchmarks.api --atletas 10000 --saida atual.json
+    python -m benchmarks.api --saida novo.json --comparar atual.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from itertools import count
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+import httpx
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.seed import quantidade_positiva, semear
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.configs.database import engine
+
+TAMANHO_PAGINA = 100
+LOTE_SEED = 1000
+# Na ordem em que rodam; `montar_cenarios` monta um para cada nome.
+CENARIOS = (
+    'criar',
+    'listar_raso',
+    'listar_profundo',
+    'listar_filtro',
+    'listar_cursor',
+    'get_por_id',
+    'patch',
+    'deletar',
+)
+
+
+def percentil(valores: list[float], p: float) -> float:
+    """Percentil por interpolação linear; `valores` já ordenado."""
+    if not valores:
+        return 0.0
+    posicao = (len(valores) - 1) * p / 100
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(valores) - 1)
+    fracao = posicao - inferior
+    return valores[inferior] + (valores[superior] - valores[inferior]) * (
+        fracao
+    )
+
+
+@dataclass
+class Resultado:
+    requisicoes: int
+    erros: int
+    p50_ms: float
+    p99_ms: float
+    media_ms: float
+    rps: float
+
+    @classmethod
+    def de_latencias(
+        cls, latencias: list[float], erros: int, duracao: float
+    ) -> 'Resultado':
+        ordenadas = sorted(latencias)
+        return cls(
+            requisicoes=len(latencias),
+            erros=erros,
+            p50_ms=round(percentil(ordenadas, 50) * 1000, 3),
+            p99_ms=round(percentil(ordenadas, 99) * 1000, 3),
+            media_ms=round(sum(ordenadas) / max(len(ordenadas), 1) * 1000, 3),
+            rps=round(len(latencias) / duracao, 1) if duracao else 0.0,
+        )
+
+
+async def popular(qtd_atletas: int, qtd_relacoes: int, limpar: bool) -> None:
+    # Semente nova a cada execução: sem `--limpar`, repetir a mesma massa
+    # só geraria CPFs já cadastrados.
+    await semear(
+        qtd_atletas,
+        qtd_relacoes,
+        random.randrange(2**32),
+        LOTE_SEED,
+        limpar,
+    )
+
+
+@dataclass
+class Dados:
+    ids: list[str]
+    nomes: list[str]
+    categorias: list[str]
+    centros: list[str]
+    total: int
+
+
+async def carregar_dados() -> Dados:
+    async with AsyncSession(engine) as session:
+        linhas = (
+            await session.execute(
+                select(AtletaModel.id, AtletaModel.nome)
+                .order_by(AtletaModel.pk_id)
+                .limit(10_000)
+            )
+        ).all()
+        categorias = (
+            await session.execute(select(CategoriaModel.nome))
+        ).scalars()
+        centros = (
+            await session.execute(select(CentroTreinamentoModel.nome))
+        ).scalars()
+        total = (
+            await session.execute(text('SELECT count(*) FROM atletas'))
+        ).scalar_one()
+        return Dados(
+            ids=[str(id) for id, _ in linhas],
+            nomes=[nome for _, nome in linhas],
+            categorias=list(categorias),
+            centros=list(centros),
+            total=total,
+        )
+
+
+def payloads_atleta(dados: Dados) -> Iterator[dict[str, Any]]:
+    """Corpos de `POST /atletas/`, com CPFs sequenciais e nomes únicos."""
+    for cpf in count(90_000_000_000 + random.randrange(9_000_000_000)):
+        yield {
+            'nome': f'Atleta benchmark {cpf}',
+            'cpf': str(cpf),
+            'idade': random.randint(10, 80),
+            'peso': round(random.uniform(40, 120), 1),
+            'altura': round(random.uniform(1.4, 2.1), 2),
+            'sexo': random.choice('MF'),
+            'categoria': {'nome': random.choice(dados.categorias)},
+            'centro_treinamento': {'nome': random.choice(dados.centros)},
+        }
+
+
+Cenario = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+def montar_cenarios(dados: Dados) -> dict[str, Cenario]:
+    ultima_pagina = max(dados.total // TAMANHO_PAGINA, 1)
+    payloads = payloads_atleta(dados)
+    criados: list[str] = []
+
+    async def criar(client, _):
+        response = await client.post('/atletas/', json=next(payloads))
+        if response.is_success:
+            criados.append(response.json()['id'])
+        return response
+
+    def listar(**params):
+        async def cenario(client, _):
+            return await client.get(
+                '/atletas/', params={'size': TAMANHO_PAGINA, **params}
+            )
+
+        return cenario
+
+    async def listar_filtro(client, _):
+        prefixo = random.choice(dados.nomes)[:4]
+        return await client.get(
+            '/atletas/',
+            params={
+                'nome': prefixo,
+                'busca': 'prefixo',
+                'size': TAMANHO_PAGINA,
+            },
+        )
+
+    async def listar_cursor(client, _):
+        return await client.get(
+            '/atletas/cursor', params={'size': TAMANHO_PAGINA}
+        )
+
+    async def get_por_id(client, _):
+        return await client.get(f'/atletas/{random.choice(dados.ids)}')
+
+    async def patch(client, _):
+        return await client.patch(
+            f'/atletas/{random.choice(dados.ids)}',
+            json={'idade': random.randint(10, 80)},
+        )
+
+    async def deletar(client, i):
+        # Apaga só o que o cenário `criar` inseriu. Sem nada a apagar,
+        # cria e mede a criação: entre um `await` e outro, outro worker
+        # pode ter levado o id recém-criado.
+        if not criados:
+            return await criar(client, i)
+        return await client.delete(f'/atletas/{criados.pop()}')
+
+    return {
+        'criar': criar,
+        'listar_raso': listar(page=1),
+        'listar_profundo': listar(page=ultima_pagina),
+        'listar_filtro': listar_filtro,
+        'listar_cursor': listar_cursor,
+        'get_por_id': get_por_id,
+        'patch': patch,
+        'deletar': deletar,
+    }
+
+
+async def medir(
+    client: httpx.AsyncClient,
+    cenario: Cenario,
+    requisicoes: int,
+    concorrencia: int,
+) -> Resultado:
+    latencias: list[float] = []
+    erros = 0
+    proxima = count()
+
+    async def worker():
+        nonlocal erros
+        while (i := next(proxima)) < requisicoes:
+            inicio = perf_counter()
+            try:
+                response = await cenario(client, i)
+                ok = response.is_success
+            except httpx.HTTPError:
+                ok = False
+            latencias.append(perf_counter() - inicio)
+            erros += not ok
+
+    inicio = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concorrencia)))
+    return Resultado.de_latencias(latencias, erros, perf_counter() - inicio)
+
+
+def commit_atual() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparar(
+    atual: dict[str, Any], anterior: dict[str, Any], tolerancia: float
+) -> bool:
+    """Imprime a variação por cenário; falso se algum piorou além do limite."""
+    ok = True
+    print(f'\n{"cenário":<16} {"p50":>9} {"p99":>9} {"rps":>9}')
+    for nome, resultado in atual['cenarios'].items():
+        base = anterior['cenarios'].get(nome)
+        if not base:
+            continue
+        variacoes = {
+            chave: (resultado[chave] - base[chave]) / base[chave] * 100
+            if base[chave]
+            else 0.0
+            for chave in ('p50_ms', 'p99_ms', 'rps')
+        }
+        piorou = (
+            variacoes['p50_ms'] > tolerancia
+            or variacoes['p99_ms'] > tolerancia
+            or variacoes['rps'] < -tolerancia
+        )
+        ok &= not piorou
+        print(
+            f'{nome:<16} {variacoes["p50_ms"]:>+8.1f}% '
+            f'{variacoes["p99_ms"]:>+8.1f}% {variacoes["rps"]:>+8.1f}%'
+            + ('  <- regressão' if piorou else '')
+        )
+    return ok
+
+
+async def main(args: argparse.Namespace) -> int:
+    if args.atletas:
+        await popular(args.atletas, args.relacoes, args.limpar)
+    dados = await carregar_dados()
+    if not dados.ids:
+        print('Nenhum atleta no banco; rode com --atletas N.')
+        return 1
+
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=30)
+    else:
+        from workout_api.main import app  # noqa: PLC0415
+
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url='http://bench',
+            timeout=30,
+        )
+
+    cenarios = montar_cenarios(dados)
+    selecionados = args.cenarios or CENARIOS
+    resultados: dict[str, dict[str, Any]] = {}
+    print(
+        f'{"cenário":<16} {"req":>6} {"erros":>6} {"p50 ms":>9} '
+        f'{"p99 ms":>9} {"rps":>9}'
+    )
+    async with client:
+        for nome in selecionados:
+            resultado = await medir(
+                client, cenarios[nome], args.requisicoes, args.concorrencia
+            )
+            resultados[nome] = asdict(resultado)
+            print(
+                f'{nome:<16} {resultado.requisicoes:>6} '
+                f'{resultado.erros:>6} {resultado.p50_ms:>9.2f} '
+                f'{resultado.p99_ms:>9.2f} {resultado.rps:>9.1f}'
+            )
+
+    saida = {
+        'commit': commit_atual(),
+        'data': datetime.now(timezone.utc).isoformat(),
+        'parametros': {
+            'atletas': dados.total,
+            'requisicoes': args.requisicoes,
+            'concorrencia': args.concorrencia,
+            'url': args.url,
+        },
+        'cenarios': resultados,
+    }
+    if args.saida:
+        Path(args.saida).write_text(
+            json.dumps(saida, indent=2), encoding='utf-8'
+        )
+    else:
+        print(json.dumps(saida))
+
+    await engine.dispose()
+    if args.comparar:
+        anterior = json.loads(Path(args.comparar).read_text(encoding='utf-8'))
+        return 0 if comparar(saida, anterior, args.tolerancia) else 2
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--atletas',
+        type=int,
+        default=0,
+        help='Atletas a inserir antes de medir (0 usa o que já existe)',
+    )
+    parser.add_argument('--relacoes', type=quantidade_positiva, default=20)
+    parser.add_argument(
+        '--limpar',
+        action='store_true',
+        help='TRUNCATE nas tabelas antes de popular',
+    )
+    parser.add_argument('--requisicoes', type=int, default=500)
+    parser.add_argument('--concorrencia', type=int, default=10)
+    parser.add_argument('--url', help='Servidor no ar; sem ele roda via ASGI')
+    parser.add_argument(
+        '--cenarios',
+        nargs='*',
+        choices=CENARIOS,
+        metavar='CENARIO',
+        help=f'Cenários a medir (padrão: todos): {", ".join(CENARIOS)}',
+    )
+    parser.add_argument('--saida', help='Arquivo JSON com os resultados')
+    parser.add_argument('--comparar', help='JSON de uma execução anterior')
+    parser.add_argument(
+        '--tolerancia',
+        type=float,
+        default=10.0,
+        help='Piora máxima, em %%, antes de acusar regressão',
+    )
+    return parser
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main(_parser().parse_args())))
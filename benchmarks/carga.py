@@ -0,0 +1,301 @@
+"""Gerador de carga com o tráfego típico da API de atletas.
+
+Repete uma mistura configurável de operações (por padrão 70% listagens e
+buscas, 20% consultas por id e 10% escritas) em níveis crescentes de
+concorrência, contra um servidor no ar (`--url`) ou a API no mesmo
+processo. Para cada nível reporta p50/p95/p99, taxa de erro e a saturação
+do pool de conexões lida de `/metrics`:
+
+    python -m benchmarks.carga --niveis 1 10 50 100 --duracao 30
+    python -m benchmarks.carga --url http://127.0.0.1:8000 --mix 80 15 5
+
+Os payloads de escrita e a massa do banco (`--atletas N`) vêm de
+`benchmarks.api`.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Awaitable, Callable
+
+import httpx
+
+from benchmarks.api import (
+    TAMANHO_PAGINA,
+    Dados,
+    carregar_dados,
+    commit_atual,
+    payloads_atleta,
+    percentil,
+    popular,
+)
+from benchmarks.seed import quantidade_positiva
+from workout_api.configs.database import engine
+
+INTERVALO_AMOSTRA_POOL = 0.25
+SATURACAO_POOL = re.compile(
+    r'^workout_db_pool_saturation\{[^}]*\} (\S+)$', re.MULTILINE
+)
+
+Operacao = Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+
+
+def montar_operacoes(dados: Dados) -> dict[str, list[Operacao]]:
+    """Operações agrupadas por classe de tráfego: leitura, id e escrita."""
+    ultima_pagina = max(dados.total // TAMANHO_PAGINA, 1)
+    payloads = payloads_atleta(dados)
+    criados: list[str] = []
+
+    async def listar(client):
+        return await client.get(
+            '/atletas/',
+            params={
+                'page': random.randint(1, ultima_pagina),
+                'size': TAMANHO_PAGINA,
+            },
+        )
+
+    async def buscar(client):
+        return await client.get(
+            '/atletas/',
+            params={
+                'nome': random.choice(dados.nomes)[:4],
+                'busca': 'prefixo',
+                'size': TAMANHO_PAGINA,
+            },
+        )
+
+    async def cursor(client):
+        return await client.get(
+            '/atletas/cursor', params={'size': TAMANHO_PAGINA}
+        )
+
+    async def por_id(client):
+        return await client.get(f'/atletas/{random.choice(dados.ids)}')
+
+    async def criar(client):
+        response = await client.post('/atletas/', json=next(payloads))
+        if response.is_success:
+            criados.append(response.json()['id'])
+        return response
+
+    async def atualizar(client):
+        return await client.patch(
+            f'/atletas/{random.choice(dados.ids)}',
+            json={'idade': random.randint(10, 80)},
+        )
+
+    async def remover(client):
+        # Só remove o que a própria carga criou.
+        if not criados:
+            return await criar(client)
+        return await client.delete(f'/atletas/{criados.pop()}')
+
+    return {
+        'leitura': [listar, buscar, cursor],
+        'id': [por_id],
+        'escrita': [criar, criar, atualizar, remover],
+    }
+
+
+@dataclass
+class ResultadoNivel:
+    concorrencia: int
+    requisicoes: int = 0
+    erros: int = 0
+    rps: float = 0.0
+    taxa_erro: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    por_classe: dict[str, dict[str, float]] = field(default_factory=dict)
+    pool_media: float = 0.0
+    pool_max: float = 0.0
+
+
+async def _saturacao_pool(client: httpx.AsyncClient) -> float | None:
+    try:
+        response = await client.get('/metrics')
+    except httpx.HTTPError:
+        return None
+    valores = SATURACAO_POOL.findall(response.text)
+    return max(map(float, valores)) if valores else None
+
+
+def _ms(valores: list[float], p: float) -> float:
+    return round(percentil(valores, p) * 1000, 3)
+
+
+async def rodar_nivel(
+    client: httpx.AsyncClient,
+    operacoes: dict[str, list[Operacao]],
+    mix: dict[str, int],
+    concorrencia: int,
+    duracao: float,
+) -> ResultadoNivel:
+    classes = list(mix)
+    pesos = [mix[classe] for classe in classes]
+    latencias: dict[str, list[float]] = {classe: [] for classe in classes}
+    erros: dict[str, int] = dict.fromkeys(classes, 0)
+    amostras_pool: list[float] = []
+    fim = perf_counter() + duracao
+
+    async def worker():
+        while perf_counter() < fim:
+            classe = random.choices(classes, pesos)[0]
+            operacao = random.choice(operacoes[classe])
+            inicio = perf_counter()
+            try:
+                ok = (await operacao(client)).is_success
+            except httpx.HTTPError:
+                ok = False
+            latencias[classe].append(perf_counter() - inicio)
+            erros[classe] += not ok
+
+    async def amostrar_pool():
+        while perf_counter() < fim:
+            saturacao = await _saturacao_pool(client)
+            if saturacao is not None:
+                amostras_pool.append(saturacao)
+            await asyncio.sleep(INTERVALO_AMOSTRA_POOL)
+
+    inicio = perf_counter()
+    await asyncio.gather(
+        amostrar_pool(), *(worker() for _ in range(concorrencia))
+    )
+    decorrido = perf_counter() - inicio
+
+    todas = sorted(t for valores in latencias.values() for t in valores)
+    total_erros = sum(erros.values())
+    resultado = ResultadoNivel(
+        concorrencia=concorrencia,
+        requisicoes=len(todas),
+        erros=total_erros,
+        rps=round(len(todas) / decorrido, 1),
+        taxa_erro=round(total_erros / max(len(todas), 1) * 100, 2),
+        p50_ms=_ms(todas, 50),
+        p95_ms=_ms(todas, 95),
+        p99_ms=_ms(todas, 99),
+        pool_media=round(sum(amostras_pool) / max(len(amostras_pool), 1), 3),
+        pool_max=round(max(amostras_pool, default=0.0), 3),
+    )
+    for classe, valores in latencias.items():
+        valores.sort()
+        resultado.por_classe[classe] = {
+            'requisicoes': len(valores),
+            'erros': erros[classe],
+            'p50_ms': _ms(valores, 50),
+            'p99_ms': _ms(valores, 99),
+        }
+    return resultado
+
+
+def _imprimir(resultado: ResultadoNivel) -> None:
+    print(
+        f'{resultado.concorrencia:>5} {resultado.requisicoes:>7} '
+        f'{resultado.rps:>8.1f} {resultado.taxa_erro:>6.2f}% '
+        f'{resultado.p50_ms:>9.2f} {resultado.p95_ms:>9.2f} '
+        f'{resultado.p99_ms:>9.2f} {resultado.pool_media:>6.2f} '
+        f'{resultado.pool_max:>6.2f}'
+    )
+
+
+async def main(args: argparse.Namespace) -> int:
+    if args.atletas:
+        await popular(args.atletas, args.relacoes, args.limpar)
+    dados = await carregar_dados()
+    if not dados.ids:
+        print('Nenhum atleta no banco; rode com --atletas N.')
+        return 1
+
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=60)
+    else:
+        from workout_api.main import app  # noqa: PLC0415
+
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url='http://carga',
+            timeout=60,
+        )
+
+    mix = dict(zip(('leitura', 'id', 'escrita'), args.mix))
+    operacoes = montar_operacoes(dados)
+    niveis: list[ResultadoNivel] = []
+    print(
+        f'{"conc":>5} {"req":>7} {"rps":>8} {"erros":>7} {"p50 ms":>9} '
+        f'{"p95 ms":>9} {"p99 ms":>9} {"pool":>6} {"máx":>6}'
+    )
+    async with client:
+        for concorrencia in args.niveis:
+            resultado = await rodar_nivel(
+                client, operacoes, mix, concorrencia, args.duracao
+            )
+            niveis.append(resultado)
+            _imprimir(resultado)
+
+    saida = {
+        'commit': commit_atual(),
+        'data': datetime.now(timezone.utc).isoformat(),
+        'parametros': {
+            'atletas': dados.total,
+            'mix': mix,
+            'duracao': args.duracao,
+            'url': args.url,
+        },
+        'niveis': [asdict(nivel) for nivel in niveis],
+    }
+    if args.saida:
+        Path(args.saida).write_text(
+            json.dumps(saida, indent=2), encoding='utf-8'
+        )
+
+    await engine.dispose()
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--niveis',
+        type=int,
+        nargs='+',
+        default=[1, 5, 10, 25, 50],
+        help='Níveis de concorrência, em ordem',
+    )
+    parser.add_argument(
+        '--duracao',
+        type=float,
+        default=10.0,
+        help='Segundos de carga em cada nível',
+    )
+    parser.add_argument(
+        '--mix',
+        type=int,
+        nargs=3,
+        default=[70, 20, 10],
+        metavar=('LEITURA', 'ID', 'ESCRITA'),
+        help='Pesos de listagens/buscas, consultas por id e escritas',
+    )
+    parser.add_argument(
+        '--atletas',
+        type=int,
+        default=0,
+        help='Atletas a inserir antes da carga (0 usa o que já existe)',
+    )
+    parser.add_argument('--relacoes', type=quantidade_positiva, default=20)
+    parser.add_argument('--limpar', action='store_true')
+    parser.add_argument('--url', help='Servidor no ar; sem ele roda via ASGI')
+    parser.add_argument('--saida', help='Arquivo JSON com os resultados')
+    return parser
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main(_parser().parse_args())))
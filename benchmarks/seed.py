@@ -0,0 +1,288 @@
+"""Gera massas grandes de categorias, centros e atletas para testes de carga.
+
+Ao contrário das factories de `tests/factory/`, que montam um objeto por
+vez com Faker e ORM, os atletas saem em lotes gerados direto como texto e
+entram no banco por `COPY`. Os CPFs são válidos (dígitos verificadores
+corretos) e únicos, e a mesma `--semente` (com os mesmos `--atletas`,
+`--relacoes` e `--lote`) gera sempre a mesma massa:
+
+    python -m benchmarks.seed --atletas 1000000 --limpar
+    python -m benchmarks.seed --atletas 1e7 --semente 7 --lote 200000
+
+O banco de `DB_URL` precisa estar migrado (`make run-migrations`).
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import Iterator
+from uuid import UUID
+
+import psycopg
+from faker import Faker
+from sqlalchemy.engine import make_url
+
+from workout_api.configs.settings import settings
+
+ESPACO_CPF = 10**9
+NOMES_POR_POOL = 2000
+# Datas fixas para que a mesma semente gere a mesma massa.
+REFERENCIA = datetime(2024, 1, 1, tzinfo=timezone.utc)
+JANELA_CRIACAO = timedelta(days=365)
+# Resto da divisão por 11 abaixo do qual o dígito verificador é zero.
+RESTO_DIGITO_ZERO = 2
+
+COLUNAS_ATLETA = (
+    'id',
+    'nome',
+    'cpf',
+    'idade',
+    'peso',
+    'altura',
+    'sexo',
+    'created_at',
+    'categoria_id',
+    'centro_treinamento_id',
+)
+
+
+def digitos_cpf(base: int) -> str:
+    """Completa os 9 dígitos de `base` com os dois verificadores."""
+    digitos = [int(c) for c in f'{base:09d}']
+    for tamanho in (9, 10):
+        soma = sum(
+            d * peso for d, peso in zip(digitos, range(tamanho + 1, 1, -1))
+        )
+        resto = soma % 11
+        digitos.append(0 if resto < RESTO_DIGITO_ZERO else 11 - resto)
+    return ''.join(map(str, digitos))
+
+
+def cpfs_unicos(rng: random.Random) -> Iterator[str]:
+    """CPFs distintos, na ordem de uma permutação afim de 0..10^9.
+
+    `i -> (a * i + c) mod 10^9` é uma bijeção quando `a` é primo com
+    10^9, então nenhuma base se repete até esgotar o espaço. Bases com
+    todos os dígitos iguais (000.000.000-00, 111...) são inválidas e
+    ficam de fora.
+    """
+    a = rng.randrange(ESPACO_CPF) | 1
+    while a % 5 == 0:
+        a = rng.randrange(ESPACO_CPF) | 1
+    c = rng.randrange(ESPACO_CPF)
+    for i in range(ESPACO_CPF):
+        base = (a * i + c) % ESPACO_CPF
+        if base % 111_111_111 == 0:
+            continue
+        yield digitos_cpf(base)
+
+
+def _conninfo() -> str:
+    url = make_url(settings.DB_URL).set(drivername='postgresql')
+    return url.render_as_string(hide_password=False)
+
+
+async def _popular_relacoes(
+    conn: psycopg.AsyncConnection, fake: Faker, qtd: int
+) -> tuple[list[int], list[int]]:
+    categorias = [f'cat_{i}' for i in range(qtd)]
+    centros = [
+        (f'ct_{i}', fake.street_address()[:60], fake.name()[:30])
+        for i in range(qtd)
+    ]
+    async with conn.cursor() as cur:
+        await cur.executemany(
+            'INSERT INTO categorias (id, nome) VALUES (gen_random_uuid(), %s) '
+            'ON CONFLICT (nome) DO NOTHING',
+            [(nome,) for nome in categorias],
+        )
+        await cur.executemany(
+            'INSERT INTO centros_treinamento '
+            '(id, nome, endereco, proprietario) '
+            'VALUES (gen_random_uuid(), %s, %s, %s) '
+            'ON CONFLICT (nome) DO NOTHING',
+            centros,
+        )
+        await cur.execute(
+            'SELECT pk_id FROM categorias WHERE nome = ANY(%s) ORDER BY pk_id',
+            (categorias,),
+        )
+        categoria_ids = [pk_id for (pk_id,) in await cur.fetchall()]
+        await cur.execute(
+            'SELECT pk_id FROM centros_treinamento WHERE nome = ANY(%s) '
+            'ORDER BY pk_id',
+            ([nome for nome, _, _ in centros],),
+        )
+        centro_ids = [pk_id for (pk_id,) in await cur.fetchall()]
+    return categoria_ids, centro_ids
+
+
+class GeradorAtletas:
+    """Gera lotes de atletas no formato texto do `COPY`."""
+
+    def __init__(
+        self,
+        semente: int,
+        categoria_ids: list[int],
+        centro_ids: list[int],
+        fake: Faker,
+    ):
+        self.rng = random.Random(semente)
+        self.cpfs = cpfs_unicos(self.rng)
+        self.primeiros = [fake.first_name() for _ in range(NOMES_POR_POOL)]
+        self.sobrenomes = [fake.last_name() for _ in range(NOMES_POR_POOL)]
+        self.categoria_ids = categoria_ids
+        self.centro_ids = centro_ids
+
+    def lote(self, qtd: int) -> str:
+        rng = self.rng
+        janela = JANELA_CRIACAO.total_seconds()
+        colunas = (
+            (
+                str(UUID(int=rng.getrandbits(128), version=4))
+                for _ in range(qtd)
+            ),
+            (
+                f'{p} {s}'[:50]
+                for p, s in zip(
+                    rng.choices(self.primeiros, k=qtd),
+                    rng.choices(self.sobrenomes, k=qtd),
+                )
+            ),
+            (next(self.cpfs) for _ in range(qtd)),
+            map(str, rng.choices(range(10, 81), k=qtd)),
+            (f'{40 + 80 * rng.random():.1f}' for _ in range(qtd)),
+            (f'{1.4 + 0.7 * rng.random():.2f}' for _ in range(qtd)),
+            rng.choices('MF', k=qtd),
+            (
+                (
+                    REFERENCIA - timedelta(seconds=janela * rng.random())
+                ).isoformat()
+                for _ in range(qtd)
+            ),
+            map(str, rng.choices(self.categoria_ids, k=qtd)),
+            map(str, rng.choices(self.centro_ids, k=qtd)),
+        )
+        return ''.join('\t'.join(linha) + '\n' for linha in zip(*colunas))
+
+
+async def semear(
+    qtd_atletas: int,
+    qtd_relacoes: int,
+    semente: int,
+    tamanho_lote: int,
+    limpar: bool,
+) -> None:
+    fake = Faker('pt_BR')
+    fake.seed_instance(semente)
+
+    async with await psycopg.AsyncConnection.connect(_conninfo()) as conn:
+        if limpar:
+            await conn.execute(
+                'TRUNCATE atletas, categorias, centros_treinamento '
+                'RESTART IDENTITY'
+            )
+        gerador = GeradorAtletas(
+            semente, *await _popular_relacoes(conn, fake, qtd_relacoes), fake
+        )
+        # Sem TRUNCATE pode haver CPFs já cadastrados: o lote passa por
+        # uma tabela temporária e entra com ON CONFLICT DO NOTHING.
+        destino = 'atletas'
+        if not limpar:
+            destino = 'atletas_seed'
+            await conn.execute(
+                'CREATE TEMP TABLE atletas_seed '
+                '(LIKE atletas INCLUDING DEFAULTS)'
+            )
+        await conn.commit()
+
+        inicio = perf_counter()
+        gerados = 0
+        inseridos = 0
+        while gerados < qtd_atletas:
+            qtd = min(tamanho_lote, qtd_atletas - gerados)
+            dados = gerador.lote(qtd)
+            async with conn.cursor() as cur:
+                async with cur.copy(
+                    f'COPY {destino} ({", ".join(COLUNAS_ATLETA)}) FROM STDIN'
+                ) as copy:
+                    await copy.write(dados)
+                if limpar:
+                    inseridos += qtd
+                else:
+                    # O ON CONFLICT pode pular linhas: conta o que entrou.
+                    await cur.execute(
+                        f'INSERT INTO atletas ({", ".join(COLUNAS_ATLETA)}) '
+                        f'SELECT {", ".join(COLUNAS_ATLETA)} '
+                        'FROM atletas_seed ON CONFLICT DO NOTHING'
+                    )
+                    inseridos += cur.rowcount
+                    await cur.execute('TRUNCATE atletas_seed')
+            await conn.commit()
+            gerados += qtd
+            decorrido = perf_counter() - inicio
+            print(
+                f'{gerados:>10} gerados  {inseridos:>10} inseridos  '
+                f'{decorrido:8.1f}s  {gerados / decorrido:10.0f}/s',
+                file=sys.stderr,
+            )
+
+        await conn.execute('ANALYZE atletas, categorias, centros_treinamento')
+        await conn.commit()
+    print(
+        f'{inseridos} atletas inseridos de {gerados} gerados', file=sys.stderr
+    )
+
+
+def _quantidade(valor: str) -> int:
+    # Aceita notação científica, como em `--atletas 1e6`.
+    quantidade = float(valor)
+    if not math.isfinite(quantidade) or quantidade < 0:
+        raise argparse.ArgumentTypeError(f'quantidade inválida: {valor}')
+    return int(quantidade)
+
+
+def quantidade_positiva(valor: str) -> int:
+    # `--lote 0` nunca avançaria, e atletas sem categorias e centros não
+    # têm a quem apontar.
+    quantidade = _quantidade(valor)
+    if quantidade < 1:
+        raise argparse.ArgumentTypeError(f'precisa ser ao menos 1: {valor}')
+    return quantidade
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--atletas', type=_quantidade, default=10_000)
+    parser.add_argument('--relacoes', type=quantidade_positiva, default=50)
+    parser.add_argument(
+        '--semente',
+        type=int,
+        default=42,
+        help='Mesma semente e tamanhos, mesma massa de dados',
+    )
+    parser.add_argument(
+        '--lote',
+        type=quantidade_positiva,
+        default=100_000,
+        help='Atletas por COPY/commit',
+    )
+    parser.add_argument(
+        '--limpar',
+        action='store_true',
+        help='TRUNCATE nas tabelas antes de semear',
+    )
+    return parser
+
+
+if __name__ == '__main__':
+    args = _parser().parse_args()
+    asyncio.run(
+        semear(
+            args.atletas, args.relacoes, args.semente, args.lote, args.limpar
+        )
+    )
@@ -0,0 +1,118 @@
+"""Compara a serialização padrão do FastAPI com `RotaJsonRapida`.
+
+Monta duas apps idênticas, uma com `APIRoute` e outra com
+`RotaJsonRapida`. Cada app devolve uma página de 100
+`AtletaListagemOut` e um `AtletaOut`, e o script mede o tempo por
+requisição chamando a app ASGI direto, sem rede e sem banco:
+
+    python -m benchmarks.serializacao --repeticoes 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+from datetime import datetime, timezone
+from time import perf_counter
+from uuid import uuid4
+
+import httpx
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from fastapi_pagination import Params
+
+from workout_api.atleta.schemas import AtletaListagemOut, AtletaOut
+from workout_api.contrib.pagination import Pagina
+from workout_api.contrib.routing import RotaJsonRapida
+
+
+def _pagina(tamanho: int) -> Pagina[AtletaListagemOut]:
+    itens = [
+        {
+            'id': uuid4(),
+            'created_at': datetime.now(timezone.utc),
+            'nome': f'Atleta {i}',
+            'cpf': f'{i:011d}',
+            'categoria': 'Scale',
+            'centro_treinamento': 'CT King',
+        }
+        for i in range(tamanho)
+    ]
+    return Pagina[AtletaListagemOut].create(
+        itens, Params(page=1, size=tamanho), total=10_000
+    )
+
+
+def _atleta() -> AtletaOut:
+    return AtletaOut(
+        id=uuid4(),
+        created_at=datetime.now(timezone.utc),
+        nome='Joana',
+        cpf='12345678900',
+        idade=30,
+        peso=60.5,
+        altura=1.65,
+        sexo='F',
+        categoria={'nome': 'Scale'},
+        centro_treinamento={'nome': 'CT King'},
+    )
+
+
+def _app(route_class: type[APIRoute], tamanho: int) -> FastAPI:
+    pagina = _pagina(tamanho)
+    atleta = _atleta()
+    router = APIRouter(route_class=route_class)
+
+    @router.get('/pagina', response_model=Pagina[AtletaListagemOut])
+    async def get_pagina():
+        return pagina
+
+    @router.get('/atleta', response_model=AtletaOut)
+    async def get_atleta():
+        return atleta
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def _medir(app: FastAPI, caminho: str, repeticoes: int) -> list[float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://bench'
+    ) as client:
+        for _ in range(min(100, repeticoes)):
+            await client.get(caminho)
+        tempos = []
+        for _ in range(repeticoes):
+            inicio = perf_counter()
+            await client.get(caminho)
+            tempos.append(perf_counter() - inicio)
+    return tempos
+
+
+async def main(repeticoes: int, tamanho: int) -> None:
+    apps = {
+        'APIRoute': _app(APIRoute, tamanho),
+        'RotaJsonRapida': _app(RotaJsonRapida, tamanho),
+    }
+    print(f'{"rota":<10} {"classe":<16} {"mediana (µs)":>13} {"p95 (µs)":>10}')
+    for caminho in ('/pagina', '/atleta'):
+        medianas = {}
+        for nome, app in apps.items():
+            tempos = sorted(await _medir(app, caminho, repeticoes))
+            medianas[nome] = statistics.median(tempos)
+            p95 = tempos[int(len(tempos) * 0.95) - 1]
+            print(
+                f'{caminho:<10} {nome:<16} '
+                f'{medianas[nome] * 1e6:>13.1f} {p95 * 1e6:>10.1f}'
+            )
+        ganho = medianas['APIRoute'] / medianas['RotaJsonRapida']
+        print(f'{caminho:<10} {"ganho":<16} {ganho:>12.2f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeticoes', type=int, default=2000)
+    parser.add_argument('--tamanho', type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeticoes, args.tamanho))
@@ -1,4 +1,5 @@
-from typing import AsyncGenerator
+from contextlib import contextmanager
+from typing import AsyncGenerator, Callable, ContextManager
 
 import httpx
 import pytest
@@ -14,7 +15,10 @@ from testcontainers.postgres import PostgresContainer
 from tests.factory.atleta import AtletaModelFactory
 from tests.factory.categoria import CategoriaModelFactory
 from tests.factory.centro_treinamento import CentroTreinamentoModelFactory
-from workout_api.configs.database import get_session
+from tests.utils import contar_queries
+from workout_api.configs.cache import get_cache
+from workout_api.configs.database import get_read_session, get_session
+from workout_api.contrib.cache import BackendMemoria, Cache, limpar_caches
 from workout_api.contrib.models import BaseModel
 from workout_api.main import app
 
@@ -48,7 +52,11 @@ async def client(
     async def get_session_override():
         yield session
 
+    cache = Cache(BackendMemoria())
     app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_read_session] = get_session_override
+    app.dependency_overrides[get_cache] = lambda: cache
+    limpar_caches()
     transport = httpx.ASGITransport(app=app)
 
     async with httpx.AsyncClient(
@@ -67,3 +75,26 @@ def bind_factory_session(session: AsyncSession):
     ]:
         setattr(factory._meta, 'sqlalchemy_session', session)
         setattr(factory._meta, 'sqlalchemy_session_persistence', 'commit')
+
+
+@pytest.fixture
+def orcamento_queries(
+    session: AsyncSession,
+) -> Callable[[int], ContextManager[list[str]]]:
+    """Falha o teste se o bloco enviar mais statements que o orçamento.
+
+    with orcamento_queries(2):
+        await client.get('/atletas/')
+    """
+
+    @contextmanager
+    def orcamento(maximo: int):
+        with contar_queries(session.bind) as statements:
+            yield statements
+        if len(statements) > maximo:
+            pytest.fail(
+                f'{len(statements)} statements para um orçamento de '
+                f'{maximo}:\n' + '\n'.join(statements)
+            )
+
+    return orcamento
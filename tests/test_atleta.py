@@ -1,5 +1,11 @@
+import base64
+import csv
+import io
+import json
 import random
+from datetime import datetime
 from http import HTTPStatus
+from math import ceil
 from typing import Any, Dict, List, cast
 from uuid import UUID, uuid4
 
@@ -8,14 +14,23 @@ import httpx
 # import ipdb
 import pytest
 from fastapi.exceptions import HTTPException
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tests.factory.atleta import AtletaModelFactory, AtletaSchemaFactory
 from tests.factory.categoria import CategoriaModelFactory
 from tests.factory.centro_treinamento import CentroTreinamentoModelFactory
-from tests.utils import gerar_casos_paginacao
-from workout_api.atleta.schemas import get_filtro_query
-from workout_api.contrib.dependencies import AtletaFiltroQuery
+from tests.utils import contar_queries, gerar_casos_paginacao
+from workout_api.atleta import export
+from workout_api.atleta.listagem import filtrar, ordenar, select_listagem
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.schemas import (
+    AtletaFiltroSchema,
+    AtletaOut,
+    get_filtro_query,
+)
+from workout_api.contrib.campos import modelo_parcial
+from workout_api.contrib.search import escolher_estrategia, filtro_busca
 
 
 @pytest.mark.asyncio
@@ -40,6 +55,35 @@ async def test_post_atleta_success(
     assert UUID(data['id'])
 
 
+@pytest.mark.asyncio
+async def test_post_atleta_retorna_linha_persistida(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    categoria = CategoriaModelFactory.build()
+    centro = CentroTreinamentoModelFactory.build()
+    session.add_all([categoria, centro])
+    await session.commit()
+    atleta_payload = AtletaSchemaFactory(
+        categoria={'nome': categoria.nome},
+        centro_treinamento={'nome': centro.nome},
+    ).model_dump()
+
+    response = await client.post('/atletas/', json=atleta_payload)
+    data = response.json()
+
+    assert response.status_code == HTTPStatus.CREATED
+    atleta = (
+        await session.execute(
+            select(AtletaModel).filter_by(id=UUID(data['id']))
+        )
+    ).scalar_one()
+    assert datetime.fromisoformat(data['created_at']) == atleta.created_at
+    assert atleta.categoria_id == categoria.pk_id
+    assert atleta.centro_treinamento_id == centro.pk_id
+    assert data['categoria'] == {'nome': categoria.nome}
+    assert data['centro_treinamento'] == {'nome': centro.nome}
+
+
 @pytest.mark.asyncio
 async def test_post_atleta_categoria_not_found(
     client: httpx.AsyncClient, session: AsyncSession
@@ -115,6 +159,183 @@ async def test_post_atleta_ja_existente(
     )
 
 
+@pytest.mark.asyncio
+async def test_post_atletas_bulk_json_reporta_erros_por_linha(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    categoria = CategoriaModelFactory.build()
+    centro = CentroTreinamentoModelFactory.build()
+    session.add_all([categoria, centro])
+    existente = AtletaModelFactory.create()
+    await session.commit()
+
+    def payload(**kwargs):
+        return AtletaSchemaFactory.build(
+            categoria__nome=categoria.nome,
+            centro_treinamento__nome=centro.nome,
+            **kwargs,
+        ).model_dump()
+
+    valido = payload()
+    atletas = [
+        valido,
+        payload(cpf=existente.cpf),
+        {**payload(), 'categoria': {'nome': 'inexiste'}},
+        {**payload(), 'idade': 'abc'},
+        payload(cpf=valido['cpf']),
+        payload(),
+    ]
+
+    response = await client.post('/atletas/bulk', json=atletas)
+
+    assert response.status_code == HTTPStatus.CREATED
+    data = response.json()
+    assert data['total'] == len(atletas)
+    assert data['inseridos'] == 2  # noqa: PLR2004
+    erros = {erro['linha']: erro['detalhe'] for erro in data['erros']}
+    assert sorted(erros) == [2, 3, 4, 5]
+    assert 'Já existe um atleta cadastrado' in erros[2]
+    assert 'não foi encontrada' in erros[3]
+    assert erros[4][0]['loc'] == ['idade']
+    assert 'repetido' in erros[5]
+
+
+@pytest.mark.asyncio
+async def test_post_atletas_bulk_csv_e_ndjson(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    categoria = CategoriaModelFactory.build()
+    centro = CentroTreinamentoModelFactory.build()
+    session.add_all([categoria, centro])
+    await session.commit()
+    atletas = [
+        AtletaSchemaFactory.build(
+            categoria__nome=categoria.nome,
+            centro_treinamento__nome=centro.nome,
+        ).model_dump()
+        for _ in range(4)
+    ]
+
+    linhas_csv = [
+        'nome,cpf,idade,peso,altura,sexo,categoria,centro_treinamento'
+    ]
+    linhas_csv.extend(
+        f'{a["nome"]},{a["cpf"]},{a["idade"]},{a["peso"]},{a["altura"]},'
+        f'{a["sexo"]},{categoria.nome},{centro.nome}'
+        for a in atletas[:2]
+    )
+    response = await client.post(
+        '/atletas/bulk',
+        content='\n'.join(linhas_csv),
+        headers={'content-type': 'text/csv'},
+    )
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json()['inseridos'] == 2  # noqa: PLR2004
+
+    ndjson = '\n'.join([*(json.dumps(a) for a in atletas[2:]), '{quebrado'])
+    response = await client.post(
+        '/atletas/bulk',
+        content=ndjson,
+        headers={'content-type': 'application/x-ndjson'},
+    )
+    data = response.json()
+    assert response.status_code == HTTPStatus.CREATED
+    assert data['inseridos'] == 2  # noqa: PLR2004
+    assert data['erros'][0]['linha'] == 3  # noqa: PLR2004
+    assert 'JSON inválido' in data['erros'][0]['detalhe']
+
+    response = await client.get('/atletas/', params={'size': 10})
+    assert response.json()['total'] == len(atletas)
+
+
+@pytest.mark.asyncio
+async def test_post_atletas_bulk_recusa_do_banco_nao_aborta_o_lote(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    categoria = CategoriaModelFactory.build()
+    centro = CentroTreinamentoModelFactory.build()
+    session.add_all([categoria, centro])
+    await session.commit()
+    atletas = [
+        AtletaSchemaFactory.build(
+            categoria__nome=categoria.nome,
+            centro_treinamento__nome=centro.nome,
+        ).model_dump()
+        for _ in range(3)
+    ]
+    # Passa pelo schema, mas o Postgres não aceita NUL em texto.
+    atletas[1]['nome'] = 'Ana\u0000Maria'
+    atletas.append({**atletas[2], 'cpf': '1' * 10 + '2', 'idade': 2**31})
+
+    response = await client.post('/atletas/bulk', json=atletas)
+
+    assert response.status_code == HTTPStatus.CREATED
+    data = response.json()
+    assert data['inseridos'] == 2  # noqa: PLR2004
+    erros = {erro['linha']: erro['detalhe'] for erro in data['erros']}
+    assert sorted(erros) == [2, 4]
+    assert 'O banco recusou o registro' in erros[2]
+    assert erros[4][0]['loc'] == ['idade']
+
+
+@pytest.mark.asyncio
+async def test_post_atletas_bulk_csv_com_quebra_de_linha_entre_aspas(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    categoria = CategoriaModelFactory.build()
+    centro = CentroTreinamentoModelFactory.build()
+    session.add_all([categoria, centro])
+    await session.commit()
+    atleta = AtletaSchemaFactory.build()
+    corpo = (
+        'nome,cpf,idade,peso,altura,sexo,categoria,centro_treinamento\n'
+        f'"Silva, Ana\nMaria",{atleta.cpf},{atleta.idade},{atleta.peso},'
+        f'{atleta.altura},{atleta.sexo},{categoria.nome},{centro.nome}\n'
+        '\n'
+    )
+
+    response = await client.post(
+        '/atletas/bulk',
+        content=corpo.encode(),
+        headers={'content-type': 'text/csv'},
+    )
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json() == {'total': 1, 'inseridos': 1, 'erros': []}
+    nome = await session.scalar(
+        select(AtletaModel.nome).where(AtletaModel.cpf == atleta.cpf)
+    )
+    assert nome == 'Silva, Ana\nMaria'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'content_type', ['text/csv', 'application/x-ndjson', 'application/json']
+)
+async def test_post_atletas_bulk_corpo_fora_de_utf8(
+    client: httpx.AsyncClient, content_type
+):
+    response = await client.post(
+        '/atletas/bulk',
+        content='[{"nome": "João"}]\n'.encode('latin-1'),
+        headers={'content-type': content_type},
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert 'UTF-8' in response.json()['detail']
+
+
+@pytest.mark.asyncio
+async def test_post_atletas_bulk_content_type_nao_suportado(
+    client: httpx.AsyncClient,
+):
+    response = await client.post(
+        '/atletas/bulk',
+        content='<atletas/>',
+        headers={'content-type': 'application/xml'},
+    )
+    assert response.status_code == HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ('qtd', 'page', 'total_pages', 'size'), gerar_casos_paginacao(55)
@@ -184,6 +405,96 @@ async def test_get_atletas_by_cpf_success(
     assert data['items'][0]['cpf'] == cpf_atleta
 
 
+@pytest.mark.asyncio
+async def test_get_atletas_cursor_percorre_todas_as_paginas(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    qtd = 25
+    size = 10
+    atletas = AtletaModelFactory.create_batch(qtd)
+    await session.commit()
+
+    ids = []
+    cursor = None
+    for _ in range(ceil(qtd / size)):
+        params = {'size': size}
+        if cursor:
+            params['cursor'] = cursor
+        response = await client.get('/atletas/cursor', params=params)
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert 'total' not in data or data['total'] is None
+        ids.extend(item['id'] for item in data['items'])
+        cursor = data['next_page']
+
+    assert cursor is None
+    assert len(ids) == qtd
+    assert set(ids) == {str(atleta.id) for atleta in atletas}
+
+
+@pytest.mark.asyncio
+async def test_get_atletas_cursor_com_filtro(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    AtletaModelFactory.create(nome='João Silva')
+    AtletaModelFactory.create(nome='João Souza')
+    AtletaModelFactory.create(nome='Maria Souza')
+    await session.commit()
+
+    response = await client.get(
+        '/atletas/cursor', params={'size': 1, 'nome': 'João'}
+    )
+    data = response.json()
+    assert response.status_code == HTTPStatus.OK
+    assert len(data['items']) == 1
+    assert data['next_page']
+
+    response = await client.get(
+        '/atletas/cursor',
+        params={'size': 1, 'nome': 'João', 'cursor': data['next_page']},
+    )
+    data = response.json()
+    assert response.status_code == HTTPStatus.OK
+    assert len(data['items']) == 1
+    assert data['items'][0]['nome'].startswith('João')
+    assert data['next_page'] is None
+
+
+@pytest.mark.asyncio
+async def test_get_atletas_cursor_invalido(client: httpx.AsyncClient):
+    response = await client.get(
+        '/atletas/cursor', params={'cursor': 'bm90LWpzb24='}
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_atletas_cursor_size_zero(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    AtletaModelFactory.create()
+    await session.commit()
+
+    response = await client.get('/atletas/cursor', params={'size': 0})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['items'] == []
+    assert response.json()['next_page'] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'valores',
+    [['2024-01-01T00:00:00', 'x'], ['2024-01-01T00:00:00', None], [1, 2]],
+)
+async def test_get_atletas_cursor_com_tipos_trocados(
+    client: httpx.AsyncClient, valores
+):
+    cursor = base64.b64encode(json.dumps(valores).encode()).decode()
+    response = await client.get('/atletas/cursor', params={'cursor': cursor})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
 @pytest.mark.asyncio
 async def test_get_atleta_by_id_success(
     client: httpx.AsyncClient, session: AsyncSession
@@ -218,6 +529,24 @@ async def test_patch_atleta_success(
     assert response.status_code == HTTPStatus.OK
     data = response.json()
     assert data['nome'] == patch_data['nome']
+    assert data['categoria'] == {'nome': atleta.categoria.nome}
+    assert data['centro_treinamento'] == {
+        'nome': atleta.centro_treinamento.nome
+    }
+
+
+@pytest.mark.asyncio
+async def test_patch_atleta_sem_campos_devolve_atleta(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    atleta = AtletaModelFactory.create()
+    await session.commit()
+
+    response = await client.patch(f'/atletas/{atleta.id}', json={})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['nome'] == atleta.nome
+    assert response.json()['categoria'] == {'nome': atleta.categoria.nome}
 
 
 @pytest.mark.asyncio
@@ -301,6 +630,55 @@ async def test_filtro_atletas(
     assert data['total'] == 0
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('params', 'esperados'),
+    [
+        ({'nome': 'silvana'}, {'Ana Silvana', 'Silvana Costa'}),
+        ({'nome': 'silvana', 'busca': 'prefixo'}, {'Silvana Costa'}),
+        ({'nome': 'joao'}, set()),
+        ({'nome': 'joao', 'sem_acento': True}, {'João Silva'}),
+        ({'nome': '%'}, set()),
+    ],
+)
+async def test_filtro_atletas_estrategias_de_busca(
+    client: httpx.AsyncClient, session: AsyncSession, params, esperados
+):
+    for nome in ('João Silva', 'Ana Silvana', 'Silvana Costa'):
+        AtletaModelFactory.create(nome=nome)
+    await session.commit()
+
+    response = await client.get('/atletas/', params=params)
+
+    assert response.status_code == HTTPStatus.OK
+    nomes = {item['nome'] for item in response.json()['items']}
+    assert nomes == esperados
+
+
+@pytest.mark.parametrize(
+    ('modo', 'sem_acento', 'estrategia'),
+    [
+        ('prefixo', False, 'prefixo'),
+        ('contem', False, 'contem'),
+        ('prefixo', True, 'sem_acento'),
+        ('contem', True, 'sem_acento'),
+    ],
+)
+def test_escolher_estrategia_mais_barata(modo, sem_acento, estrategia):
+    assert escolher_estrategia(modo, sem_acento).nome == estrategia
+
+
+@pytest.mark.asyncio
+async def test_busca_sem_acento_usa_funcao_indexavel(session: AsyncSession):
+    filtro = filtro_busca(AtletaModel.nome, 'joao', sem_acento=True)
+    assert 'f_unaccent(atletas.nome)' in str(filtro)
+
+    volatilidade = await session.scalar(
+        text("SELECT provolatile FROM pg_proc WHERE proname = 'f_unaccent'")
+    )
+    assert volatilidade == 'i'
+
+
 @pytest.mark.asyncio
 async def test_filtro_cpf_formato_invalido(client: httpx.AsyncClient):
     response = await client.get(
@@ -401,7 +779,432 @@ async def test_filtro_sem_parametros(client: httpx.AsyncClient):
     assert isinstance(response.json(), dict)
 
 
-def test_atleta_filtro_query_instantiation():
-    filtro = AtletaFiltroQuery(nome='Joao', cpf='12345678901')
-    assert filtro.nome == 'Joao'
-    assert filtro.cpf == '12345678901'
+@pytest.mark.asyncio
+async def test_filtro_por_categoria_centro_sexo_e_faixas(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    categoria = CategoriaModelFactory.create()
+    centro = CentroTreinamentoModelFactory.create()
+    esperado = AtletaModelFactory.create(
+        categoria=categoria,
+        centro_treinamento=centro,
+        sexo='F',
+        idade=30,
+        peso=60.0,
+    )
+    for valores in (
+        {'sexo': 'M', 'idade': 30, 'peso': 60.0},
+        {'sexo': 'F', 'idade': 50, 'peso': 60.0},
+        {'sexo': 'F', 'idade': 30, 'peso': 90.0},
+    ):
+        AtletaModelFactory.create(
+            categoria=categoria, centro_treinamento=centro, **valores
+        )
+    AtletaModelFactory.create(sexo='F', idade=30, peso=60.0)
+    await session.commit()
+
+    response = await client.get(
+        '/atletas/',
+        params={
+            'categoria': categoria.nome,
+            'centro_treinamento': centro.nome,
+            'sexo': 'F',
+            'idade_min': 25,
+            'idade_max': 35,
+            'peso_min': 50,
+            'peso_max': 70,
+        },
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data['total'] == 1
+    assert data['items'][0]['id'] == str(esperado.id)
+
+    response = await client.get(
+        '/atletas/', params={'categoria': categoria.nome}
+    )
+    assert response.json()['total'] == 4  # noqa: PLR2004
+
+    response = await client.get('/atletas/', params={'categoria': 'nenhuma'})
+    assert response.json()['total'] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'params',
+    [
+        {'idade_min': 40, 'idade_max': 20},
+        {'peso_min': 90, 'peso_max': 60},
+        {'idade_min': -1},
+        {'sexo': 'X'},
+        {'order_by': 'cpf'},
+    ],
+)
+async def test_filtros_e_ordem_invalidos(client: httpx.AsyncClient, params):
+    response = await client.get('/atletas/', params=params)
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'order_by', ['created_at', '-created_at', 'idade', '-idade', 'peso']
+)
+async def test_listagem_ordenada_e_deterministica(
+    client: httpx.AsyncClient, session: AsyncSession, order_by: str
+):
+    # Valores repetidos: só o desempate por pk_id fixa a ordem.
+    atletas = [
+        AtletaModelFactory.create(idade=20 + i % 2, peso=70.0 + i % 3)
+        for i in range(7)
+    ]
+    await session.commit()
+
+    coluna = order_by.lstrip('-')
+    esperado = [
+        str(atleta.id)
+        for atleta in sorted(
+            atletas,
+            key=lambda atleta: (getattr(atleta, coluna), atleta.pk_id),
+            reverse=order_by.startswith('-'),
+        )
+    ]
+    recebido = []
+    for page in range(1, 5):
+        response = await client.get(
+            '/atletas/',
+            params={'order_by': order_by, 'page': page, 'size': 2},
+        )
+        assert response.status_code == HTTPStatus.OK
+        recebido += [item['id'] for item in response.json()['items']]
+
+    assert recebido == esperado
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('params', 'indice'),
+    [
+        ({'sexo': 'M'}, 'ix_atletas_created_at_pk_id_sexo_m'),
+        ({'idade_min': 18, 'order_by': 'idade'}, 'ix_atletas_idade_pk_id'),
+        ({'order_by': '-peso'}, 'ix_atletas_peso_pk_id'),
+        ({'order_by': 'nome'}, 'ix_atletas_nome_pk_id'),
+    ],
+)
+async def test_filtros_e_ordem_usam_indices(
+    session: AsyncSession, params, indice
+):
+    order_by = params.pop('order_by', 'created_at')
+    stmt = ordenar(
+        filtrar(select_listagem(), AtletaFiltroSchema(**params)), order_by
+    ).limit(10)
+    compilado = stmt.compile(
+        dialect=session.bind.dialect, compile_kwargs={'literal_binds': True}
+    )
+
+    # Tabela vazia e sem estatísticas: desliga as alternativas para ver
+    # se o índice entrega a ordem pedida sozinho.
+    await session.execute(text('SET LOCAL enable_seqscan = off'))
+    await session.execute(text('SET LOCAL enable_sort = off'))
+    plano = '\n'.join(
+        (await session.execute(text(f'EXPLAIN {compilado}'))).scalars()
+    )
+    await session.rollback()
+
+    assert indice in plano
+    assert 'Sort' not in plano
+
+
+@pytest.mark.asyncio
+async def test_quantidade_de_statements_por_endpoint(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    atletas = AtletaModelFactory.create_batch(3)
+    await session.commit()
+    atleta = atletas[0]
+    session.expunge_all()
+
+    with contar_queries(session.bind) as statements:
+        await client.get('/atletas/', params={'size': 3})
+    assert len(statements) == 2  # noqa: PLR2004  página com JOIN + COUNT
+
+    with contar_queries(session.bind) as statements:
+        await client.get('/atletas/', params={'size': 10})
+    assert len(statements) == 1  # página incompleta já dá o total
+
+    with contar_queries(session.bind) as statements:
+        await client.get('/atletas/cursor', params={'size': 10})
+    assert len(statements) == 1
+
+    with contar_queries(session.bind) as statements:
+        await client.get(f'/atletas/{atleta.id}')
+    assert len(statements) == 1
+
+    with contar_queries(session.bind) as statements:
+        await client.patch(f'/atletas/{atleta.id}', json={'nome': 'Novo'})
+    assert len(statements) == 1  # UPDATE ... FROM ... RETURNING
+    assert statements[0].startswith('UPDATE atletas')
+
+    with contar_queries(session.bind) as statements:
+        await client.delete(f'/atletas/{atleta.id}')
+    assert len(statements) == 1  # DELETE ... RETURNING pk_id
+    assert 'categorias' not in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_listagem_projeta_so_colunas_da_saida(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    AtletaModelFactory.create_batch(2)
+    await session.commit()
+
+    with contar_queries(session.bind) as statements:
+        response = await client.get('/atletas/', params={'size': 10})
+    assert response.status_code == HTTPStatus.OK
+    assert set(response.json()['items'][0]) == {
+        'id',
+        'created_at',
+        'nome',
+        'cpf',
+        'categoria',
+        'centro_treinamento',
+    }
+    pagina = statements[-1]
+    assert 'atletas.idade' not in pagina
+    assert 'categorias.pk_id' not in pagina.split('FROM')[0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('fields', 'chaves'),
+    [('id,nome', {'id', 'nome'}), ('id', {'id'}), (' nome , ', {'nome'})],
+)
+async def test_listagem_com_fields_estreita_o_select(
+    client: httpx.AsyncClient, session: AsyncSession, fields, chaves
+):
+    AtletaModelFactory.create_batch(3)
+    await session.commit()
+
+    with contar_queries(session.bind) as statements:
+        response = await client.get(
+            '/atletas/', params={'fields': fields, 'size': 2}
+        )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data['total'] == 3  # noqa: PLR2004
+    assert len(data['items']) == 2  # noqa: PLR2004
+    assert all(set(item) == chaves for item in data['items'])
+    pagina = statements[0]
+    assert 'JOIN' not in pagina
+    assert 'atletas.cpf' not in pagina
+
+
+@pytest.mark.asyncio
+async def test_get_atleta_by_id_com_fields(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    atleta = AtletaModelFactory.create()
+    await session.commit()
+
+    response = await client.get(
+        f'/atletas/{atleta.id}', params={'fields': 'nome,categoria'}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        'nome': atleta.nome,
+        'categoria': {'nome': atleta.categoria.nome},
+    }
+
+    with contar_queries(session.bind) as statements:
+        response = await client.get(
+            f'/atletas/{atleta.id}', params={'fields': 'id,peso'}
+        )
+    assert response.json() == {'id': str(atleta.id), 'peso': atleta.peso}
+    assert 'JOIN' not in statements[0]
+
+    response = await client.get(f'/atletas/{uuid4()}', params={'fields': 'id'})
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('url', 'fields'),
+    [
+        ('/atletas/', 'id,idade'),
+        ('/atletas/', ','),
+        (f'/atletas/{uuid4()}', 'senha'),
+    ],
+)
+async def test_fields_invalidos(client: httpx.AsyncClient, url, fields):
+    response = await client.get(url, params={'fields': fields})
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert response.json()['detail'][0]['loc'] == ['query', 'fields']
+
+
+def test_modelo_parcial_em_cache():
+    modelo = modelo_parcial(AtletaOut, frozenset({'id', 'nome'}))
+
+    assert modelo is modelo_parcial(AtletaOut, frozenset({'nome', 'id'}))
+    assert list(modelo.model_fields) == ['id', 'nome']
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('contagem', ['exata', 'estimada', 'cache'])
+async def test_modos_de_contagem(
+    client: httpx.AsyncClient, session: AsyncSession, contagem: str
+):
+    AtletaModelFactory.create_batch(5)
+    await session.commit()
+    await session.execute(text('ANALYZE atletas'))
+
+    response = await client.get(
+        '/atletas/', params={'size': 2, 'contagem': contagem}
+    )
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data['contagem'] == contagem
+    assert len(data['items']) == 2  # noqa: PLR2004
+    if contagem == 'estimada':
+        assert data['total'] >= 2  # noqa: PLR2004
+    else:
+        assert data['total'] == 5  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_contagem_em_cache_reaproveita_total(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    AtletaModelFactory.create_batch(3)
+    await session.commit()
+    params = {'size': 1, 'contagem': 'cache'}
+
+    response = await client.get('/atletas/', params=params)
+    assert response.json()['total'] == 3  # noqa: PLR2004
+
+    AtletaModelFactory.create()
+    await session.commit()
+    with contar_queries(session.bind) as statements:
+        response = await client.get('/atletas/', params=params)
+    assert len(statements) == 1
+    assert response.json()['total'] == 3  # noqa: PLR2004
+
+    response = await client.get(
+        '/atletas/', params={**params, 'contagem': 'exata'}
+    )
+    assert response.json()['total'] == 4  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_contagem_estimada_com_fields_de_relacao_le_atletas(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    categoria = CategoriaModelFactory.create()
+    CategoriaModelFactory.create_batch(10)
+    AtletaModelFactory.create_batch(5, categoria=categoria)
+    await session.commit()
+    await session.execute(text('ANALYZE atletas'))
+    await session.execute(text('ANALYZE categorias'))
+
+    response = await client.get(
+        '/atletas/',
+        params={'fields': 'categoria', 'size': 2, 'contagem': 'estimada'},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['total'] == 5  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_contagem_estimada_com_filtro_usa_explain(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    atletas = AtletaModelFactory.create_batch(3)
+    await session.commit()
+
+    with contar_queries(session.bind) as statements:
+        response = await client.get(
+            '/atletas/',
+            params={
+                'nome': atletas[0].nome,
+                'size': 1,
+                'contagem': 'estimada',
+            },
+        )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['contagem'] == 'estimada'
+    assert response.json()['total'] >= 1
+    assert statements[-1].startswith('EXPLAIN')
+
+
+@pytest.mark.asyncio
+async def test_batch_get_atletas_em_uma_query(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    atletas = AtletaModelFactory.create_batch(3)
+    await session.commit()
+    ids = [str(atletas[1].id), str(uuid4()), str(atletas[0].id)]
+
+    with contar_queries(session.bind) as statements:
+        response = await client.post('/atletas/batch-get', json={'ids': ids})
+    assert response.status_code == HTTPStatus.OK
+    assert len(statements) == 1
+    assert 'ANY' in statements[0]
+    itens = response.json()['itens']
+    assert [item['id'] for item in itens] == ids
+    assert [item['encontrado'] for item in itens] == [True, False, True]
+    assert itens[0]['item']['cpf'] == atletas[1].cpf
+    assert itens[2]['item']['categoria']['nome'] == atletas[0].categoria.nome
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_com_filtro(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    atletas = AtletaModelFactory.create_batch(5)
+    await session.commit()
+
+    response = await client.get('/atletas/export')
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    linhas = [json.loads(linha) for linha in response.text.splitlines()]
+    assert {linha['cpf'] for linha in linhas} == {a.cpf for a in atletas}
+    assert linhas[0]['categoria'] == atletas[0].categoria.nome
+
+    response = await client.get(
+        '/atletas/export', params={'cpf': atletas[3].cpf}
+    )
+    linhas = response.text.splitlines()
+    assert len(linhas) == 1
+    assert json.loads(linhas[0])['id'] == str(atletas[3].id)
+
+
+@pytest.mark.asyncio
+async def test_export_csv(client: httpx.AsyncClient, session: AsyncSession):
+    atletas = AtletaModelFactory.create_batch(3)
+    await session.commit()
+
+    response = await client.get('/atletas/export', params={'formato': 'csv'})
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'].startswith('text/csv')
+    assert 'atletas.csv' in response.headers['content-disposition']
+    linhas = list(csv.DictReader(io.StringIO(response.text)))
+    assert [linha['cpf'] for linha in linhas] == [a.cpf for a in atletas]
+    assert linhas[0]['centro_treinamento'] == (
+        atletas[0].centro_treinamento.nome
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_le_um_lote_por_vez(session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(export, 'LINHAS_POR_LOTE', 2)
+    AtletaModelFactory.create_batch(5)
+    await session.commit()
+
+    chunks = [
+        chunk
+        async for chunk in export.exportar(
+            session, export.select_export(), 'ndjson'
+        )
+    ]
+    assert [chunk.count(b'\n') for chunk in chunks] == [2, 2, 1]
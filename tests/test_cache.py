@@ -0,0 +1,312 @@
+import asyncio
+from http import HTTPStatus
+
+import httpx
+import psycopg
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factory.atleta import AtletaSchemaFactory
+from tests.factory.categoria import (
+    CategoriaModelFactory,
+    CategoriaSchemaFactory,
+)
+from tests.factory.centro_treinamento import CentroTreinamentoModelFactory
+from tests.utils import contar_queries
+from workout_api.categorias.cache import categoria_ids
+from workout_api.centro_treinamento.cache import centro_treinamento_ids
+from workout_api.configs.cache import get_cache
+from workout_api.configs.settings import settings
+from workout_api.contrib.cache import (
+    CANAL_INVALIDACAO,
+    BackendCache,
+    BackendMemoria,
+    BackendRedis,
+    Cache,
+    TTLCache,
+    invalidar_recurso,
+)
+from workout_api.contrib.cache import memoria as cache_module
+from workout_api.contrib.cache.resp import ClienteResp, ErroResp, ServidorResp
+from workout_api.contrib.http_cache import etag_casa
+from workout_api.main import app
+
+
+def test_ttl_cache_expira_entradas(monkeypatch):
+    agora = 100.0
+    monkeypatch.setattr(cache_module, 'monotonic', lambda: agora)
+    cache = TTLCache(maxsize=10, ttl=5)
+    cache.set('a', 1)
+
+    assert cache.get('a') == 1
+    agora = 106.0
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_descarta_menos_usado():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_post_atleta_usa_cache_de_nomes(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    categoria = CategoriaModelFactory.build()
+    centro = CentroTreinamentoModelFactory.build()
+    session.add_all([categoria, centro])
+    await session.commit()
+
+    for _ in range(2):
+        payload = AtletaSchemaFactory(
+            categoria={'nome': categoria.nome},
+            centro_treinamento={'nome': centro.nome},
+        ).model_dump()
+        response = await client.post('/atletas/', json=payload)
+        assert response.status_code == HTTPStatus.CREATED
+
+    assert categoria_ids.cache.get(categoria.nome) == categoria.pk_id
+    assert centro_treinamento_ids.cache.get(centro.nome) == centro.pk_id
+
+    response = await client.post(
+        '/categorias/', json=CategoriaSchemaFactory().model_dump()
+    )
+    assert response.status_code == HTTPStatus.CREATED
+    assert categoria_ids.cache.get(categoria.nome) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidacao_notifica_outros_workers(
+    session: AsyncSession, monkeypatch
+):
+    monkeypatch.setattr(settings, 'CACHE_NOTIFY', True)
+    url = session.bind.url.set(drivername='postgresql')
+    async with await psycopg.AsyncConnection.connect(
+        url.render_as_string(hide_password=False), autocommit=True
+    ) as conn:
+        await conn.execute(f'LISTEN {CANAL_INVALIDACAO}')
+
+        categoria_ids.lembrar('Scale', 1)
+        await invalidar_recurso(session, 'categorias')
+        await session.commit()
+
+        notify = await anext(conn.notifies(timeout=5))
+        assert notify.payload == 'categorias'
+        assert categoria_ids.conhecido('Scale') is None
+
+
+@pytest.mark.parametrize(
+    ('if_none_match', 'casa'),
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"x", "abc"', True),
+        ('*', True),
+        ('"x"', False),
+    ],
+)
+def test_etag_casa(if_none_match, casa):
+    assert etag_casa(if_none_match, '"abc"') is casa
+
+
+@pytest.mark.asyncio
+async def test_listagem_de_categorias_responde_304_sem_ir_ao_banco(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    CategoriaModelFactory.create()
+    await session.commit()
+
+    response = await client.get('/categorias/')
+    assert response.status_code == HTTPStatus.OK
+    etag = response.headers['etag']
+    assert 'max-age' in response.headers['cache-control']
+
+    with contar_queries(session.bind) as statements:
+        response = await client.get(
+            '/categorias/', headers={'If-None-Match': etag}
+        )
+        cache_hit = await client.get('/categorias/')
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers['etag'] == etag
+    assert not response.content
+    assert cache_hit.headers['etag'] == etag
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_escrita_invalida_respostas_em_cache(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    categoria = CategoriaModelFactory.create()
+    await session.commit()
+    url = f'/categorias/{categoria.id}'
+
+    lista = await client.get('/categorias/')
+    detalhe = await client.get(url)
+    assert detalhe.json()['nome'] == categoria.nome
+
+    nova = CategoriaSchemaFactory.build()
+    response = await client.post('/categorias/', json=nova.model_dump())
+    assert response.status_code == HTTPStatus.CREATED
+
+    response = await client.get(
+        '/categorias/', headers={'If-None-Match': lista.headers['etag']}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['etag'] != lista.headers['etag']
+    assert nova.nome in {c['nome'] for c in response.json()['items']}
+
+    # O corpo do detalhe não mudou: mesmo ETag, mesmo 304.
+    response = await client.get(
+        url, headers={'If-None-Match': detalhe.headers['etag']}
+    )
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+@pytest_asyncio.fixture
+async def servidor_resp():
+    servidor = ServidorResp()
+    await servidor.iniciar()
+    yield servidor
+    await servidor.fechar()
+
+
+def test_backend_incompleto_nao_instancia():
+    class SoLeitura(BackendCache):
+        local = True
+        valores: dict[str, bytes] = {}
+
+        async def get(self, chave):
+            return self.valores.get(chave)
+
+    with pytest.raises(TypeError):
+        SoLeitura()
+
+
+@pytest.mark.asyncio
+async def test_backend_redis_no_servidor_falso(servidor_resp):
+    backend = BackendRedis(servidor_resp.url)
+
+    assert await backend.get('a') is None
+    await backend.set('a', b'1', ttl=60)
+    assert await backend.get('a') == b'1'
+    assert not await backend.set_nx('a', b'2', ttl=60)
+    assert await backend.set_nx('b', b'2', ttl=0.01)
+    assert await backend.incr('versao') == 1
+    assert await backend.incr('versao') == 2  # noqa: PLR2004
+    await backend.delete('a')
+    assert await backend.get('a') is None
+    await asyncio.sleep(0.02)
+    assert await backend.get('b') is None
+    await backend.fechar()
+
+
+@pytest.mark.asyncio
+async def test_servidor_resp_responde_erro_a_valor_invalido(servidor_resp):
+    cliente = ClienteResp(servidor_resp.url)
+    await cliente.executar('SET', 'nome', 'abc')
+
+    for comando in (
+        ('INCR', 'nome'),
+        ('SET', 'a', '1', 'EX', 'muito'),
+        ('SET', 'a', '1', 'PX', 'abc'),
+    ):
+        with pytest.raises(ErroResp, match='not an integer'):
+            await cliente.executar(*comando)
+    # A conexão continua atendendo depois do erro.
+    assert await cliente.executar('PING') == 'PONG'
+    await cliente.fechar()
+
+
+def _contador():
+    chamadas = []
+
+    async def calcular() -> bytes:
+        chamadas.append(1)
+        await asyncio.sleep(0.05)
+        return b'valor'
+
+    return chamadas, calcular
+
+
+@pytest.mark.asyncio
+async def test_faltas_concorrentes_calculam_uma_vez():
+    cache = Cache(BackendMemoria())
+    chamadas, calcular = _contador()
+
+    valores = await asyncio.gather(
+        *(
+            cache.obter_ou_calcular('r', 'k', calcular, ttl=60)
+            for _ in range(20)
+        )
+    )
+
+    assert valores == [b'valor'] * 20
+    assert len(chamadas) == 1
+    await cache.invalidar('r')
+    await cache.obter_ou_calcular('r', 'k', calcular, ttl=60)
+    assert len(chamadas) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_single_flight_entre_workers(servidor_resp):
+    workers = [Cache(BackendRedis(servidor_resp.url)) for _ in range(4)]
+    chamadas, calcular = _contador()
+
+    valores = await asyncio.gather(
+        *(
+            worker.obter_ou_calcular('r', 'k', calcular, ttl=60)
+            for worker in workers
+            for _ in range(5)
+        )
+    )
+
+    assert valores == [b'valor'] * 20
+    assert len(chamadas) == 1
+    # A versão é compartilhada: invalidar em um worker vale para todos.
+    await workers[0].invalidar('r')
+    await workers[1].obter_ou_calcular('r', 'k', calcular, ttl=60)
+    assert len(chamadas) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_cache_fora_do_ar_le_do_banco():
+    cache = Cache(BackendRedis('redis://127.0.0.1:1/0', timeout=0.2))
+    chamadas, calcular = _contador()
+
+    assert await cache.obter_ou_calcular('r', 'k', calcular, ttl=60) == (
+        b'valor'
+    )
+    assert len(chamadas) == 1
+
+
+@pytest.mark.asyncio
+async def test_listagem_de_categorias_com_backend_redis(
+    client: httpx.AsyncClient, session: AsyncSession, servidor_resp
+):
+    cache = Cache(BackendRedis(servidor_resp.url))
+    app.dependency_overrides[get_cache] = lambda: cache
+    CategoriaModelFactory.create()
+    await session.commit()
+
+    primeira = await client.get('/categorias/')
+    with contar_queries(session.bind) as statements:
+        segunda = await client.get('/categorias/')
+    assert statements == []
+    assert segunda.content == primeira.content
+
+    nova = CategoriaSchemaFactory.build()
+    await client.post('/categorias/', json=nova.model_dump())
+    response = await client.get('/categorias/')
+    assert response.json()['total'] == 2  # noqa: PLR2004
+    await cache.fechar()
@@ -3,14 +3,17 @@ from http import HTTPStatus
 
 import httpx
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from tests.factory.atleta import AtletaModelFactory
 from tests.factory.categoria import (
     CategoriaModelFactory,
     CategoriaSchemaFactory,
 )
 from tests.utils import gerar_casos_paginacao
+from workout_api.atleta.listagem import ORDEM_CURSOR, select_listagem
+from workout_api.atleta.models import AtletaModel
 from workout_api.categorias.models import CategoriaModel
 
 
@@ -103,3 +106,134 @@ async def test_get_categoria_by_id_not_found(client: httpx.AsyncClient):
     detail: str = response.json()['detail']
     assert response.status_code == HTTPStatus.NOT_FOUND
     assert 'categoria não encontrada' in detail.lower()
+
+
+@pytest.mark.asyncio
+async def test_batch_get_categorias_na_ordem_do_pedido(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    objs = [CategoriaModelFactory.build() for _ in range(3)]
+    session.add_all(objs)
+    await session.commit()
+    inexistente = uuid.uuid4()
+    ids = [objs[2].id, inexistente, objs[0].id, objs[2].id]
+
+    response = await client.post(
+        '/categorias/batch-get', json={'ids': [str(id) for id in ids]}
+    )
+    assert response.status_code == HTTPStatus.OK
+    itens = response.json()['itens']
+    assert [item['id'] for item in itens] == [str(id) for id in ids]
+    assert [item['encontrado'] for item in itens] == [True, False, True, True]
+    assert itens[1]['item'] is None
+    assert itens[2]['item']['nome'] == objs[0].nome
+
+
+@pytest.mark.asyncio
+async def test_batch_get_categorias_limita_quantidade_de_ids(
+    client: httpx.AsyncClient,
+):
+    ids = [str(uuid.uuid4()) for _ in range(101)]
+    response = await client.post('/categorias/batch-get', json={'ids': ids})
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    response = await client.post('/categorias/batch-get', json={'ids': []})
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_atletas_da_categoria_percorre_paginas_por_cursor(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    categoria = CategoriaModelFactory.create()
+    dela = AtletaModelFactory.create_batch(3, categoria=categoria)
+    AtletaModelFactory.create_batch(2)
+    await session.commit()
+
+    ids, cursor = [], None
+    while True:
+        params = {'size': 2, **({'cursor': cursor} if cursor else {})}
+        response = await client.get(
+            f'/categorias/{categoria.id}/atletas', params=params
+        )
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        ids += [item['id'] for item in data['items']]
+        assert {item['categoria'] for item in data['items']} <= {
+            categoria.nome
+        }
+        cursor = data['next_page']
+        if not cursor:
+            break
+
+    esperado = sorted(dela, key=lambda a: (a.created_at, a.pk_id))
+    assert ids == [str(a.id) for a in esperado]
+
+
+@pytest.mark.asyncio
+async def test_atletas_da_categoria_vazia_e_inexistente(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    categoria = CategoriaModelFactory.create()
+    await session.commit()
+
+    response = await client.get(f'/categorias/{categoria.id}/atletas')
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['items'] == []
+
+    response = await client.get(f'/categorias/{uuid.uuid4()}/atletas')
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert 'Categoria não encontrada' in response.json()['detail']
+
+
+@pytest.mark.asyncio
+async def test_atletas_da_categoria_usa_indice_na_ordem_do_cursor(
+    session: AsyncSession,
+):
+    subquery = (
+        select(CategoriaModel.pk_id)
+        .where(CategoriaModel.id == uuid.uuid4())
+        .scalar_subquery()
+    )
+    stmt = (
+        select_listagem()
+        .where(AtletaModel.categoria_id == subquery)
+        .order_by(*ORDEM_CURSOR)
+        .limit(10)
+    )
+    compilado = stmt.compile(
+        dialect=session.bind.dialect, compile_kwargs={'literal_binds': True}
+    )
+
+    # Tabela vazia e sem estatísticas: desliga as alternativas para ver
+    # se o índice consegue entregar a ordem do cursor sozinho.
+    await session.execute(text('SET LOCAL enable_seqscan = off'))
+    await session.execute(text('SET LOCAL enable_sort = off'))
+    plano = '\n'.join(
+        (await session.execute(text(f'EXPLAIN {compilado}'))).scalars()
+    )
+    await session.rollback()
+
+    assert 'ix_atletas_categoria_id_created_at_pk_id' in plano
+    assert 'Sort' not in plano
+
+
+@pytest.mark.asyncio
+async def test_atletas_do_categoria_com_size_zero(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    pai = CategoriaModelFactory.create()
+    AtletaModelFactory.create(categoria=pai)
+    await session.commit()
+
+    response = await client.get(
+        f'/categorias/{pai.id}/atletas', params={'size': 0}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['items'] == []
+    assert response.json()['next_page'] is None
+
+    response = await client.get(
+        f'/categorias/{uuid.uuid4()}/atletas', params={'size': 0}
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
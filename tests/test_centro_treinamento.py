@@ -6,6 +6,7 @@ import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from tests.factory.atleta import AtletaModelFactory
 from tests.factory.centro_treinamento import (
     CentroTreinamentoModelFactory,
     CentroTreinamentoSchemaFactory,
@@ -141,3 +142,81 @@ async def test_create_centro_treinamento_field_length_validation(
     response = await client.post('/centros_treinamento/', json=payload)
     assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
     assert any(field in str(err['loc']) for err in response.json()['detail'])
+
+
+@pytest.mark.asyncio
+async def test_batch_get_centros_treinamento(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    cts = [CentroTreinamentoModelFactory() for _ in range(2)]
+    session.add_all(cts)
+    await session.commit()
+    ids = [str(cts[1].id), str(uuid.uuid4()), str(cts[0].id)]
+
+    response = await client.post(
+        '/centros_treinamento/batch-get', json={'ids': ids}
+    )
+    assert response.status_code == HTTPStatus.OK
+    itens = response.json()['itens']
+    assert [item['id'] for item in itens] == ids
+    assert [item['encontrado'] for item in itens] == [True, False, True]
+    assert itens[0]['item']['nome'] == cts[1].nome
+
+
+@pytest.mark.asyncio
+async def test_atletas_do_centro_treinamento(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    centro = CentroTreinamentoModelFactory.create()
+    dele = AtletaModelFactory.create_batch(3, centro_treinamento=centro)
+    AtletaModelFactory.create_batch(2)
+    await session.commit()
+
+    response = await client.get(
+        f'/centros_treinamento/{centro.id}/atletas', params={'size': 2}
+    )
+    assert response.status_code == HTTPStatus.OK
+    primeira = response.json()
+    response = await client.get(
+        f'/centros_treinamento/{centro.id}/atletas',
+        params={'size': 2, 'cursor': primeira['next_page']},
+    )
+    segunda = response.json()
+
+    ids = [item['id'] for item in primeira['items'] + segunda['items']]
+    esperado = sorted(dele, key=lambda a: (a.created_at, a.pk_id))
+    assert ids == [str(a.id) for a in esperado]
+    assert segunda['next_page'] is None
+    assert {item['centro_treinamento'] for item in segunda['items']} == {
+        centro.nome
+    }
+
+
+@pytest.mark.asyncio
+async def test_atletas_do_centro_treinamento_inexistente(
+    client: httpx.AsyncClient,
+):
+    response = await client.get(f'/centros_treinamento/{uuid.uuid4()}/atletas')
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert 'Centro de treinamento não encontrado' in response.json()['detail']
+
+
+@pytest.mark.asyncio
+async def test_atletas_do_centro_treinamento_com_size_zero(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    pai = CentroTreinamentoModelFactory.create()
+    AtletaModelFactory.create(centro_treinamento=pai)
+    await session.commit()
+
+    response = await client.get(
+        f'/centros_treinamento/{pai.id}/atletas', params={'size': 0}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['items'] == []
+    assert response.json()['next_page'] is None
+
+    response = await client.get(
+        f'/centros_treinamento/{uuid.uuid4()}/atletas', params={'size': 0}
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
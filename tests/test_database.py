@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+from starlette.requests import Request
+
+from workout_api.configs.database import engine_options, get_read_session
+from workout_api.configs.settings import Settings
+from workout_api.contrib.metrics import ESPERA_POOL, PoolMedido
+from workout_api.contrib.replicas import RoteadorReplicas
+
+
+def test_engine_options_pool_configuravel():
+    config = Settings(
+        DB_POOL_SIZE=20,
+        DB_MAX_OVERFLOW=5,
+        DB_POOL_TIMEOUT=2.5,
+        DB_POOL_RECYCLE=1800,
+        DB_POOL_PRE_PING=True,
+        DB_PREPARE_THRESHOLD=1,
+    )
+
+    options = engine_options(config)
+
+    assert options['pool_size'] == 20  # noqa: PLR2004
+    assert options['max_overflow'] == 5  # noqa: PLR2004
+    assert options['pool_timeout'] == 2.5  # noqa: PLR2004
+    assert options['pool_recycle'] == 1800  # noqa: PLR2004
+    assert options['pool_pre_ping'] is True
+    assert options['connect_args'] == {'prepare_threshold': 1}
+    assert options['poolclass'] is PoolMedido
+
+
+def test_engine_options_null_pool_desliga_prepared_statements():
+    options = engine_options(Settings(DB_NULL_POOL=True))
+
+    assert issubclass(options['poolclass'], NullPool)
+    assert options['connect_args'] == {'prepare_threshold': None}
+    assert 'pool_size' not in options
+
+
+def _esperas() -> int:
+    for linha in ESPERA_POOL.render().splitlines():
+        if linha.startswith(f'{ESPERA_POOL.nome}_count'):
+            return int(linha.split()[-1])
+    return 0
+
+
+@pytest.mark.asyncio
+async def test_sessao_so_pega_conexao_no_primeiro_statement(
+    engine: AsyncEngine,
+):
+    engine_medida = create_async_engine(engine.url, poolclass=PoolMedido)
+    request = Request({'type': 'http', 'headers': []})
+    esperas = _esperas()
+    try:
+        async for sessao in get_read_session(
+            request, RoteadorReplicas(engine_medida)
+        ):
+            assert engine_medida.pool.checkedout() == 0
+            assert _esperas() == esperas
+
+            await sessao.execute(text('SELECT 1'))
+
+            assert engine_medida.pool.checkedout() == 1
+            assert _esperas() == esperas + 1
+    finally:
+        await engine_medida.dispose()
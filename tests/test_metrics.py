@@ -0,0 +1,171 @@
+import logging
+import re
+from http import HTTPStatus
+
+import httpx
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factory.atleta import AtletaModelFactory
+from tests.factory.categoria import CategoriaModelFactory
+from workout_api.contrib.metrics import (
+    Histogram,
+    Metrica,
+    desinstrumentar_engine,
+    instrumentar_engine,
+)
+
+
+def _valor(texto: str, amostra: str) -> float:
+    match = re.search(rf'^{re.escape(amostra)} (\S+)$', texto, re.MULTILINE)
+    assert match, f'amostra ausente: {amostra}'
+    return float(match.group(1))
+
+
+@pytest.fixture
+def instrumentar(session: AsyncSession):
+    """Instrumenta a engine dos testes como `teste` e desfaz no fim."""
+
+    def _instrumentar(**kwargs) -> None:
+        instrumentar_engine(session.bind, nome='teste', **kwargs)
+
+    yield _instrumentar
+    desinstrumentar_engine(session.bind, 'teste')
+
+
+def test_histogram_render_cumulativo():
+    histogram = Histogram('teste_segundos', 'Teste.', buckets=(0.1, 1))
+    histogram.observe(0.05, rota='/x')
+    histogram.observe(0.5, rota='/x')
+    histogram.observe(3, rota='/x')
+
+    texto = histogram.render()
+
+    assert '# TYPE teste_segundos histogram' in texto
+    assert _valor(texto, 'teste_segundos_bucket{rota="/x",le="0.1"}') == 1
+    assert _valor(texto, 'teste_segundos_bucket{rota="/x",le="1.0"}') == 2  # noqa: PLR2004
+    assert _valor(texto, 'teste_segundos_bucket{rota="/x",le="+Inf"}') == 3  # noqa: PLR2004
+    assert _valor(texto, 'teste_segundos_count{rota="/x"}') == 3  # noqa: PLR2004
+    assert _valor(texto, 'teste_segundos_sum{rota="/x"}') == 3.55  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_metrics_expoe_latencia_round_trips_e_pool(
+    client: httpx.AsyncClient, session: AsyncSession, instrumentar
+):
+    instrumentar()
+    CategoriaModelFactory.create()
+    await session.commit()
+
+    # Página cheia: força o COUNT(*) além do SELECT da página.
+    response = await client.get('/categorias/', params={'size': 1})
+    assert response.status_code == HTTPStatus.OK
+
+    response = await client.get('/metrics')
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'].startswith('text/plain')
+    texto = response.text
+
+    assert (
+        _valor(
+            texto,
+            'workout_http_request_duration_seconds_count'
+            '{method="GET",route="/categorias/",status="200"}',
+        )
+        >= 1
+    )
+    # COUNT(*) e SELECT da página
+    assert (
+        _valor(
+            texto,
+            'workout_db_round_trips_per_request_sum{route="/categorias/"}',
+        )
+        >= 2  # noqa: PLR2004
+    )
+    assert 'workout_db_pool_checked_out{engine="teste"}' in texto
+    assert 'workout_db_pool_saturation{engine="teste"}' in texto
+
+
+@pytest.mark.asyncio
+async def test_server_timing_expoe_statements_e_tempo_de_banco(
+    client: httpx.AsyncClient, session: AsyncSession, instrumentar
+):
+    instrumentar()
+    atleta = AtletaModelFactory.create()
+    await session.commit()
+
+    response = await client.get(f'/atletas/{atleta.id}')
+
+    assert response.status_code == HTTPStatus.OK
+    assert re.fullmatch(
+        r'db;dur=\d+\.\d;desc="1 queries", app;dur=\d+\.\d',
+        response.headers['server-timing'],
+    )
+
+
+@pytest.mark.asyncio
+async def test_consulta_lenta_vai_para_o_log_com_explain(
+    client: httpx.AsyncClient,
+    session: AsyncSession,
+    caplog: pytest.LogCaptureFixture,
+    instrumentar,
+):
+    AtletaModelFactory.create_batch(2)
+    await session.commit()
+    instrumentar(limite_consulta_lenta=0)
+    with caplog.at_level(
+        logging.WARNING, logger='workout_api.contrib.metrics'
+    ):
+        response = await client.get('/atletas/', params={'size': 2})
+        # O EXPLAIN não pode estragar a transação da requisição.
+        segunda = await client.get('/atletas/', params={'size': 2})
+
+    assert response.status_code == HTTPStatus.OK
+    assert segunda.status_code == HTTPStatus.OK
+    lentas = [r.getMessage() for r in caplog.records]
+    assert any(
+        'Consulta lenta' in m and 'FROM atletas' in m and 'Scan' in m
+        for m in lentas
+    )
+
+
+@pytest.mark.asyncio
+async def test_consulta_lenta_com_cte_tambem_tem_explain(
+    session: AsyncSession, caplog: pytest.LogCaptureFixture, instrumentar
+):
+    instrumentar(limite_consulta_lenta=0)
+    with caplog.at_level(
+        logging.WARNING, logger='workout_api.contrib.metrics'
+    ):
+        await session.execute(
+            text('WITH a AS (SELECT nome FROM atletas) SELECT count(*) FROM a')
+        )
+
+    lentas = [r.getMessage() for r in caplog.records]
+    assert any('WITH a AS' in m and 'Aggregate' in m for m in lentas)
+
+
+@pytest.mark.asyncio
+async def test_orcamento_de_queries_falha_quando_estourado(
+    client: httpx.AsyncClient, session: AsyncSession, orcamento_queries
+):
+    atleta = AtletaModelFactory.create()
+    await session.commit()
+    session.expunge_all()
+
+    with orcamento_queries(1):
+        await client.get(f'/atletas/{atleta.id}')
+
+    # Página cheia: SELECT da página + COUNT(*).
+    with pytest.raises(pytest.fail.Exception, match='orçamento de 1'):
+        with orcamento_queries(1):
+            await client.get('/atletas/', params={'size': 1})
+
+
+def test_metrica_sem_amostras_nao_instancia():
+    class Incompleta(Metrica):
+        tipo = 'gauge'
+
+    with pytest.raises(TypeError):
+        Incompleta('incompleta', 'Sem amostras.')
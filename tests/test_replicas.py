@@ -0,0 +1,195 @@
+from http import HTTPStatus
+from time import time
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
+
+from tests.factory.atleta import AtletaModelFactory
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.configs.cache import get_cache
+from workout_api.configs.database import get_read_session, get_roteador
+from workout_api.contrib.cache import BackendMemoria, Cache
+from workout_api.contrib.models import BaseModel
+from workout_api.contrib.replicas import COOKIE_ESCRITA, RoteadorReplicas
+from workout_api.main import app
+
+BANCO_REPLICA = 'workout_replica_teste'
+
+
+@pytest_asyncio.fixture
+async def replica(engine: AsyncEngine):
+    """Um segundo banco no mesmo servidor faz o papel da réplica."""
+    admin = create_async_engine(engine.url, isolation_level='AUTOCOMMIT')
+    async with admin.connect() as conn:
+        await conn.execute(text(f'DROP DATABASE IF EXISTS {BANCO_REPLICA}'))
+        await conn.execute(
+            text(
+                f'CREATE DATABASE {BANCO_REPLICA} '
+                "ENCODING 'UTF8' TEMPLATE template0"
+            )
+        )
+    _replica = create_async_engine(engine.url.set(database=BANCO_REPLICA))
+    async with _replica.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.create_all)
+    yield _replica
+    await _replica.dispose()
+    async with admin.connect() as conn:
+        await conn.execute(text(f'DROP DATABASE {BANCO_REPLICA}'))
+    await admin.dispose()
+
+
+def test_round_robin_alterna_entre_replicas():
+    primario, a, b = (
+        create_async_engine(f'postgresql+psycopg://x@localhost/{nome}')
+        for nome in ('p', 'a', 'b')
+    )
+    roteador = RoteadorReplicas(primario, [a, b])
+
+    assert [roteador.escolher() for _ in range(4)] == [a, b, a, b]
+    assert RoteadorReplicas(primario).escolher() is primario
+
+
+def test_janela_apos_escrita_le_do_primario():
+    primario, replica = (
+        create_async_engine(f'postgresql+psycopg://x@localhost/{nome}')
+        for nome in ('p', 'r')
+    )
+    roteador = RoteadorReplicas(primario, [replica], janela=5)
+
+    assert roteador.escolher(str(time())) is primario
+    assert roteador.escolher(str(time() - 10)) is replica
+    assert roteador.escolher('invalido') is replica
+    assert roteador.escolher(None) is replica
+    # Cookie forjado não prende as leituras no primário.
+    for forjado in (str(time() + 3600), 'inf', '-inf', 'nan'):
+        assert roteador.escolher(forjado) is replica
+
+
+@pytest.mark.asyncio
+async def test_menos_ocupada_escolhe_replica_com_menos_conexoes(
+    engine: AsyncEngine, replica: AsyncEngine
+):
+    outra = create_async_engine(replica.url)
+    roteador = RoteadorReplicas(
+        engine, [replica, outra], estrategia='menos_ocupada'
+    )
+    async with replica.connect():
+        assert roteador.escolher() is outra
+    async with outra.connect():
+        assert roteador.escolher() is replica
+    await outra.dispose()
+
+
+@pytest.mark.asyncio
+async def test_leituras_vao_para_replica_e_escritas_grudam_no_primario(
+    client: httpx.AsyncClient,
+    session: AsyncSession,
+    replica: AsyncEngine,
+):
+    atleta = AtletaModelFactory.create(nome='No primario')
+    await session.commit()
+    async with AsyncSession(replica) as sessao_replica:
+        categoria = CategoriaModel(nome='rep')
+        centro = CentroTreinamentoModel(
+            nome='ct rep', endereco='Rua', proprietario='Dono'
+        )
+        sessao_replica.add_all([categoria, centro])
+        await sessao_replica.flush()
+        sessao_replica.add(
+            AtletaModel(
+                nome='Na replica',
+                cpf='12345678909',
+                idade=30,
+                peso=70,
+                altura=1.8,
+                sexo='M',
+                categoria_id=categoria.pk_id,
+                centro_treinamento_id=centro.pk_id,
+            )
+        )
+        await sessao_replica.commit()
+
+    roteador = RoteadorReplicas(session.bind, [replica], janela=60)
+    app.dependency_overrides.pop(get_read_session)
+    app.dependency_overrides[get_roteador] = lambda: roteador
+
+    def nomes(response: httpx.Response) -> list[str]:
+        assert response.status_code == HTTPStatus.OK
+        return [item['nome'] for item in response.json()['items']]
+
+    assert nomes(await client.get('/atletas/')) == ['Na replica']
+
+    response = await client.patch(
+        f'/atletas/{atleta.id}', json={'nome': 'Renomeado'}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert COOKIE_ESCRITA in response.cookies
+
+    # Dentro da janela o cliente lê o que acabou de escrever.
+    assert nomes(await client.get('/atletas/')) == ['Renomeado']
+    assert (await client.get(f'/atletas/{atleta.id}')).status_code == (
+        HTTPStatus.OK
+    )
+
+    client.cookies.clear()
+    assert nomes(await client.get('/atletas/')) == ['Na replica']
+
+
+@pytest.mark.asyncio
+async def test_cache_http_nao_grava_leitura_da_replica_apos_escrita(
+    client: httpx.AsyncClient,
+    session: AsyncSession,
+    replica: AsyncEngine,
+):
+    async with AsyncSession(replica) as sessao_replica:
+        sessao_replica.add(CategoriaModel(nome='Na replica'))
+        await sessao_replica.commit()
+
+    roteador = RoteadorReplicas(session.bind, [replica], janela=60)
+    cache = Cache(BackendMemoria(), janela_replica=60)
+    app.dependency_overrides.pop(get_read_session)
+    app.dependency_overrides[get_roteador] = lambda: roteador
+    app.dependency_overrides[get_cache] = lambda: cache
+
+    def nomes(response: httpx.Response) -> list[str]:
+        assert response.status_code == HTTPStatus.OK
+        return [item['nome'] for item in response.json()['items']]
+
+    response = await client.post('/categorias/', json={'nome': 'Nova'})
+    assert response.status_code == HTTPStatus.CREATED
+    cookies = dict(client.cookies)
+
+    # Outro cliente erra o cache logo depois da escrita e lê da réplica
+    # atrasada; essa resposta não pode ficar no cache.
+    client.cookies.clear()
+    assert nomes(await client.get('/categorias/')) == ['Na replica']
+
+    client.cookies.update(cookies)
+    assert nomes(await client.get('/categorias/')) == ['Nova']
+
+
+@pytest.mark.asyncio
+async def test_sem_replicas_escrita_nao_envia_cookie(
+    client: httpx.AsyncClient, session: AsyncSession
+):
+    atleta = AtletaModelFactory.create()
+    await session.commit()
+    app.dependency_overrides[get_roteador] = lambda: RoteadorReplicas(
+        session.bind
+    )
+
+    response = await client.patch(
+        f'/atletas/{atleta.id}', json={'nome': 'Renomeado'}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert COOKIE_ESCRITA not in response.cookies
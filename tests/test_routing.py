@@ -0,0 +1,81 @@
+from datetime import datetime, timezone
+from http import HTTPStatus
+from types import SimpleNamespace
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.routing import APIRoute
+
+from workout_api.atleta.schemas import AtletaListagemOut
+from workout_api.contrib.routing import RotaJsonRapida
+
+ATLETA = {
+    'id': uuid4(),
+    'created_at': datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+    'nome': 'Joana',
+    'cpf': '12345678900',
+    'categoria': 'Scale',
+    'centro_treinamento': 'CT King',
+}
+
+
+def _app(route_class: type[APIRoute]) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+
+    @router.get('/modelo', response_model=AtletaListagemOut)
+    async def modelo():
+        return AtletaListagemOut(**ATLETA)
+
+    @router.get('/atributos', response_model=list[AtletaListagemOut])
+    async def atributos():
+        return [SimpleNamespace(**ATLETA)]
+
+    @router.get(
+        '/parcial',
+        response_model=AtletaListagemOut,
+        response_model_exclude={'cpf'},
+        status_code=HTTPStatus.CREATED,
+    )
+    async def parcial(response: Response):
+        response.headers['X-Teste'] = '1'
+        return ATLETA
+
+    @router.get('/invalido', response_model=AtletaListagemOut)
+    async def invalido():
+        return {'nome': 'sem id'}
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('caminho', ['/modelo', '/atributos', '/parcial'])
+async def test_rota_json_rapida_gera_o_mesmo_corpo(caminho):
+    respostas = []
+    for route_class in (APIRoute, RotaJsonRapida):
+        transport = httpx.ASGITransport(app=_app(route_class))
+        async with httpx.AsyncClient(
+            transport=transport, base_url='http://test'
+        ) as client:
+            respostas.append(await client.get(caminho))
+
+    padrao, rapida = respostas
+    assert rapida.status_code == padrao.status_code
+    assert rapida.json() == padrao.json()
+    assert rapida.headers['content-type'] == padrao.headers['content-type']
+    assert rapida.headers.get('x-teste') == padrao.headers.get('x-teste')
+
+
+@pytest.mark.asyncio
+async def test_rota_json_rapida_valida_a_resposta():
+    transport = httpx.ASGITransport(
+        app=_app(RotaJsonRapida), raise_app_exceptions=False
+    )
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://test'
+    ) as client:
+        response = await client.get('/invalido')
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
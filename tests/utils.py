@@ -1,6 +1,10 @@
+from contextlib import contextmanager
 from math import ceil
+from typing import Iterator
 
 from faker import Faker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 fake_pt = Faker('pt_BR')
 
@@ -22,3 +26,17 @@ def gerar_casos_paginacao(limite: int = 20) -> list[tuple[int, int, int, int]]:
                 if len(casos) >= limite:
                     return casos
     return casos
+
+
+@contextmanager
+def contar_queries(engine: AsyncEngine) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def registrar(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', registrar)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, 'before_cursor_execute', registrar)
@@ -0,0 +1,347 @@
+import codecs
+import csv
+import json
+from collections import deque
+from typing import Any, AsyncIterator
+from uuid import uuid4
+
+from fastapi import HTTPException, Request, status
+from pydantic import ValidationError
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.schemas import AtletaBulkErro, AtletaBulkOut, AtletaIn
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+
+TAMANHO_LOTE = 1000
+
+COLUNAS_CSV = (
+    'nome',
+    'cpf',
+    'idade',
+    'peso',
+    'altura',
+    'sexo',
+    'categoria',
+    'centro_treinamento',
+)
+
+
+async def _linhas_texto(request: Request) -> AsyncIterator[str]:
+    """Linhas do corpo em UTF-8, cada uma com a sua quebra de linha.
+
+    O decodificador incremental junta os caracteres multibyte que chegam
+    partidos entre dois chunks.
+    """
+    decodificador = codecs.getincrementaldecoder('utf-8')()
+    resto = ''
+    try:
+        async for chunk in request.stream():
+            resto += decodificador.decode(chunk)
+            *completas, resto = resto.split('\n')
+            for linha in completas:
+                yield f'{linha}\n'
+        resto += decodificador.decode(b'', final=True)
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='O corpo deve estar em UTF-8.',
+        )
+    if resto:
+        yield resto
+
+
+async def _linhas(request: Request) -> AsyncIterator[str]:
+    async for linha in _linhas_texto(request):
+        if linha.strip():
+            yield linha
+
+
+async def _registros_json(request: Request) -> AsyncIterator[Any]:
+    try:
+        registros = json.loads(await request.body())
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='O corpo deve estar em UTF-8.',
+        )
+    except json.JSONDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='O corpo deve ser um array JSON de atletas.',
+        )
+    if not isinstance(registros, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='O corpo deve ser um array JSON de atletas.',
+        )
+    for registro in registros:
+        yield registro
+
+
+async def _registros_ndjson(request: Request) -> AsyncIterator[Any]:
+    async for linha in _linhas(request):
+        try:
+            yield json.loads(linha)
+        except json.JSONDecodeError as e:
+            yield e
+
+
+class _FilaLinhas:
+    """Linhas para um único `csv.reader`.
+
+    Esgotada, a fila encerra a iteração do leitor, que volta a ler
+    quando novas linhas chegam.
+    """
+
+    def __init__(self):
+        self._linhas: deque[str] = deque()
+
+    def append(self, linha: str) -> None:
+        self._linhas.append(linha)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self._linhas:
+            raise StopIteration
+        return self._linhas.popleft()
+
+
+async def _valores_csv(request: Request) -> AsyncIterator[list[str]]:
+    fila = _FilaLinhas()
+    leitor = csv.reader(fila)
+    aberto = False
+    async for linha in _linhas_texto(request):
+        fila.append(linha)
+        # Aspas em número ímpar: um campo entre aspas continua na próxima
+        # linha, e o leitor só pode ver o registro inteiro.
+        aberto ^= linha.count('"') % 2 == 1
+        if not aberto:
+            for valores in leitor:
+                yield valores
+    for valores in leitor:
+        yield valores
+
+
+async def _registros_csv(request: Request) -> AsyncIterator[Any]:
+    cabecalho = None
+    async for valores in _valores_csv(request):
+        if not valores:
+            continue
+        if cabecalho is None:
+            cabecalho = valores
+            continue
+        registro = dict(zip(cabecalho, valores))
+        for relacao in ('categoria', 'centro_treinamento'):
+            if relacao in registro:
+                registro[relacao] = {'nome': registro[relacao]}
+        yield registro
+
+
+def registros(request: Request) -> AsyncIterator[Any]:
+    content_type = request.headers.get('content-type', '')
+    media_type = content_type.split(';')[0].strip().lower()
+    if media_type == 'application/json':
+        return _registros_json(request)
+    if media_type in {'application/x-ndjson', 'application/jsonl'}:
+        return _registros_ndjson(request)
+    if media_type == 'text/csv':
+        return _registros_csv(request)
+    raise HTTPException(
+        status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        detail=(
+            'Envie application/json, application/x-ndjson ou text/csv '
+            f'(colunas: {",".join(COLUNAS_CSV)}).'
+        ),
+    )
+
+
+def _validar(registro: Any) -> AtletaIn | list[dict[str, Any]] | str:
+    if isinstance(registro, json.JSONDecodeError):
+        return f'JSON inválido: {registro.msg}'
+    try:
+        return AtletaIn.model_validate(registro)
+    except ValidationError as e:
+        return [
+            {'loc': error['loc'], 'msg': error['msg'], 'type': error['type']}
+            for error in e.errors()
+        ]
+
+
+async def _resolver_nomes(
+    db_session: AsyncSession,
+    atletas: list[AtletaIn],
+    categorias: dict[str, int],
+    centros: dict[str, int],
+) -> None:
+    novas_categorias = {
+        a.categoria.nome for a in atletas if a.categoria.nome not in categorias
+    }
+    novos_centros = {
+        a.centro_treinamento.nome
+        for a in atletas
+        if a.centro_treinamento.nome not in centros
+    }
+    if not novas_categorias and not novos_centros:
+        return
+
+    stmt = union_all(
+        select(
+            literal('categoria').label('tipo'),
+            CategoriaModel.nome,
+            CategoriaModel.pk_id,
+        ).where(CategoriaModel.nome.in_(novas_categorias)),
+        select(
+            literal('centro_treinamento').label('tipo'),
+            CentroTreinamentoModel.nome,
+            CentroTreinamentoModel.pk_id,
+        ).where(CentroTreinamentoModel.nome.in_(novos_centros)),
+    )
+    for tipo, nome, pk_id in await db_session.execute(stmt):
+        destino = categorias if tipo == 'categoria' else centros
+        destino[nome] = pk_id
+
+
+async def _inserir(
+    db_session: AsyncSession, valores: list[dict[str, Any]]
+) -> set[str]:
+    stmt = (
+        insert(AtletaModel)
+        .values(valores)
+        .on_conflict_do_nothing(index_elements=[AtletaModel.cpf])
+        .returning(AtletaModel.cpf)
+    )
+    return set((await db_session.execute(stmt)).scalars())
+
+
+async def _importar_lote(
+    db_session: AsyncSession,
+    lote: list[tuple[int, AtletaIn]],
+    categorias: dict[str, int],
+    centros: dict[str, int],
+    erros: list[AtletaBulkErro],
+) -> int:
+    await _resolver_nomes(
+        db_session, [a for _, a in lote], categorias, centros
+    )
+
+    valores: dict[str, dict[str, Any]] = {}
+    linhas: dict[str, int] = {}
+    for linha, atleta in lote:
+        categoria_nome = atleta.categoria.nome
+        centro_nome = atleta.centro_treinamento.nome
+        if categoria_nome not in categorias:
+            erros.append(
+                AtletaBulkErro(
+                    linha=linha,
+                    detalhe=f'A categoria {categoria_nome}'
+                    ' não foi encontrada.',
+                )
+            )
+            continue
+        if centro_nome not in centros:
+            erros.append(
+                AtletaBulkErro(
+                    linha=linha,
+                    detalhe=f'O centro de treinamento {centro_nome}'
+                    ' não foi encontrado.',
+                )
+            )
+            continue
+        valores[atleta.cpf] = {
+            'id': uuid4(),
+            **atleta.model_dump(exclude={'categoria', 'centro_treinamento'}),
+            'categoria_id': categorias[categoria_nome],
+            'centro_treinamento_id': centros[centro_nome],
+        }
+        linhas[atleta.cpf] = linha
+
+    if not valores:
+        return 0
+
+    recusados: set[str] = set()
+    try:
+        async with db_session.begin_nested():
+            inseridos = await _inserir(db_session, list(valores.values()))
+    except DBAPIError:
+        # O banco recusou alguma linha; o SAVEPOINT desfez só este lote,
+        # que é refeito linha a linha para apontar qual.
+        inseridos = set()
+        for cpf, valor in valores.items():
+            try:
+                async with db_session.begin_nested():
+                    inseridos |= await _inserir(db_session, [valor])
+            except DBAPIError as e:
+                recusados.add(cpf)
+                erros.append(
+                    AtletaBulkErro(
+                        linha=linhas[cpf],
+                        detalhe='O banco recusou o registro: '
+                        f'{str(e.orig).splitlines()[0]}',
+                    )
+                )
+    for cpf in valores.keys() - inseridos - recusados:
+        erros.append(
+            AtletaBulkErro(
+                linha=linhas[cpf],
+                detalhe=f'Já existe um atleta cadastrado com o cpf: {cpf}',
+            )
+        )
+    return len(inseridos)
+
+
+async def importar(
+    db_session: AsyncSession, registros: AsyncIterator[Any]
+) -> AtletaBulkOut:
+    """Valida, resolve as relações e insere os atletas em lotes.
+
+    Cada lote custa uma consulta para resolver os nomes ainda não vistos
+    de categorias e centros e um `INSERT ... ON CONFLICT (cpf) DO NOTHING`
+    com várias linhas, dentro de um SAVEPOINT: se o banco recusar alguma
+    linha, só aquele lote é refeito, linha a linha. Linhas com erro são
+    reportadas sem abortar o resto.
+    """
+    categorias: dict[str, int] = {}
+    centros: dict[str, int] = {}
+    cpfs_vistos: set[str] = set()
+    erros: list[AtletaBulkErro] = []
+    lote: list[tuple[int, AtletaIn]] = []
+    inseridos = 0
+    linha = 0
+
+    async for registro in registros:
+        linha += 1
+        atleta = _validar(registro)
+        if not isinstance(atleta, AtletaIn):
+            erros.append(AtletaBulkErro(linha=linha, detalhe=atleta))
+            continue
+        if atleta.cpf in cpfs_vistos:
+            erros.append(
+                AtletaBulkErro(
+                    linha=linha,
+                    detalhe=f'CPF {atleta.cpf} repetido na importação.',
+                )
+            )
+            continue
+        cpfs_vistos.add(atleta.cpf)
+        lote.append((linha, atleta))
+        if len(lote) >= TAMANHO_LOTE:
+            inseridos += await _importar_lote(
+                db_session, lote, categorias, centros, erros
+            )
+            lote = []
+
+    if lote:
+        inseridos += await _importar_lote(
+            db_session, lote, categorias, centros, erros
+        )
+    await db_session.commit()
+
+    erros.sort(key=lambda erro: erro.linha)
+    return AtletaBulkOut(total=linha, inseridos=inseridos, erros=erros)
@@ -1,32 +1,155 @@
-import datetime
 from typing import Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Body, Depends, HTTPException, status
-from fastapi_pagination import Page
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from fastapi_pagination.cursor import CursorPage
 from pydantic import UUID4
-from sqlalchemy import Select, select
+from sqlalchemy import Insert, Select, insert, literal, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
+from workout_api.atleta import bulk, export
+from workout_api.atleta.listagem import (
+    ORDEM_CURSOR,
+    RELACOES,
+    filtrar,
+    ordenar,
+    select_campos,
+    select_listagem,
+)
 from workout_api.atleta.models import AtletaModel
 from workout_api.atleta.schemas import (
+    AtletaBulkOut,
+    AtletaFiltroSchema,
     AtletaIn,
     AtletaListagemOut,
     AtletaOut,
     AtletaUpdate,
+    OrdemAtleta,
     get_filtro_query,
 )
+from workout_api.categorias.cache import categoria_ids
 from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.cache import centro_treinamento_ids
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.contrib.batch import BatchGetIn, BatchGetOut, batch_get
+from workout_api.contrib.campos import (
+    Campos,
+    campos_query,
+    modelo_parcial,
+    resposta_json,
+)
 from workout_api.contrib.dependencies import (
-    AtletaFiltroQuery,
+    ContagemQuery,
+    CursorParamsDependency,
     DatabaseDependency,
+    LeituraDependency,
     ParamsDependency,
 )
+from workout_api.contrib.pagination import (
+    Pagina,
+    paginate,
+    paginate_cursor,
+)
+from workout_api.contrib.repository import atualizar, remover
+from workout_api.contrib.routing import RotaJsonRapida
+
+router = APIRouter(route_class=RotaJsonRapida)
+
+
+# Colunas de `AtletaOut` para o RETURNING das escritas; as relações
+# entram pelo `UPDATE ... FROM` com as junções abaixo.
+_COLUNAS_SAIDA = (
+    AtletaModel.id,
+    AtletaModel.created_at,
+    AtletaModel.nome,
+    AtletaModel.cpf,
+    AtletaModel.idade,
+    AtletaModel.peso,
+    AtletaModel.altura,
+    AtletaModel.sexo,
+    CategoriaModel.nome.label('categoria_nome'),
+    CentroTreinamentoModel.nome.label('centro_treinamento_nome'),
+)
+_JUNCOES = (
+    CategoriaModel.pk_id == AtletaModel.categoria_id,
+    CentroTreinamentoModel.pk_id == AtletaModel.centro_treinamento_id,
+)
+
 
-router = APIRouter()
+def _select_completo() -> Select:
+    return select(AtletaModel).options(
+        joinedload(AtletaModel.categoria, innerjoin=True),
+        joinedload(AtletaModel.centro_treinamento, innerjoin=True),
+    )
+
+
+def _insert_atleta(atleta_in: AtletaIn) -> Insert:
+    """`INSERT INTO atletas ... SELECT ... RETURNING` em um round trip.
+
+    As chaves estrangeiras são resolvidas pelo próprio SELECT; as que já
+    estão no cache de nomes entram como literais e a tabela sai do FROM.
+    """
+    colunas = AtletaModel.__table__.c
+    valores = {
+        'id': uuid4(),
+        **atleta_in.model_dump(exclude={'categoria', 'centro_treinamento'}),
+    }
+    campos = [
+        literal(valor, type_=colunas[chave].type).label(chave)
+        for chave, valor in valores.items()
+    ]
+    filtros = []
+    for chave, cache, modelo, nome in (
+        (
+            'categoria_id',
+            categoria_ids,
+            CategoriaModel,
+            atleta_in.categoria.nome,
+        ),
+        (
+            'centro_treinamento_id',
+            centro_treinamento_ids,
+            CentroTreinamentoModel,
+            atleta_in.centro_treinamento.nome,
+        ),
+    ):
+        pk_id = cache.conhecido(nome)
+        if pk_id is None:
+            campos.append(modelo.pk_id.label(chave))
+            filtros.append(modelo.nome == nome)
+        else:
+            campos.append(
+                literal(pk_id, type_=colunas[chave].type).label(chave)
+            )
+
+    return (
+        insert(AtletaModel)
+        .from_select(
+            [campo.name for campo in campos], select(*campos).where(*filtros)
+        )
+        .returning(
+            AtletaModel.id,
+            AtletaModel.created_at,
+            AtletaModel.nome,
+            AtletaModel.cpf,
+            AtletaModel.idade,
+            AtletaModel.peso,
+            AtletaModel.altura,
+            AtletaModel.sexo,
+            AtletaModel.categoria_id,
+            AtletaModel.centro_treinamento_id,
+        )
+    )
 
 
 @router.post(
@@ -40,75 +163,170 @@ async def post(
 ):
     categoria_nome = atleta_in.categoria.nome
     centro_treinamento_nome = atleta_in.centro_treinamento.nome
-    stmt: Select = select(CategoriaModel).filter_by(nome=categoria_nome)
-    categoria = (await db_session.execute(stmt)).scalars().first()
-
-    if not categoria:
+    cpf_atleta: str = atleta_in.cpf
+    stmt = _insert_atleta(atleta_in)
+    try:
+        atleta = (await db_session.execute(stmt)).mappings().first()
+        await db_session.commit()
+    except IntegrityError:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f'A categoria {categoria_nome} não foi encontrada.',
+            status_code=status.HTTP_303_SEE_OTHER,
+            detail=f'Já existe um atleta cadastrado com o cpf: {cpf_atleta}',
         )
-    stmt: Select = select(CentroTreinamentoModel).filter_by(
-        nome=centro_treinamento_nome
-    )
-    centro_treinamento = (await db_session.execute(stmt)).scalars().first()
 
-    if not centro_treinamento:
+    if atleta is None:
+        # Nenhuma linha no SELECT: um dos nomes não existe. Só este
+        # caminho de erro paga as consultas extras para dizer qual.
+        if await categoria_ids.pk_id(db_session, categoria_nome) is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f'A categoria {categoria_nome} não foi encontrada.',
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f'O centro de treinamento {centro_treinamento_nome}'
             ' não foi encontrado.',
         )
-    cpf_atleta: str = atleta_in.cpf
-    try:
-        atleta_out = AtletaOut(
-            id=uuid4(),
-            created_at=datetime.datetime.now(datetime.timezone.utc),
-            **atleta_in.model_dump(),
-        )
-        atleta_model = AtletaModel(
-            **atleta_out.model_dump(
-                exclude={'categoria', 'centro_treinamento'}
-            )
-        )
 
-        atleta_model.categoria_id = categoria.pk_id
-        atleta_model.centro_treinamento_id = centro_treinamento.pk_id
+    atleta = dict(atleta)
+    categoria_ids.lembrar(categoria_nome, atleta.pop('categoria_id'))
+    centro_treinamento_ids.lembrar(
+        centro_treinamento_nome, atleta.pop('centro_treinamento_id')
+    )
+    return AtletaOut(
+        **atleta,
+        categoria={'nome': categoria_nome},
+        centro_treinamento={'nome': centro_treinamento_nome},
+    )
+
+
+@router.post(
+    '/bulk',
+    summary='Importar atletas em lote',
+    status_code=status.HTTP_201_CREATED,
+    response_model=AtletaBulkOut,
+    openapi_extra={
+        'requestBody': {
+            'required': True,
+            'content': {
+                'application/json': {
+                    'schema': {
+                        'type': 'array',
+                        'items': {'$ref': '#/components/schemas/AtletaIn'},
+                    }
+                },
+                'application/x-ndjson': {'schema': {'type': 'string'}},
+                'text/csv': {'schema': {'type': 'string'}},
+            },
+        }
+    },
+)
+async def post_bulk(
+    request: Request, db_session: DatabaseDependency
+) -> AtletaBulkOut:
+    return await bulk.importar(db_session, bulk.registros(request))
 
-        db_session.add(atleta_model)
-        await db_session.commit()
-    except IntegrityError:
-        raise HTTPException(
-            status_code=status.HTTP_303_SEE_OTHER,
-            detail=f'Já existe um atleta cadastrado com o cpf: {cpf_atleta}',
-        )
 
-    return atleta_out
+@router.post(
+    '/batch-get',
+    summary='Consulta vários Atletas pelos ids',
+    status_code=status.HTTP_200_OK,
+    response_model=BatchGetOut[AtletaOut],
+)
+async def batch_get_atletas(
+    db_session: LeituraDependency, batch_in: BatchGetIn = Body(...)
+) -> BatchGetOut[AtletaOut]:
+    return await batch_get(
+        db_session, _select_completo(), AtletaModel, batch_in.ids, AtletaOut
+    )
 
 
 @router.get(
     '/',
-    summary='Filtra atleta por nome ou CPF',
+    summary='Filtra e ordena atletas',
     status_code=status.HTTP_200_OK,
-    response_model=Page[AtletaListagemOut],
+    response_model=Pagina[AtletaListagemOut],
 )
-async def query(
-    db_session: DatabaseDependency,
+async def query(  # noqa: PLR0913, PLR0917
+    db_session: LeituraDependency,
     params: ParamsDependency,
-    filtro: AtletaFiltroQuery = Depends(get_filtro_query),
-) -> Page[AtletaListagemOut]:
-    stmt: Select = select(AtletaModel).options(
-        selectinload(AtletaModel.categoria),
-        selectinload(AtletaModel.centro_treinamento),
+    filtro: Optional[AtletaFiltroSchema] = Depends(get_filtro_query),
+    contagem: ContagemQuery = 'exata',
+    order_by: OrdemAtleta = Query(
+        'created_at',
+        description='Coluna da ordenação; "-" na frente inverte o sentido',
+    ),
+    campos: Optional[Campos] = Depends(campos_query(AtletaListagemOut)),
+) -> Pagina[AtletaListagemOut]:
+    stmt = ordenar(filtrar(select_listagem(campos), filtro), order_by)
+
+    if campos is None:
+        return await paginate(
+            db_session,
+            stmt,
+            params,
+            contagem,
+            page_cls=Pagina[AtletaListagemOut],
+        )
+    modelo = modelo_parcial(AtletaListagemOut, campos)
+    return resposta_json(
+        await paginate(
+            db_session, stmt, params, contagem, page_cls=Pagina[modelo]
+        )
     )
-    if filtro:
-        if filtro.cpf:
-            stmt = stmt.where(AtletaModel.cpf == filtro.cpf)
-        if filtro.nome:
-            stmt = stmt.where(AtletaModel.nome.ilike(f'%{filtro.nome}%'))
 
-    page = await paginate(db_session, stmt, params=params)
-    return page
+
+@router.get(
+    '/cursor',
+    summary='Filtra atleta por nome ou CPF paginando por cursor',
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[AtletaListagemOut],
+)
+async def query_cursor(
+    db_session: LeituraDependency,
+    params: CursorParamsDependency,
+    filtro: Optional[AtletaFiltroSchema] = Depends(get_filtro_query),
+) -> CursorPage[AtletaListagemOut]:
+    stmt = filtrar(select_listagem(), filtro)
+
+    return await paginate_cursor(
+        db_session,
+        stmt,
+        params,
+        ordem=ORDEM_CURSOR,
+        page_cls=CursorPage[AtletaListagemOut],
+    )
+
+
+@router.get(
+    '/export',
+    summary='Exporta os atletas filtrados em NDJSON ou CSV',
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            'content': {
+                media_type: {'schema': {'type': 'string'}}
+                for media_type in export.MEDIA_TYPES.values()
+            }
+        }
+    },
+)
+async def exportar(
+    db_session: LeituraDependency,
+    filtro: Optional[AtletaFiltroSchema] = Depends(get_filtro_query),
+    formato: export.FormatoExport = Query(
+        'ndjson', description='Formato de cada linha da exportação'
+    ),
+) -> StreamingResponse:
+    stmt = filtrar(export.select_export(), filtro)
+    return StreamingResponse(
+        export.exportar(db_session, stmt, formato),
+        media_type=export.MEDIA_TYPES[formato],
+        headers={
+            'Content-Disposition': f'attachment; filename="atletas.{formato}"'
+        },
+    )
 
 
 @router.get(
@@ -117,10 +335,20 @@ async def query(
     status_code=status.HTTP_200_OK,
     response_model=AtletaOut,
 )
-async def get(id: UUID4, db_session: DatabaseDependency) -> AtletaOut:
-    stmt: Select = select(AtletaModel).filter_by(id=id)
-    query_result = await db_session.execute(stmt)
-    atleta: Optional[AtletaOut] = query_result.scalars().first()
+async def get(
+    id: UUID4,
+    db_session: LeituraDependency,
+    campos: Optional[Campos] = Depends(campos_query(AtletaOut)),
+) -> AtletaOut:
+    if campos is None:
+        stmt: Select = _select_completo().filter_by(id=id)
+        atleta = (await db_session.execute(stmt)).scalars().first()
+    else:
+        # Só as colunas pedidas; as relações só entram se pedidas.
+        stmt = select_campos(
+            campo for campo in AtletaOut.model_fields if campo in campos
+        ).where(AtletaModel.id == id)
+        atleta = (await db_session.execute(stmt)).mappings().first()
 
     if not atleta:
         raise HTTPException(
@@ -128,7 +356,15 @@ async def get(id: UUID4, db_session: DatabaseDependency) -> AtletaOut:
             detail=f'Atleta não encontrado no id: {id}',
         )
 
-    return atleta
+    if campos is None:
+        return atleta
+    atleta = {
+        campo: {'nome': valor} if campo in RELACOES else valor
+        for campo, valor in atleta.items()
+    }
+    return resposta_json(
+        modelo_parcial(AtletaOut, campos).model_validate(atleta)
+    )
 
 
 @router.patch(
@@ -142,23 +378,27 @@ async def patch(
     db_session: DatabaseDependency,
     atleta_up: AtletaUpdate = Body(...),
 ) -> AtletaOut:
-    stmt = select(AtletaModel).filter_by(id=id)
-    query_result = await db_session.execute(stmt)
-    atleta: Optional[AtletaModel] = query_result.scalars().first()
-    if not atleta:
+    atleta = await atualizar(
+        db_session,
+        AtletaModel,
+        id,
+        atleta_up.model_dump(exclude_unset=True),
+        _COLUNAS_SAIDA,
+        *_JUNCOES,
+    )
+    if atleta is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f'Atleta não encontrado no id: {id}',
         )
-
-    atleta_update = atleta_up.model_dump(exclude_unset=True)
-    for key, value in atleta_update.items():
-        setattr(atleta, key, value)
-
     await db_session.commit()
-    await db_session.refresh(atleta)
 
-    return AtletaOut.model_validate(atleta)
+    atleta = dict(atleta)
+    categoria = {'nome': atleta.pop('categoria_nome')}
+    centro_treinamento = {'nome': atleta.pop('centro_treinamento_nome')}
+    return AtletaOut(
+        **atleta, categoria=categoria, centro_treinamento=centro_treinamento
+    )
 
 
 @router.delete(
@@ -167,15 +407,9 @@ async def patch(
     status_code=status.HTTP_204_NO_CONTENT,
 )
 async def delete(id: UUID4, db_session: DatabaseDependency) -> None:
-    stmt: Select = select(AtletaModel).filter_by(id=id)
-    query_result = await db_session.execute(stmt)
-    atleta: Optional[AtletaModel] = query_result.scalars().first()
-
-    if not atleta:
+    if await remover(db_session, AtletaModel, id) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f'Atleta não encontrado no id: {id}',
         )
-
-    await db_session.delete(atleta)
     await db_session.commit()
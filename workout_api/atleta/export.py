@@ -0,0 +1,85 @@
+import csv
+import io
+from typing import AsyncIterator, Literal
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.schemas import AtletaExportOut
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+
+FormatoExport = Literal['ndjson', 'csv']
+
+MEDIA_TYPES: dict[FormatoExport, str] = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+LINHAS_POR_LOTE = 1000
+
+
+def select_export() -> Select:
+    return (
+        select(
+            AtletaModel.id,
+            AtletaModel.created_at,
+            AtletaModel.nome,
+            AtletaModel.cpf,
+            AtletaModel.idade,
+            AtletaModel.peso,
+            AtletaModel.altura,
+            AtletaModel.sexo,
+            CategoriaModel.nome.label('categoria'),
+            CentroTreinamentoModel.nome.label('centro_treinamento'),
+        )
+        .join(AtletaModel.categoria)
+        .join(AtletaModel.centro_treinamento)
+        # Ordem estável, servida pelo índice de keyset.
+        .order_by(AtletaModel.created_at, AtletaModel.pk_id)
+    )
+
+
+def _ndjson(lote) -> bytes:
+    return b''.join(
+        AtletaExportOut.model_validate(linha._mapping)
+        .model_dump_json()
+        .encode()
+        + b'\n'
+        for linha in lote
+    )
+
+
+def _csv(lote) -> bytes:
+    saida = io.StringIO()
+    writer = csv.writer(saida)
+    for linha in lote:
+        writer.writerow(
+            AtletaExportOut.model_validate(linha._mapping)
+            .model_dump(mode='json')
+            .values()
+        )
+    return saida.getvalue().encode()
+
+
+async def exportar(
+    db_session: AsyncSession, stmt: Select, formato: FormatoExport
+) -> AsyncIterator[bytes]:
+    """Serializa o resultado de `stmt` em lotes de um cursor no servidor.
+
+    A memória fica limitada a um lote, qualquer que seja o total. Roda
+    depois que o handler já retornou, quando a dependência da sessão já
+    saiu, então fecha a sessão ela mesma ao terminar.
+    """
+    try:
+        if formato == 'csv':
+            yield ','.join(AtletaExportOut.model_fields).encode() + b'\r\n'
+        serializar = _csv if formato == 'csv' else _ndjson
+        resultado = await db_session.stream(
+            stmt.execution_options(yield_per=LINHAS_POR_LOTE)
+        )
+        async for lote in resultado.partitions():
+            yield serializar(lote)
+    finally:
+        await db_session.close()
@@ -0,0 +1,158 @@
+from typing import Any, Iterable, Optional
+
+from fastapi_pagination.cursor import CursorPage, CursorParams
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.schemas import (
+    AtletaFiltroSchema,
+    AtletaListagemOut,
+    OrdemAtleta,
+)
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.contrib.campos import Campos
+from workout_api.contrib.models import BaseModel
+from workout_api.contrib.pagination import paginate_cursor
+from workout_api.contrib.search import filtro_busca
+
+ORDEM_CURSOR = (AtletaModel.created_at, AtletaModel.pk_id)
+
+# `order_by` aceito pela listagem -> coluna indexada. O pk_id desempata
+# no mesmo sentido, então cada ordem é total e o índice `(coluna, pk_id)`
+# serve tanto a leitura para frente quanto a de trás para frente.
+COLUNAS_ORDEM = {
+    'created_at': AtletaModel.created_at,
+    'nome': AtletaModel.nome,
+    'idade': AtletaModel.idade,
+    'peso': AtletaModel.peso,
+}
+
+
+# Campos dos schemas de saída que vêm do nome de uma relação.
+RELACOES = {
+    'categoria': (AtletaModel.categoria, CategoriaModel),
+    'centro_treinamento': (
+        AtletaModel.centro_treinamento,
+        CentroTreinamentoModel,
+    ),
+}
+
+
+def select_campos(campos: Iterable[str]) -> Select:
+    """Projeção só com as colunas de `campos`, na ordem dada.
+
+    Campos de relação viram o nome do pai, com rótulo igual ao campo, e
+    só eles trazem o JOIN da sua tabela.
+    """
+    colunas = []
+    juncoes = []
+    for campo in campos:
+        if campo in RELACOES:
+            relacao, modelo = RELACOES[campo]
+            colunas.append(modelo.nome.label(campo))
+            juncoes.append(relacao)
+        else:
+            colunas.append(getattr(AtletaModel, campo))
+    stmt = select(*colunas).select_from(AtletaModel)
+    for relacao in juncoes:
+        stmt = stmt.join(relacao)
+    return stmt
+
+
+def select_listagem(campos: Optional[Campos] = None) -> Select:
+    """Projeção só com as colunas de `AtletaListagemOut`.
+
+    Devolve `Row`s em vez de entidades: sem identity map, sem hidratar
+    relacionamentos e sem passar pelo `model_validator` do schema. Com
+    `campos`, fica só com os pedidos.
+    """
+    return select_campos(
+        campo
+        for campo in AtletaListagemOut.model_fields
+        if campos is None or campo in campos
+    )
+
+
+def filtrar(stmt: Select, filtro: Optional[AtletaFiltroSchema]) -> Select:
+    if filtro:
+        if filtro.cpf:
+            stmt = stmt.where(AtletaModel.cpf == filtro.cpf)
+        if filtro.nome:
+            stmt = stmt.where(
+                filtro_busca(
+                    AtletaModel.nome,
+                    filtro.nome,
+                    modo=filtro.busca,
+                    sem_acento=filtro.sem_acento,
+                )
+            )
+        # Os nomes viram o pk_id por subquery escalar: o filtro fica
+        # `categoria_id = $1` e usa o índice `(categoria_id, created_at,
+        # pk_id)` em vez de filtrar o JOIN.
+        for chave, modelo, nome in (
+            (AtletaModel.categoria_id, CategoriaModel, filtro.categoria),
+            (
+                AtletaModel.centro_treinamento_id,
+                CentroTreinamentoModel,
+                filtro.centro_treinamento,
+            ),
+        ):
+            if nome:
+                stmt = stmt.where(
+                    chave
+                    == select(modelo.pk_id)
+                    .where(modelo.nome == nome)
+                    .scalar_subquery()
+                )
+        if filtro.sexo:
+            stmt = stmt.where(AtletaModel.sexo == filtro.sexo)
+        if filtro.idade_min is not None:
+            stmt = stmt.where(AtletaModel.idade >= filtro.idade_min)
+        if filtro.idade_max is not None:
+            stmt = stmt.where(AtletaModel.idade <= filtro.idade_max)
+        if filtro.peso_min is not None:
+            stmt = stmt.where(AtletaModel.peso >= filtro.peso_min)
+        if filtro.peso_max is not None:
+            stmt = stmt.where(AtletaModel.peso <= filtro.peso_max)
+    return stmt
+
+
+def ordenar(stmt: Select, order_by: OrdemAtleta) -> Select:
+    """Aplica `order_by` (`-` na frente inverte) com desempate por pk_id."""
+    coluna = COLUNAS_ORDEM[order_by.lstrip('-')]
+    if order_by.startswith('-'):
+        return stmt.order_by(coluna.desc(), AtletaModel.pk_id.desc())
+    return stmt.order_by(coluna, AtletaModel.pk_id)
+
+
+async def paginar_da_relacao(
+    db_session: AsyncSession,
+    params: CursorParams,
+    modelo: type[BaseModel],
+    chave: InstrumentedAttribute,
+    id: Any,
+) -> Optional[CursorPage[AtletaListagemOut]]:
+    """Atletas de uma categoria ou centro, paginados por keyset.
+
+    O pk_id do pai entra como subquery escalar, e não por JOIN, para que
+    o filtro seja `chave = $1` e o índice `(chave, created_at, pk_id)`
+    entregue as linhas já na ordem do cursor, sem ordenar nada. Só uma
+    primeira página vazia paga a consulta extra que distingue "pai sem
+    atletas" de "pai inexistente"; no segundo caso devolve `None`.
+    """
+    pk_id_pai = select(modelo.pk_id).where(modelo.id == id).scalar_subquery()
+    pagina = await paginate_cursor(
+        db_session,
+        select_listagem().where(chave == pk_id_pai),
+        params,
+        ordem=ORDEM_CURSOR,
+        page_cls=CursorPage[AtletaListagemOut],
+    )
+    if not pagina.items and not params.cursor:
+        stmt = select(modelo.pk_id).where(modelo.id == id)
+        if (await db_session.execute(stmt)).scalar() is None:
+            return None
+    return pagina
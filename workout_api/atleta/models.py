@@ -1,14 +1,59 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import text
+from sqlalchemy.sql import func, text
 
 from workout_api.contrib.models import BaseModel
 
 
 class AtletaModel(BaseModel):
     __tablename__ = 'atletas'
+    __table_args__ = (
+        Index('ix_atletas_created_at_pk_id', 'created_at', 'pk_id'),
+        # Servem às FKs (JOIN, filtro e checagem ao remover o pai) e às
+        # listagens por pai, já na ordem do cursor.
+        Index(
+            'ix_atletas_categoria_id_created_at_pk_id',
+            'categoria_id',
+            'created_at',
+            'pk_id',
+        ),
+        Index(
+            'ix_atletas_centro_treinamento_id_created_at_pk_id',
+            'centro_treinamento_id',
+            'created_at',
+            'pk_id',
+        ),
+        # Ordenações de `order_by`; também servem aos filtros de faixa de
+        # idade e peso.
+        Index('ix_atletas_nome_pk_id', 'nome', 'pk_id'),
+        Index('ix_atletas_idade_pk_id', 'idade', 'pk_id'),
+        Index('ix_atletas_peso_pk_id', 'peso', 'pk_id'),
+        # Filtro por sexo na ordem padrão da listagem.
+        *(
+            Index(
+                f'ix_atletas_created_at_pk_id_sexo_{sexo.lower()}',
+                'created_at',
+                'pk_id',
+                postgresql_where=text(f"sexo = '{sexo}'"),
+            )
+            for sexo in 'MF'
+        ),
+        Index(
+            'ix_atletas_nome_trgm',
+            'nome',
+            postgresql_using='gin',
+            postgresql_ops={'nome': 'gin_trgm_ops'},
+        ),
+        # Busca sem acento (`f_unaccent`, criada em `contrib.models`).
+        Index(
+            'ix_atletas_nome_unaccent_trgm',
+            func.f_unaccent(text('nome')).label('nome_sem_acento'),
+            postgresql_using='gin',
+            postgresql_ops={'nome_sem_acento': 'gin_trgm_ops'},
+        ),
+    )
 
     pk_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     nome: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -18,7 +63,7 @@ class AtletaModel(BaseModel):
     altura: Mapped[float] = mapped_column(Float, nullable=False)
     sexo: Mapped[str] = mapped_column(String(1), nullable=False)
     categoria: Mapped['CategoriaModel'] = relationship(  # noqa: F821 # type: ignore
-        back_populates='atleta', lazy='selectin'
+        back_populates='atleta', lazy='raise'
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -27,7 +72,7 @@ class AtletaModel(BaseModel):
     )
     categoria_id: Mapped[int] = mapped_column(ForeignKey('categorias.pk_id'))
     centro_treinamento: Mapped['CentroTreinamentoModel'] = relationship(  # noqa: F821 # type: ignore
-        back_populates='atleta', lazy='selectin'
+        back_populates='atleta', lazy='raise'
     )
     centro_treinamento_id: Mapped[int] = mapped_column(
         ForeignKey('centros_treinamento.pk_id')
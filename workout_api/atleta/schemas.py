@@ -1,10 +1,11 @@
 from http import HTTPStatus
-from typing import Annotated, Optional
+from typing import Annotated, Any, Literal, Optional, Union
 
 from fastapi import HTTPException, Query
 from pydantic import (
     BaseModel,
     Field,
+    NonNegativeInt,
     PositiveFloat,
     StringConstraints,
     ValidationError,
@@ -16,6 +17,10 @@ from workout_api.atleta.models import AtletaModel
 from workout_api.categorias.schemas import CategoriaIn
 from workout_api.centro_treinamento.schemas import CentroTreinamentoAtleta
 from workout_api.contrib.schemas import BaseSchema, OutMixin
+from workout_api.contrib.search import ModoBusca
+
+# Maior valor de uma coluna `integer` do Postgres.
+MAX_INTEGER = 2**31 - 1
 
 
 class Atleta(BaseSchema):
@@ -31,12 +36,25 @@ class Atleta(BaseSchema):
             max_length=11,
         ),
     ]
-    idade: Annotated[int, Field(description='Idade do atleta', examples=[25])]
+    idade: Annotated[
+        int,
+        Field(
+            description='Idade do atleta', examples=[25], ge=0, le=MAX_INTEGER
+        ),
+    ]
     peso: Annotated[
-        PositiveFloat, Field(description='Peso do atleta', examples=[75.5])
+        PositiveFloat,
+        Field(
+            description='Peso do atleta', examples=[75.5], allow_inf_nan=False
+        ),
     ]
     altura: Annotated[
-        PositiveFloat, Field(description='Altura do atleta', examples=[1.70])
+        PositiveFloat,
+        Field(
+            description='Altura do atleta',
+            examples=[1.70],
+            allow_inf_nan=False,
+        ),
     ]
     sexo: Annotated[
         str, Field(description='Sexo do atleta', examples=['M'], max_length=1)
@@ -74,6 +92,18 @@ class AtletaListagemOut(OutMixin):
                 'categoria': data.categoria.nome,
                 'centro_treinamento': data.centro_treinamento.nome,
             }
+        return data
+
+
+class AtletaExportOut(OutMixin):
+    nome: str
+    cpf: str
+    idade: int
+    peso: float
+    altura: float
+    sexo: str
+    categoria: str
+    centro_treinamento: str
 
 
 class AtletaUpdate(BaseSchema):
@@ -88,10 +118,50 @@ class AtletaUpdate(BaseSchema):
     ]
     idade: Annotated[
         Optional[int],
-        Field(None, description='Idade do atleta', examples=[25]),
+        Field(
+            None,
+            description='Idade do atleta',
+            examples=[25],
+            ge=0,
+            le=MAX_INTEGER,
+        ),
+    ]
+
+
+class AtletaBulkErro(BaseModel):
+    linha: Annotated[
+        int, Field(description='Posição do registro no corpo, a partir de 1')
+    ]
+    detalhe: Annotated[
+        Union[str, list[dict[str, Any]]],
+        Field(description='Motivo pelo qual o registro não foi importado'),
     ]
 
 
+class AtletaBulkOut(BaseModel):
+    total: Annotated[int, Field(description='Registros recebidos')]
+    inseridos: Annotated[int, Field(description='Atletas criados')]
+    erros: Annotated[
+        list[AtletaBulkErro], Field(description='Registros rejeitados')
+    ]
+
+
+OrdemAtleta = Literal[
+    'created_at',
+    '-created_at',
+    'nome',
+    '-nome',
+    'idade',
+    '-idade',
+    'peso',
+    '-peso',
+]
+
+NomeFiltro = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1, max_length=50)
+]
+
+
 class AtletaFiltroSchema(BaseModel):
     nome: Optional[
         Annotated[
@@ -104,6 +174,15 @@ class AtletaFiltroSchema(BaseModel):
             str, StringConstraints(strip_whitespace=True, pattern=r'^\d{11}$')
         ]
     ] = None
+    busca: ModoBusca = 'contem'
+    sem_acento: bool = False
+    categoria: Optional[NomeFiltro] = None
+    centro_treinamento: Optional[NomeFiltro] = None
+    sexo: Optional[Literal['M', 'F']] = None
+    idade_min: Optional[NonNegativeInt] = None
+    idade_max: Optional[NonNegativeInt] = None
+    peso_min: Optional[PositiveFloat] = None
+    peso_max: Optional[PositiveFloat] = None
 
     @field_validator('cpf')
     def validar_cpf(cls, v):
@@ -111,15 +190,54 @@ class AtletaFiltroSchema(BaseModel):
             raise ValueError('CPF não pode ter todos os dígitos iguais')
         return v
 
-
-def get_filtro_query(
-    nome: Optional[str] = Query(None),
-    cpf: Optional[str] = Query(None),
+    @model_validator(mode='after')
+    def validar_faixas(self):
+        for campo in ('idade', 'peso'):
+            minimo = getattr(self, f'{campo}_min')
+            maximo = getattr(self, f'{campo}_max')
+            if minimo is not None and maximo is not None and minimo > maximo:
+                raise ValueError(
+                    f'{campo}_min não pode ser maior que {campo}_max'
+                )
+        return self
+
+
+def get_filtro_query(  # noqa: PLR0913, PLR0917
+    nome: Optional[str] = Query(None, description='Filtro por nome'),
+    cpf: Optional[str] = Query(None, description='Filtro por CPF'),
+    busca: ModoBusca = Query(
+        'contem', description='Casa o nome por substring ou prefixo'
+    ),
+    sem_acento: bool = Query(
+        False, description='Ignora acentos ao filtrar por nome'
+    ),
+    categoria: Optional[str] = Query(None, description='Nome da categoria'),
+    centro_treinamento: Optional[str] = Query(
+        None, description='Nome do centro de treinamento'
+    ),
+    sexo: Optional[str] = Query(None, description='M ou F'),
+    idade_min: Optional[int] = Query(None, description='Idade mínima'),
+    idade_max: Optional[int] = Query(None, description='Idade máxima'),
+    peso_min: Optional[float] = Query(None, description='Peso mínimo'),
+    peso_max: Optional[float] = Query(None, description='Peso máximo'),
 ) -> Optional[AtletaFiltroSchema]:
+    filtros = {
+        'nome': nome,
+        'cpf': cpf,
+        'categoria': categoria,
+        'centro_treinamento': centro_treinamento,
+        'sexo': sexo,
+        'idade_min': idade_min,
+        'idade_max': idade_max,
+        'peso_min': peso_min,
+        'peso_max': peso_max,
+    }
     try:
-        if nome is None and cpf is None:
+        if all(valor is None for valor in filtros.values()):
             return None
-        return AtletaFiltroSchema(nome=nome, cpf=cpf)
+        return AtletaFiltroSchema(
+            **filtros, busca=busca, sem_acento=sem_acento
+        )
     except ValidationError as e:
         formatted_errors = [
             {
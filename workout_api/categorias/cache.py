@@ -0,0 +1,4 @@
+from workout_api.categorias.models import CategoriaModel
+from workout_api.contrib.cache import CacheDeNomes
+
+categoria_ids = CacheDeNomes(CategoriaModel, 'categorias')
@@ -1,20 +1,31 @@
 from typing import Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Body, HTTPException, status
-from fastapi_pagination import Page
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Body, HTTPException, Request, Response, status
+from fastapi_pagination.cursor import CursorPage
 from pydantic import UUID4
 from sqlalchemy import Select, select
 
+from workout_api.atleta.listagem import paginar_da_relacao
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.schemas import AtletaListagemOut
 from workout_api.categorias.models import CategoriaModel
 from workout_api.categorias.schemas import CategoriaIn, CategoriaOut
+from workout_api.contrib.batch import BatchGetIn, BatchGetOut, batch_get
+from workout_api.contrib.cache import invalidar_recurso
 from workout_api.contrib.dependencies import (
+    CacheDependency,
+    ContagemQuery,
+    CursorParamsDependency,
     DatabaseDependency,
+    LeituraDependency,
     ParamsDependency,
 )
+from workout_api.contrib.http_cache import responder
+from workout_api.contrib.pagination import Pagina, paginate
+from workout_api.contrib.routing import RotaJsonRapida
 
-router = APIRouter()
+router = APIRouter(route_class=RotaJsonRapida)
 
 
 @router.post(
@@ -24,29 +35,59 @@ router = APIRouter()
     response_model=CategoriaOut,
 )
 async def post(
-    db_session: DatabaseDependency, categoria_in: CategoriaIn = Body(...)
+    db_session: DatabaseDependency,
+    cache: CacheDependency,
+    categoria_in: CategoriaIn = Body(...),
 ) -> CategoriaOut:
     categoria_out = CategoriaOut(id=uuid4(), **categoria_in.model_dump())
     categoria_model = CategoriaModel(**categoria_out.model_dump())
 
     db_session.add(categoria_model)
+    await invalidar_recurso(db_session, 'categorias')
     await db_session.commit()
+    await cache.invalidar('categorias')
 
     return categoria_out
 
 
+@router.post(
+    '/batch-get',
+    summary='Consulta várias Categorias pelos ids',
+    status_code=status.HTTP_200_OK,
+    response_model=BatchGetOut[CategoriaOut],
+)
+async def batch_get_categorias(
+    db_session: LeituraDependency, batch_in: BatchGetIn = Body(...)
+) -> BatchGetOut[CategoriaOut]:
+    return await batch_get(
+        db_session,
+        select(CategoriaModel),
+        CategoriaModel,
+        batch_in.ids,
+        CategoriaOut,
+    )
+
+
 @router.get(
     '/',
     summary='Consultar todas as Categorias',
     status_code=status.HTTP_200_OK,
-    response_model=Page[CategoriaOut],
+    response_model=Pagina[CategoriaOut],
 )
 async def query(
-    db_session: DatabaseDependency, params: ParamsDependency
-) -> Page[CategoriaOut]:
-    stmt: Select = select(CategoriaModel)
-    page = await paginate(db_session, stmt, params=params)
-    return page
+    request: Request,
+    db_session: LeituraDependency,
+    cache: CacheDependency,
+    params: ParamsDependency,
+    contagem: ContagemQuery = 'exata',
+) -> Response:
+    async def gerar() -> Pagina[CategoriaOut]:
+        stmt: Select = select(CategoriaModel)
+        return await paginate(
+            db_session, stmt, params, contagem, page_cls=Pagina[CategoriaOut]
+        )
+
+    return await responder(request, cache, 'categorias', gerar)
 
 
 @router.get(
@@ -55,15 +96,45 @@ async def query(
     status_code=status.HTTP_200_OK,
     response_model=CategoriaOut,
 )
-async def get(id: UUID4, db_session: DatabaseDependency) -> CategoriaOut:
-    stmt: Select = select(CategoriaModel).filter_by(id=id)
-    query_result = await db_session.execute(stmt)
-    categoria: Optional[CategoriaOut] = query_result.scalar()
+async def get(
+    id: UUID4,
+    request: Request,
+    db_session: LeituraDependency,
+    cache: CacheDependency,
+) -> Response:
+    async def gerar() -> CategoriaOut:
+        stmt: Select = select(CategoriaModel).filter_by(id=id)
+        query_result = await db_session.execute(stmt)
+        categoria: Optional[CategoriaModel] = query_result.scalar()
+
+        if not categoria:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'Categoria não encontrada no id: {id}',
+            )
 
-    if not categoria:
+        return CategoriaOut.model_validate(categoria)
+
+    return await responder(request, cache, 'categorias', gerar)
+
+
+@router.get(
+    '/{id}/atletas',
+    summary='Lista os atletas de uma Categoria por cursor',
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[AtletaListagemOut],
+)
+async def atletas_da_categoria(
+    id: UUID4,
+    db_session: LeituraDependency,
+    params: CursorParamsDependency,
+) -> CursorPage[AtletaListagemOut]:
+    pagina = await paginar_da_relacao(
+        db_session, params, CategoriaModel, AtletaModel.categoria_id, id
+    )
+    if pagina is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f'Categoria não encontrada no id: {id}',
         )
-
-    return categoria
+    return pagina
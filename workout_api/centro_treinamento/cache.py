@@ -0,0 +1,6 @@
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.contrib.cache import CacheDeNomes
+
+centro_treinamento_ids = CacheDeNomes(
+    CentroTreinamentoModel, 'centros_treinamento'
+)
@@ -1,24 +1,35 @@
 from typing import Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Body, HTTPException, status
-from fastapi_pagination import Page
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Body, HTTPException, Request, Response, status
+from fastapi_pagination.cursor import CursorPage
 from pydantic import UUID4
 from sqlalchemy import Select, select
 from sqlalchemy.exc import IntegrityError
 
+from workout_api.atleta.listagem import paginar_da_relacao
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.schemas import AtletaListagemOut
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
 from workout_api.centro_treinamento.schemas import (
     CentroTreinamentoIn,
     CentroTreinamentoOut,
 )
+from workout_api.contrib.batch import BatchGetIn, BatchGetOut, batch_get
+from workout_api.contrib.cache import invalidar_recurso
 from workout_api.contrib.dependencies import (
+    CacheDependency,
+    ContagemQuery,
+    CursorParamsDependency,
     DatabaseDependency,
+    LeituraDependency,
     ParamsDependency,
 )
+from workout_api.contrib.http_cache import responder
+from workout_api.contrib.pagination import Pagina, paginate
+from workout_api.contrib.routing import RotaJsonRapida
 
-router = APIRouter()
+router = APIRouter(route_class=RotaJsonRapida)
 
 
 @router.post(
@@ -29,6 +40,7 @@ router = APIRouter()
 )
 async def post(
     db_session: DatabaseDependency,
+    cache: CacheDependency,
     centro_treinamento_in: CentroTreinamentoIn = Body(...),
 ) -> CentroTreinamentoOut:
     centro_treinamento_out = CentroTreinamentoOut(
@@ -39,6 +51,7 @@ async def post(
     )
     db_session.add(centro_treinamento_model)
     try:
+        await invalidar_recurso(db_session, 'centros_treinamento')
         await db_session.commit()
     except IntegrityError:
         raise HTTPException(
@@ -48,22 +61,53 @@ async def post(
                 f' com o nome: {centro_treinamento_model.nome}'
             ),
         )
+    await cache.invalidar('centros_treinamento')
 
     return centro_treinamento_out
 
 
+@router.post(
+    '/batch-get',
+    summary='Consulta vários centros de treinamento pelos ids',
+    status_code=status.HTTP_200_OK,
+    response_model=BatchGetOut[CentroTreinamentoOut],
+)
+async def batch_get_centros_treinamento(
+    db_session: LeituraDependency, batch_in: BatchGetIn = Body(...)
+) -> BatchGetOut[CentroTreinamentoOut]:
+    return await batch_get(
+        db_session,
+        select(CentroTreinamentoModel),
+        CentroTreinamentoModel,
+        batch_in.ids,
+        CentroTreinamentoOut,
+    )
+
+
 @router.get(
     '/',
     summary='Consultar todos os centros de treinamento',
     status_code=status.HTTP_200_OK,
-    response_model=Page[CentroTreinamentoOut],
+    response_model=Pagina[CentroTreinamentoOut],
 )
 async def query(
-    db_session: DatabaseDependency, params: ParamsDependency
-) -> Page[CentroTreinamentoOut]:
-    stmt: Select = select(CentroTreinamentoModel)
-    page = await paginate(db_session, stmt, params=params)
-    return page
+    request: Request,
+    db_session: LeituraDependency,
+    cache: CacheDependency,
+    params: ParamsDependency,
+    contagem: ContagemQuery = 'exata',
+) -> Response:
+    async def gerar() -> Pagina[CentroTreinamentoOut]:
+        stmt: Select = select(CentroTreinamentoModel)
+        return await paginate(
+            db_session,
+            stmt,
+            params,
+            contagem,
+            page_cls=Pagina[CentroTreinamentoOut],
+        )
+
+    return await responder(request, cache, 'centros_treinamento', gerar)
 
 
 @router.get(
@@ -73,21 +117,50 @@ async def query(
     response_model=CentroTreinamentoOut,
 )
 async def get(
-    id: UUID4, db_session: DatabaseDependency
-) -> CentroTreinamentoOut:
-    stmt: Select = select(CentroTreinamentoModel).filter_by(id=id)
-    result_query = await db_session.execute(stmt)
+    id: UUID4,
+    request: Request,
+    db_session: LeituraDependency,
+    cache: CacheDependency,
+) -> Response:
+    async def gerar() -> CentroTreinamentoOut:
+        stmt: Select = select(CentroTreinamentoModel).filter_by(id=id)
+        result_query = await db_session.execute(stmt)
 
-    centro_treinamento: Optional[CentroTreinamentoModel] = (
-        result_query.scalar_one_or_none()
-    )
+        centro_treinamento: Optional[CentroTreinamentoModel] = (
+            result_query.scalar_one_or_none()
+        )
+
+        if not centro_treinamento:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'Centro de treinamento não encontrado no id: {id}',
+            )
+        return CentroTreinamentoOut.model_validate(centro_treinamento)
+
+    return await responder(request, cache, 'centros_treinamento', gerar)
 
-    if not centro_treinamento:
+
+@router.get(
+    '/{id}/atletas',
+    summary='Lista os atletas de um centro de treinamento por cursor',
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[AtletaListagemOut],
+)
+async def atletas_do_centro_treinamento(
+    id: UUID4,
+    db_session: LeituraDependency,
+    params: CursorParamsDependency,
+) -> CursorPage[AtletaListagemOut]:
+    pagina = await paginar_da_relacao(
+        db_session,
+        params,
+        CentroTreinamentoModel,
+        AtletaModel.centro_treinamento_id,
+        id,
+    )
+    if pagina is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f'Centro de treinamento não encontrado no id: {id}',
         )
-    centro_treinamento_out = CentroTreinamentoOut.model_validate(
-        centro_treinamento
-    )
-    return centro_treinamento_out
+    return pagina
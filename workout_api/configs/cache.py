@@ -0,0 +1,8 @@
+from workout_api.configs.settings import settings
+from workout_api.contrib.cache import Cache, criar_cache
+
+cache = criar_cache(settings)
+
+
+def get_cache() -> Cache:  # pragma: no cover
+    return cache
@@ -1,12 +1,111 @@
-from typing import AsyncGenerator
+from typing import Annotated, Any, AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from fastapi import Depends, Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
 
-from workout_api.configs.settings import settings
+from workout_api.configs.settings import Settings, settings
+from workout_api.contrib.metrics import (
+    NullPoolMedido,
+    PoolMedido,
+    instrumentar_engine,
+)
+from workout_api.contrib.replicas import (
+    COOKIE_ESCRITA,
+    ESTADO_ESCRITA,
+    RoteadorReplicas,
+)
 
-engine = create_async_engine(settings.DB_URL, echo=False)
 
+def engine_options(config: Settings) -> dict[str, Any]:
+    # Com PgBouncer em modo transaction o statement preparado em uma
+    # conexão do servidor não existe na próxima, então não preparamos.
+    prepare_threshold = (
+        None if config.DB_NULL_POOL else config.DB_PREPARE_THRESHOLD
+    )
+    options: dict[str, Any] = {
+        'echo': False,
+        'pool_pre_ping': config.DB_POOL_PRE_PING,
+        'connect_args': {'prepare_threshold': prepare_threshold},
+    }
+    if config.DB_NULL_POOL:
+        options['poolclass'] = NullPoolMedido
+    else:
+        options.update(
+            poolclass=PoolMedido,
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+            pool_recycle=config.DB_POOL_RECYCLE,
+        )
+    return options
 
-async def get_session() -> AsyncGenerator:  # pragma: no cover
+
+def _criar_engine(url: str, nome: str) -> AsyncEngine:
+    engine = create_async_engine(url, **engine_options(settings))
+    instrumentar_engine(
+        engine,
+        nome,
+        limite_consulta_lenta=settings.DB_SLOW_QUERY_MS / 1000
+        if settings.DB_SLOW_QUERY_MS
+        else None,
+    )
+    event.listen(engine.sync_engine, 'connect', _configurar_conexao)
+    return engine
+
+
+def _configurar_conexao(dbapi_connection, connection_record):
+    dbapi_connection.driver_connection.prepared_max = settings.DB_PREPARED_MAX
+
+
+engine = _criar_engine(settings.DB_URL, 'primario')
+roteador = RoteadorReplicas(
+    engine,
+    [
+        _criar_engine(url, f'replica_{i}')
+        for i, url in enumerate(settings.DB_REPLICA_URLS)
+    ],
+    estrategia=settings.DB_REPLICA_ESTRATEGIA,
+    janela=settings.DB_REPLICA_JANELA,
+)
+
+
+def get_roteador() -> RoteadorReplicas:
+    return roteador
+
+
+async def _abrir_sessao(engine: AsyncEngine) -> AsyncGenerator:
+    # A sessão é preguiçosa: só pega conexão do pool no primeiro
+    # statement, e respostas servidas do cache nem chegam a pegar.
     async with AsyncSession(engine, expire_on_commit=False) as session:
         yield session
+
+
+async def get_session() -> AsyncGenerator:  # pragma: no cover
+    async for session in _abrir_sessao(engine):
+        yield session
+
+
+async def get_read_session(
+    request: Request,
+    roteador: Annotated[RoteadorReplicas, Depends(get_roteador)],
+) -> AsyncGenerator:
+    """Sessão para handlers só de leitura, numa réplica quando houver."""
+    escolhida = roteador.escolher(request.cookies.get(COOKIE_ESCRITA))
+    async for session in _abrir_sessao(escolhida):
+        yield session
+
+
+async def get_write_session(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    roteador: Annotated[RoteadorReplicas, Depends(get_roteador)],
+) -> AsyncSession:
+    """Sessão no primário; marca o cliente para ler do primário a seguir."""
+    if roteador.replicas:
+        setattr(request.state, ESTADO_ESCRITA, roteador.janela)
+    return session
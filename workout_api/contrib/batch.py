@@ -0,0 +1,62 @@
+from typing import Annotated, Generic, Optional, Sequence, TypeVar
+
+from pydantic import UUID4, BaseModel, Field
+from sqlalchemy import ARRAY, Select, any_, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.contrib.models import BaseModel as BaseORM
+from workout_api.contrib.schemas import BaseSchema
+
+T = TypeVar('T', bound=BaseModel)
+
+LIMITE_IDS = 100
+
+
+class BatchGetIn(BaseSchema):
+    ids: Annotated[
+        list[UUID4],
+        Field(
+            min_length=1,
+            max_length=LIMITE_IDS,
+            description=f'Até {LIMITE_IDS} identificadores',
+        ),
+    ]
+
+
+class ItemBatch(BaseModel, Generic[T]):
+    id: Annotated[UUID4, Field(description='Identificador pedido')]
+    encontrado: bool
+    item: Optional[T] = None
+
+
+class BatchGetOut(BaseModel, Generic[T]):
+    itens: Annotated[
+        list[ItemBatch[T]],
+        Field(description='Um item por id pedido, na ordem do pedido'),
+    ]
+
+
+async def batch_get(
+    session: AsyncSession,
+    stmt: Select,
+    modelo: type[BaseORM],
+    ids: Sequence[UUID4],
+    schema: type[T],
+) -> BatchGetOut[T]:
+    """Busca vários registros em um `WHERE id = ANY(:ids)` só."""
+    stmt = stmt.where(
+        modelo.id
+        == any_(bindparam('ids', list(set(ids)), type_=ARRAY(modelo.id.type)))
+    )
+    encontrados = {
+        registro.id: schema.model_validate(registro)
+        for registro in (await session.execute(stmt)).scalars()
+    }
+    return BatchGetOut[schema](
+        itens=[
+            ItemBatch[schema](
+                id=id, encontrado=id in encontrados, item=encontrados.get(id)
+            )
+            for id in ids
+        ]
+    )
@@ -0,0 +1,29 @@
+from workout_api.contrib.cache.backends import (
+    BackendCache,
+    BackendMemoria,
+    BackendRedis,
+)
+from workout_api.contrib.cache.compartilhado import Cache, criar_cache
+from workout_api.contrib.cache.invalidacao import (
+    CANAL_INVALIDACAO,
+    ao_invalidar,
+    escutar_invalidacoes,
+    invalidar_recurso,
+)
+from workout_api.contrib.cache.memoria import TTLCache, limpar_caches
+from workout_api.contrib.cache.nomes import CacheDeNomes
+
+__all__ = [
+    'CANAL_INVALIDACAO',
+    'BackendCache',
+    'BackendMemoria',
+    'BackendRedis',
+    'Cache',
+    'CacheDeNomes',
+    'TTLCache',
+    'ao_invalidar',
+    'criar_cache',
+    'escutar_invalidacoes',
+    'invalidar_recurso',
+    'limpar_caches',
+]
@@ -0,0 +1,90 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from workout_api.contrib.cache.memoria import TTLCache
+from workout_api.contrib.cache.resp import ClienteResp
+
+
+class BackendCache(ABC):
+    """Operações que `Cache` precisa de um armazenamento chave/valor."""
+
+    # Backends locais não são vistos pelos outros workers; a invalidação
+    # entre processos depende do LISTEN/NOTIFY.
+    local: bool
+
+    @abstractmethod
+    async def get(self, chave: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    async def set(self, chave: str, valor: bytes, ttl: float) -> None: ...
+
+    @abstractmethod
+    async def set_nx(self, chave: str, valor: bytes, ttl: float) -> bool: ...
+
+    @abstractmethod
+    async def delete(self, chave: str) -> None: ...
+
+    @abstractmethod
+    async def incr(self, chave: str) -> int: ...
+
+    async def fechar(self) -> None:
+        pass
+
+
+class BackendMemoria(BackendCache):
+    local = True
+
+    def __init__(self, maxsize: int = 1024):
+        self.entradas = TTLCache(maxsize=maxsize)
+        # Contadores de versão ficam fora do LRU: perder um faria a versão
+        # voltar a um valor já usado e reviver entradas antigas.
+        self.contadores: dict[str, int] = {}
+
+    async def get(self, chave: str) -> Optional[bytes]:
+        if chave in self.contadores:
+            return str(self.contadores[chave]).encode()
+        return self.entradas.get(chave)
+
+    async def set(self, chave: str, valor: bytes, ttl: float) -> None:
+        self.entradas.set(chave, valor, ttl=ttl)
+
+    async def set_nx(self, chave: str, valor: bytes, ttl: float) -> bool:
+        if self.entradas.get(chave) is not None:
+            return False
+        self.entradas.set(chave, valor, ttl=ttl)
+        return True
+
+    async def delete(self, chave: str) -> None:
+        self.entradas.invalidar(chave)
+
+    async def incr(self, chave: str) -> int:
+        self.contadores[chave] = self.contadores.get(chave, 0) + 1
+        return self.contadores[chave]
+
+
+class BackendRedis(BackendCache):
+    local = False
+
+    def __init__(self, url: str, tamanho: int = 10, timeout: float = 0.5):
+        self.cliente = ClienteResp(url, tamanho=tamanho, timeout=timeout)
+
+    async def get(self, chave: str) -> Optional[bytes]:
+        return await self.cliente.executar('GET', chave)
+
+    async def set(self, chave: str, valor: bytes, ttl: float) -> None:
+        await self.cliente.executar('SET', chave, valor, 'PX', int(ttl * 1000))
+
+    async def set_nx(self, chave: str, valor: bytes, ttl: float) -> bool:
+        resposta = await self.cliente.executar(
+            'SET', chave, valor, 'NX', 'PX', int(ttl * 1000)
+        )
+        return resposta is not None
+
+    async def delete(self, chave: str) -> None:
+        await self.cliente.executar('DEL', chave)
+
+    async def incr(self, chave: str) -> int:
+        return await self.cliente.executar('INCR', chave)
+
+    async def fechar(self) -> None:
+        await self.cliente.fechar()
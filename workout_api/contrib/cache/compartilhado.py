@@ -0,0 +1,170 @@
+import asyncio
+import logging
+from time import monotonic
+from typing import Awaitable, Callable
+
+from workout_api.configs.settings import Settings
+from workout_api.contrib.cache.backends import (
+    BackendCache,
+    BackendMemoria,
+    BackendRedis,
+)
+from workout_api.contrib.cache.resp import ErroResp
+
+logger = logging.getLogger(__name__)
+
+# Cache fora do ar não derruba a requisição: calcula direto do banco.
+ERROS_BACKEND = (OSError, asyncio.TimeoutError, ErroResp)
+
+INTERVALO_ESPERA = 0.01
+
+
+class Cache:
+    """Cache de bytes por recurso, compartilhável entre workers.
+
+    As chaves carregam a versão do recurso (`<prefixo>:<recurso>:<versao>:
+    <chave>`); `invalidar` só incrementa a versão, e as entradas antigas
+    deixam de ser lidas e expiram sozinhas.
+
+    Faltas concorrentes da mesma chave calculam o valor uma vez só: no
+    processo, as requisições esperam o mesmo future; entre workers, quem
+    não obtém a trava (`SET NX`) espera o valor aparecer no backend.
+
+    Com réplicas, uma falta logo depois de `invalidar` pode ser calculada
+    numa réplica que ainda não recebeu a escrita; durante a
+    `janela_replica` o valor é calculado mas não gravado.
+    """
+
+    def __init__(
+        self,
+        backend: BackendCache,
+        prefixo: str = 'workout',
+        espera_trava: float = 2.0,
+        janela_replica: float = 0.0,
+    ):
+        self.backend = backend
+        self.prefixo = prefixo
+        self.espera_trava = espera_trava
+        self.janela_replica = janela_replica
+        self._em_voo: dict[str, asyncio.Future] = {}
+
+    def _chave_versao(self, recurso: str) -> str:
+        return f'{self.prefixo}:{recurso}:versao'
+
+    def _chave_recente(self, recurso: str) -> str:
+        return f'{self.prefixo}:{recurso}:recente'
+
+    async def invalidar(self, recurso: str) -> None:
+        try:
+            # A marca vem antes da versão nova: nenhuma falta da versão
+            # nova deixa de vê-la.
+            if self.janela_replica:
+                await self.backend.set(
+                    self._chave_recente(recurso), b'1', self.janela_replica
+                )
+            await self.backend.incr(self._chave_versao(recurso))
+        except ERROS_BACKEND:
+            logger.exception('Falha ao invalidar o cache de %s', recurso)
+
+    async def obter_ou_calcular(
+        self,
+        recurso: str,
+        chave: str,
+        calcular: Callable[[], Awaitable[bytes]],
+        ttl: float,
+    ) -> bytes:
+        try:
+            versao = int(
+                await self.backend.get(self._chave_versao(recurso)) or 0
+            )
+            chave = f'{self.prefixo}:{recurso}:{versao}:{chave}'
+            valor = await self.backend.get(chave)
+        except ERROS_BACKEND:
+            logger.exception('Cache indisponível; lendo do banco')
+            return await calcular()
+        if valor is not None:
+            return valor
+        if self.janela_replica and await self._recente(recurso):
+            return await calcular()
+
+        em_voo = self._em_voo.get(chave)
+        if em_voo is not None:
+            return await asyncio.shield(em_voo)
+
+        futuro = asyncio.get_running_loop().create_future()
+        self._em_voo[chave] = futuro
+        try:
+            valor = await self._calcular_uma_vez(chave, calcular, ttl)
+        except BaseException as e:
+            futuro.set_exception(e)
+            # Evita o aviso de exceção não lida quando ninguém esperava.
+            futuro.exception()
+            raise
+        else:
+            futuro.set_result(valor)
+            return valor
+        finally:
+            del self._em_voo[chave]
+
+    async def _recente(self, recurso: str) -> bool:
+        try:
+            return (
+                await self.backend.get(self._chave_recente(recurso))
+                is not None
+            )
+        except ERROS_BACKEND:
+            logger.exception('Cache indisponível; lendo do banco')
+            return True
+
+    async def _calcular_uma_vez(
+        self,
+        chave: str,
+        calcular: Callable[[], Awaitable[bytes]],
+        ttl: float,
+    ) -> bytes:
+        trava = f'{chave}:trava'
+        try:
+            com_trava = await self.backend.set_nx(
+                trava, b'1', self.espera_trava
+            )
+            if not com_trava:
+                prazo = monotonic() + self.espera_trava
+                while monotonic() < prazo:
+                    await asyncio.sleep(INTERVALO_ESPERA)
+                    valor = await self.backend.get(chave)
+                    if valor is not None:
+                        return valor
+        except ERROS_BACKEND:
+            logger.exception('Cache indisponível; lendo do banco')
+            return await calcular()
+
+        valor = await calcular()
+        try:
+            await self.backend.set(chave, valor, ttl)
+            if com_trava:
+                await self.backend.delete(trava)
+        except ERROS_BACKEND:
+            logger.exception('Falha ao gravar %s no cache', chave)
+        return valor
+
+    async def fechar(self) -> None:
+        await self.backend.fechar()
+
+
+def criar_cache(config: Settings) -> Cache:
+    if config.CACHE_BACKEND == 'redis':
+        backend: BackendCache = BackendRedis(
+            config.CACHE_URL,
+            tamanho=config.CACHE_POOL_TAMANHO,
+            timeout=config.CACHE_TIMEOUT,
+        )
+    else:
+        backend = BackendMemoria(maxsize=config.CACHE_MEMORIA_TAMANHO)
+    return Cache(
+        backend,
+        prefixo=config.CACHE_PREFIXO,
+        espera_trava=config.CACHE_ESPERA_TRAVA,
+        janela_replica=config.DB_REPLICA_JANELA
+        if config.DB_REPLICA_URLS
+        else 0.0,
+    )
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+import psycopg
+from sqlalchemy import event, func, make_url, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.configs.settings import settings
+from workout_api.contrib.cache.memoria import limpar_caches
+
+logger = logging.getLogger(__name__)
+
+CANAL_INVALIDACAO = 'workout_cache'
+
+_invalidadores: dict[str, list[Callable[[], None]]] = {}
+
+
+def ao_invalidar(recurso: str, invalidar: Callable[[], None]) -> None:
+    """Registra um cache local a limpar quando `recurso` for alterado."""
+    _invalidadores.setdefault(recurso, []).append(invalidar)
+
+
+def _invalidar_local(recurso: str) -> None:
+    for invalidar in _invalidadores.get(recurso, ()):
+        invalidar()
+
+
+async def invalidar_recurso(db_session: AsyncSession, recurso: str) -> None:
+    """Limpa os caches locais de `recurso` e avisa os outros workers.
+
+    O NOTIFY vai na transação de `db_session`, então só é entregue no
+    commit da escrita que o motivou.
+    """
+    _invalidar_local(recurso)
+    # Até o commit, leituras concorrentes ainda veem os dados antigos e
+    # podem repopular o cache; limpa de novo quando a escrita valer.
+    event.listen(
+        db_session.sync_session,
+        'after_commit',
+        lambda _: _invalidar_local(recurso),
+        once=True,
+    )
+    if settings.CACHE_NOTIFY:
+        await db_session.execute(
+            select(func.pg_notify(CANAL_INVALIDACAO, recurso))
+        )
+
+
+async def escutar_invalidacoes(
+    ao_notificar: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> None:  # pragma: no cover
+    """Invalida os caches locais ao receber NOTIFY de outros workers."""
+    url = make_url(settings.DB_URL).set(drivername='postgresql')
+    conninfo = url.render_as_string(hide_password=False)
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(
+                conninfo, autocommit=True
+            ) as conn:
+                await conn.execute(f'LISTEN {CANAL_INVALIDACAO}')
+                # Notificações perdidas enquanto desconectado.
+                limpar_caches()
+                async for notify in conn.notifies():
+                    _invalidar_local(notify.payload)
+                    if ao_notificar is not None:
+                        await ao_notificar(notify.payload)
+        except psycopg.OperationalError:
+            logger.exception('LISTEN %s interrompido', CANAL_INVALIDACAO)
+            await asyncio.sleep(1)
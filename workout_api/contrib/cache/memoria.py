@@ -0,0 +1,49 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable, Optional
+
+_caches: list['TTLCache'] = []
+
+
+class TTLCache:
+    """LRU em memória com expiração por entrada."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._dados: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        _caches.append(self)
+
+    def get(self, chave: Hashable, default: Any = None) -> Any:
+        item = self._dados.get(chave)
+        if item is None:
+            return default
+        expira_em, valor = item
+        if expira_em <= monotonic():
+            del self._dados[chave]
+            return default
+        self._dados.move_to_end(chave)
+        return valor
+
+    def set(
+        self, chave: Hashable, valor: Any, ttl: Optional[float] = None
+    ) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self._dados[chave] = (monotonic() + ttl, valor)
+        self._dados.move_to_end(chave)
+        while len(self._dados) > self.maxsize:
+            self._dados.popitem(last=False)
+
+    def invalidar(self, chave: Optional[Hashable] = None) -> None:
+        if chave is None:
+            self._dados.clear()
+        else:
+            self._dados.pop(chave, None)
+
+    def __len__(self) -> int:
+        return len(self._dados)
+
+
+def limpar_caches() -> None:
+    for cache in _caches:
+        cache.invalidar()
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.configs.settings import settings
+from workout_api.contrib.cache.invalidacao import ao_invalidar
+from workout_api.contrib.cache.memoria import TTLCache
+
+
+class CacheDeNomes:
+    """Cache `nome -> pk_id` de uma tabela de referência.
+
+    Só guarda nomes encontrados; um nome desconhecido sempre vai ao banco,
+    então criar um registro novo nunca é mascarado pelo cache. Fica no
+    processo de propósito: o INSERT de atletas lê este cache sem await.
+    É limpo por `invalidar_recurso(db_session, nome)`, que as escritas do
+    recurso já chamam.
+    """
+
+    def __init__(self, modelo, nome: str):
+        self.modelo = modelo
+        self.nome = nome
+        self.cache = TTLCache(
+            maxsize=settings.CACHE_NOMES_TAMANHO, ttl=settings.CACHE_NOMES_TTL
+        )
+        ao_invalidar(nome, self.cache.invalidar)
+
+    async def pk_id(
+        self, db_session: AsyncSession, nome: str
+    ) -> Optional[int]:
+        pk_id = self.conhecido(nome)
+        if pk_id is None:
+            stmt = select(self.modelo.pk_id).filter_by(nome=nome)
+            pk_id = (await db_session.execute(stmt)).scalar()
+            if pk_id is not None:
+                self.lembrar(nome, pk_id)
+        return pk_id
+
+    def conhecido(self, nome: str) -> Optional[int]:
+        return self.cache.get(nome)
+
+    def lembrar(self, nome: str, pk_id: int) -> None:
+        self.cache.set(nome, pk_id)
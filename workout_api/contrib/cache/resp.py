@@ -0,0 +1,239 @@
+"""Cliente mínimo do protocolo do Redis (RESP2) e um servidor falso.
+
+O servidor entende só os comandos que `BackendRedis` usa e guarda tudo
+em memória; serve aos testes e a rodar a API localmente sem Redis:
+
+    python -m workout_api.contrib.cache.resp --porta 6379
+"""
+
+import argparse
+import asyncio
+import logging
+from time import monotonic
+from typing import Optional, Union
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+Resposta = Union[None, int, bytes, str, list['Resposta']]
+
+
+class ErroResp(Exception):
+    """Resposta de erro (`-ERR ...`) do servidor."""
+
+
+def codificar_comando(*partes: Union[str, bytes, int, float]) -> bytes:
+    saida = [b'*%d\r\n' % len(partes)]
+    for parte in partes:
+        dado = parte if isinstance(parte, bytes) else str(parte).encode()
+        saida.append(b'$%d\r\n%s\r\n' % (len(dado), dado))
+    return b''.join(saida)
+
+
+async def ler_resposta(reader: asyncio.StreamReader) -> Resposta:
+    linha = await reader.readuntil(b'\r\n')
+    tipo, conteudo = linha[:1], linha[1:-2]
+    if tipo == b'+':
+        return conteudo.decode()
+    if tipo == b'-':
+        raise ErroResp(conteudo.decode())
+    if tipo == b':':
+        return int(conteudo)
+    if tipo == b'$':
+        tamanho = int(conteudo)
+        if tamanho < 0:
+            return None
+        return (await reader.readexactly(tamanho + 2))[:-2]
+    if tipo == b'*':
+        tamanho = int(conteudo)
+        if tamanho < 0:
+            return None
+        return [await ler_resposta(reader) for _ in range(tamanho)]
+    raise ErroResp(f'Resposta inesperada: {linha!r}')
+
+
+class ClienteResp:
+    """Pool pequeno de conexões; um comando por conexão emprestada."""
+
+    def __init__(self, url: str, tamanho: int = 10, timeout: float = 0.5):
+        partes = urlsplit(url)
+        self.host = partes.hostname or 'localhost'
+        self.porta = partes.port or 6379
+        self.banco = int(partes.path.lstrip('/') or 0)
+        self.senha = partes.password
+        self.timeout = timeout
+        self._livres: asyncio.LifoQueue = asyncio.LifoQueue()
+        self._vagas = asyncio.Semaphore(tamanho)
+
+    async def _conectar(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_connection(self.host, self.porta)
+        if self.senha:
+            writer.write(codificar_comando('AUTH', self.senha))
+            await ler_resposta(reader)
+        if self.banco:
+            writer.write(codificar_comando('SELECT', self.banco))
+            await ler_resposta(reader)
+        return reader, writer
+
+    async def _executar(self, partes) -> Resposta:
+        conexao = None
+        try:
+            conexao = (
+                self._livres.get_nowait()
+                if not self._livres.empty()
+                else await self._conectar()
+            )
+            reader, writer = conexao
+            writer.write(codificar_comando(*partes))
+            await writer.drain()
+            resposta = await ler_resposta(reader)
+        except BaseException:
+            # Conexão em estado desconhecido (timeout no meio da resposta,
+            # servidor caiu): descarta em vez de devolver ao pool.
+            if conexao is not None:
+                conexao[1].close()
+            raise
+        self._livres.put_nowait(conexao)
+        return resposta
+
+    async def executar(self, *partes: Union[str, bytes, int, float]):
+        async with self._vagas:
+            return await asyncio.wait_for(self._executar(partes), self.timeout)
+
+    async def fechar(self) -> None:
+        while not self._livres.empty():
+            _, writer = self._livres.get_nowait()
+            writer.close()
+
+
+class ServidorResp:
+    """Servidor falso com GET, SET (EX/PX/NX), DEL, INCR, PING e FLUSHDB."""
+
+    def __init__(self):
+        self.dados: dict[bytes, tuple[Optional[float], bytes]] = {}
+        self._servidor: Optional[asyncio.Server] = None
+
+    @property
+    def url(self) -> str:
+        host, porta = self._servidor.sockets[0].getsockname()[:2]
+        return f'redis://{host}:{porta}/0'
+
+    async def iniciar(self, host: str = '127.0.0.1', porta: int = 0) -> str:
+        self._servidor = await asyncio.start_server(self._atender, host, porta)
+        return self.url
+
+    async def fechar(self) -> None:
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+
+    def _valor(self, chave: bytes) -> Optional[bytes]:
+        item = self.dados.get(chave)
+        if item is None:
+            return None
+        expira_em, valor = item
+        if expira_em is not None and expira_em <= monotonic():
+            del self.dados[chave]
+            return None
+        return valor
+
+    def _cmd_set(self, chave: bytes, valor: bytes, *opcoes: bytes) -> Resposta:
+        expira_em = None
+        opcoes_iter = iter(opcoes)
+        for opcao in opcoes_iter:
+            match opcao.upper():
+                case b'NX':
+                    if self._valor(chave) is not None:
+                        return None
+                case b'EX':
+                    expira_em = monotonic() + float(next(opcoes_iter))
+                case b'PX':
+                    expira_em = monotonic() + float(next(opcoes_iter)) / 1000
+                case _:
+                    raise ErroResp('ERR syntax error')
+        self.dados[chave] = (expira_em, valor)
+        return 'OK'
+
+    def _cmd_incr(self, chave: bytes) -> int:
+        valor = int(self._valor(chave) or 0) + 1
+        expira_em = self.dados.get(chave, (None, b''))[0]
+        self.dados[chave] = (expira_em, str(valor).encode())
+        return valor
+
+    def processar(self, comando: list[bytes]) -> Resposta:
+        nome = comando[0].decode(errors='replace').lower()
+        args = comando[1:]
+        metodo = getattr(self, f'_cmd_{nome}', None)
+        if metodo is None:
+            raise ErroResp(f'ERR unknown command {nome!r}')
+        try:
+            return metodo(*args)
+        except (TypeError, StopIteration):
+            raise ErroResp(f'ERR wrong number of arguments for {nome!r}')
+        except ValueError:
+            # INCR num valor que não é inteiro, EX/PX não numéricos.
+            raise ErroResp('ERR value is not an integer or out of range')
+
+    @staticmethod
+    def _cmd_ping() -> Resposta:
+        return 'PONG'
+
+    @staticmethod
+    def _cmd_select(*args: bytes) -> Resposta:
+        return 'OK'
+
+    _cmd_auth = _cmd_select
+
+    def _cmd_get(self, chave: bytes) -> Resposta:
+        return self._valor(chave)
+
+    def _cmd_del(self, *chaves: bytes) -> Resposta:
+        return sum(self.dados.pop(chave, None) is not None for chave in chaves)
+
+    def _cmd_flushdb(self) -> Resposta:
+        self.dados.clear()
+        return 'OK'
+
+    @staticmethod
+    def _codificar(resposta: Resposta) -> bytes:
+        if resposta is None:
+            return b'$-1\r\n'
+        if isinstance(resposta, str):
+            return f'+{resposta}\r\n'.encode()
+        if isinstance(resposta, int):
+            return b':%d\r\n' % resposta
+        return b'$%d\r\n%s\r\n' % (len(resposta), resposta)
+
+    async def _atender(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                comando = await ler_resposta(reader)
+                try:
+                    saida = self._codificar(self.processar(comando))
+                except ErroResp as e:
+                    saida = f'-{e}\r\n'.encode()
+                writer.write(saida)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _servir(host: str, porta: int) -> None:  # pragma: no cover
+    servidor = ServidorResp()
+    logger.info('Servindo em %s', await servidor.iniciar(host, porta))
+    await asyncio.Event().wait()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=6379)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_servir(args.host, args.porta))
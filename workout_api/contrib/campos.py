@@ -0,0 +1,76 @@
+"""Respostas parciais: `?fields=id,nome` escolhe os campos do schema.
+
+O modelo de resposta de cada conjunto de campos é criado uma única vez
+e reaproveitado; cabe ao endpoint estreitar o SELECT para as mesmas
+colunas.
+"""
+
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Callable, Optional
+
+from fastapi import HTTPException, Query, Response
+from pydantic import BaseModel, create_model
+
+from workout_api.contrib.schemas import BaseSchema
+
+Campos = frozenset[str]
+
+# Conjuntos distintos de campos pedidos pelos clientes que ficam em cache.
+MODELOS_EM_CACHE = 256
+
+
+@lru_cache(maxsize=MODELOS_EM_CACHE)
+def modelo_parcial(modelo: type[BaseModel], campos: Campos) -> type[BaseModel]:
+    """`modelo` só com `campos`, na ordem em que aparecem no original."""
+    definicoes = {
+        nome: (info.annotation, info)
+        for nome, info in modelo.model_fields.items()
+        if nome in campos
+    }
+    return create_model(
+        f'{modelo.__name__}Parcial', __base__=BaseSchema, **definicoes
+    )
+
+
+def campos_query(
+    modelo: type[BaseModel],
+) -> Callable[..., Optional[Campos]]:
+    """Dependência que lê `fields` e valida os nomes contra `modelo`."""
+    disponiveis = ', '.join(modelo.model_fields)
+
+    def dependencia(
+        fields: Optional[str] = Query(
+            None,
+            description='Campos da resposta, separados por vírgula: '
+            f'{disponiveis}',
+        ),
+    ) -> Optional[Campos]:
+        if fields is None:
+            return None
+        campos = frozenset(
+            campo.strip() for campo in fields.split(',') if campo.strip()
+        )
+        invalidos = sorted(campos - modelo.model_fields.keys())
+        if not campos or invalidos:
+            raise HTTPException(
+                status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+                detail=[
+                    {
+                        'loc': ['query', 'fields'],
+                        'msg': f'Campos inválidos: {", ".join(invalidos)}. '
+                        f'Disponíveis: {disponiveis}'
+                        if invalidos
+                        else 'Informe ao menos um campo',
+                        'type': 'value_error',
+                    }
+                ],
+            )
+        return campos
+
+    return dependencia
+
+
+def resposta_json(valor: BaseModel) -> Response:
+    """Serializa um modelo parcial já validado, sem o `response_model`."""
+    return Response(valor.model_dump_json(), media_type='application/json')
@@ -1,20 +1,25 @@
-from typing import Annotated, Optional
+from typing import Annotated
 
 from fastapi import Depends, Query
 from fastapi_pagination import Params
+from fastapi_pagination.cursor import CursorParams
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from workout_api.configs.database import get_session
+from workout_api.configs.cache import get_cache
+from workout_api.configs.database import get_read_session, get_write_session
+from workout_api.contrib.cache import Cache
+from workout_api.contrib.pagination import ModoContagem
 
 ParamsDependency = Annotated[Params, Depends(Params)]
-DatabaseDependency = Annotated[AsyncSession, Depends(get_session)]
-
-
-class AtletaFiltroQuery:
-    def __init__(
-        self,
-        nome: Optional[str] = Query(None, description='Filtro por nome'),
-        cpf: Optional[str] = Query(None, description='Filtro por CPF'),
-    ):
-        self.nome = nome
-        self.cpf = cpf
+CursorParamsDependency = Annotated[CursorParams, Depends(CursorParams)]
+DatabaseDependency = Annotated[AsyncSession, Depends(get_write_session)]
+LeituraDependency = Annotated[AsyncSession, Depends(get_read_session)]
+CacheDependency = Annotated[Cache, Depends(get_cache)]
+ContagemQuery = Annotated[
+    ModoContagem,
+    Query(
+        description='Como calcular o total: exata (COUNT), estimada '
+        '(estatísticas do planner) ou cache (COUNT guardado por alguns '
+        'segundos)'
+    ),
+]
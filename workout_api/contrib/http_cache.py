@@ -0,0 +1,60 @@
+import hashlib
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urlencode
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from workout_api.configs.settings import settings
+from workout_api.contrib.cache import Cache
+
+
+def _etag(corpo: bytes) -> str:
+    return f'"{hashlib.sha256(corpo).hexdigest()[:32]}"'
+
+
+def etag_casa(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparação fraca do `If-None-Match`, como pede a RFC 9110."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return any(
+        candidato.strip().removeprefix('W/') == etag
+        for candidato in if_none_match.split(',')
+    )
+
+
+async def responder(
+    request: Request,
+    cache: Cache,
+    recurso: str,
+    gerar: Callable[[], Awaitable[BaseModel]],
+) -> Response:
+    """Responde com o JSON em cache de `recurso`, com ETag forte.
+
+    O ETag é o hash do corpo, então é o mesmo em qualquer worker; a
+    escrita no recurso chama `cache.invalidar(recurso)` depois do commit.
+    """
+    chave = f'{request.url.path}?' + urlencode(
+        sorted(request.query_params.multi_items())
+    )
+
+    async def serializar() -> bytes:
+        return (await gerar()).model_dump_json().encode()
+
+    corpo = await cache.obter_ou_calcular(
+        recurso, chave, serializar, ttl=settings.CACHE_HTTP_TTL
+    )
+    etag = _etag(corpo)
+    headers = {
+        'ETag': etag,
+        'Cache-Control': (
+            f'max-age={settings.CACHE_HTTP_MAX_AGE}, must-revalidate'
+        ),
+    }
+    if etag_casa(request.headers.get('if-none-match'), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+        )
+    return Response(corpo, media_type='application/json', headers=headers)
@@ -0,0 +1,440 @@
+import logging
+import math
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Callable, Iterable, Optional
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+Labels = tuple[tuple[str, str], ...]
+
+BUCKETS_LATENCIA = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)  # fmt: skip
+BUCKETS_ROUND_TRIPS = (0, 1, 2, 3, 4, 5, 8, 13, 21, 34)
+
+
+def _escapar(valor: str) -> str:
+    return valor.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _formatar_labels(labels: Labels, extra: Labels = ()) -> str:
+    pares = labels + extra
+    if not pares:
+        return ''
+    conteudo = ','.join(f'{k}="{_escapar(v)}"' for k, v in pares)
+    return f'{{{conteudo}}}'
+
+
+def _formatar_valor(valor: float) -> str:
+    if math.isinf(valor):
+        return '+Inf' if valor > 0 else '-Inf'
+    return repr(float(valor))
+
+
+class Metrica(ABC):
+    tipo: str
+
+    def __init__(self, nome: str, descricao: str):
+        self.nome = nome
+        self.descricao = descricao
+
+    @abstractmethod
+    def amostras(self) -> Iterable[str]: ...
+
+    def render(self) -> str:
+        linhas = [
+            f'# HELP {self.nome} {self.descricao}',
+            f'# TYPE {self.nome} {self.tipo}',
+            *self.amostras(),
+        ]
+        return '\n'.join(linhas)
+
+
+class Counter(Metrica):
+    tipo = 'counter'
+
+    def __init__(self, nome: str, descricao: str):
+        super().__init__(nome, descricao)
+        self._valores: dict[Labels, float] = {}
+
+    def inc(self, valor: float = 1, **labels: str) -> None:
+        chave = tuple(sorted(labels.items()))
+        self._valores[chave] = self._valores.get(chave, 0) + valor
+
+    def amostras(self) -> Iterable[str]:
+        for labels, valor in self._valores.items():
+            yield (
+                f'{self.nome}{_formatar_labels(labels)} '
+                f'{_formatar_valor(valor)}'
+            )
+
+
+class Gauge(Metrica):
+    """Gauge lido no momento da coleta, a partir de `coletar`."""
+
+    tipo = 'gauge'
+
+    def __init__(
+        self,
+        nome: str,
+        descricao: str,
+        coletar: Callable[[], Iterable[tuple[dict[str, str], float]]],
+    ):
+        super().__init__(nome, descricao)
+        self._coletar = coletar
+
+    def amostras(self) -> Iterable[str]:
+        for labels, valor in self._coletar():
+            chave = tuple(sorted(labels.items()))
+            yield (
+                f'{self.nome}{_formatar_labels(chave)} '
+                f'{_formatar_valor(valor)}'
+            )
+
+
+class Histogram(Metrica):
+    tipo = 'histogram'
+
+    def __init__(
+        self,
+        nome: str,
+        descricao: str,
+        buckets: tuple[float, ...] = BUCKETS_LATENCIA,
+    ):
+        super().__init__(nome, descricao)
+        self.buckets = (*sorted(buckets), math.inf)
+        self._series: dict[Labels, list[float]] = {}
+
+    def observe(self, valor: float, **labels: str) -> None:
+        chave = tuple(sorted(labels.items()))
+        # [contagem por bucket..., soma, total]
+        serie = self._series.setdefault(chave, [0] * (len(self.buckets) + 2))
+        for i, limite in enumerate(self.buckets):
+            if valor <= limite:
+                serie[i] += 1
+                break
+        serie[-2] += valor
+        serie[-1] += 1
+
+    def amostras(self) -> Iterable[str]:
+        for labels, serie in self._series.items():
+            acumulado = 0
+            for limite, contagem in zip(self.buckets, serie):
+                acumulado += contagem
+                le = (('le', _formatar_valor(limite)),)
+                yield (
+                    f'{self.nome}_bucket{_formatar_labels(labels, le)} '
+                    f'{acumulado}'
+                )
+            yield (
+                f'{self.nome}_sum{_formatar_labels(labels)} '
+                f'{_formatar_valor(serie[-2])}'
+            )
+            yield f'{self.nome}_count{_formatar_labels(labels)} {serie[-1]}'
+
+
+class Registry:
+    def __init__(self):
+        self.metricas: list[Metrica] = []
+
+    def registrar(self, metrica: Metrica) -> Metrica:
+        self.metricas.append(metrica)
+        return metrica
+
+    def render(self) -> str:
+        return '\n'.join(m.render() for m in self.metricas) + '\n'
+
+
+REGISTRY = Registry()
+
+LATENCIA_HTTP: Histogram = REGISTRY.registrar(
+    Histogram(
+        'workout_http_request_duration_seconds',
+        'Latência das requisições HTTP por rota.',
+    )
+)
+ROUND_TRIPS: Histogram = REGISTRY.registrar(
+    Histogram(
+        'workout_db_round_trips_per_request',
+        'Statements enviados ao banco por requisição.',
+        buckets=BUCKETS_ROUND_TRIPS,
+    )
+)
+DURACAO_STATEMENT: Histogram = REGISTRY.registrar(
+    Histogram(
+        'workout_db_statement_duration_seconds',
+        'Tempo de execução de cada statement.',
+    )
+)
+ESPERA_POOL: Histogram = REGISTRY.registrar(
+    Histogram(
+        'workout_db_pool_checkout_wait_seconds',
+        'Tempo de espera por uma conexão do pool.',
+    )
+)
+
+
+class _MedeEsperaPool:
+    """Mede em `ESPERA_POOL` quanto cada checkout espera pelo pool.
+
+    O evento `checkout` do pool só dispara depois de a conexão sair, sem
+    dizer quando o pedido começou; `_do_get` é o ponto em que o pool
+    espera (ou abre uma conexão nova), e só roda quando a sessão de fato
+    precisa do banco.
+    """
+
+    def _do_get(self):
+        inicio = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            ESPERA_POOL.observe(perf_counter() - inicio)
+
+
+class PoolMedido(_MedeEsperaPool, AsyncAdaptedQueuePool):
+    pass
+
+
+class NullPoolMedido(_MedeEsperaPool, NullPool):
+    pass
+
+
+_engines: dict[str, AsyncEngine] = {}
+# Limite, em segundos, acima do qual o statement vai para o log.
+_limites_lentos: dict[Engine, float] = {}
+
+
+def _estado_pools() -> Iterable[tuple[str, int, Optional[int]]]:
+    for nome, engine in _engines.items():
+        pool = engine.pool
+        # NullPool e afins não têm tamanho nem contagem de checkouts.
+        if not hasattr(pool, 'checkedout') or not hasattr(pool, 'size'):
+            continue
+        capacidade = pool.size() + max(getattr(pool, '_max_overflow', 0), 0)
+        yield nome, pool.checkedout(), capacidade
+
+
+REGISTRY.registrar(
+    Gauge(
+        'workout_db_pool_checked_out',
+        'Conexões em uso no pool.',
+        lambda: (
+            ({'engine': nome}, em_uso) for nome, em_uso, _ in _estado_pools()
+        ),
+    )
+)
+REGISTRY.registrar(
+    Gauge(
+        'workout_db_pool_saturation',
+        'Fração da capacidade do pool (size + overflow) em uso.',
+        lambda: (
+            ({'engine': nome}, em_uso / capacidade)
+            for nome, em_uso, capacidade in _estado_pools()
+            if capacidade
+        ),
+    )
+)
+
+
+class EstatisticasRequisicao:
+    def __init__(self):
+        self.queries = 0
+        self.tempo_db = 0.0
+
+
+requisicao_atual: ContextVar[Optional[EstatisticasRequisicao]] = ContextVar(
+    'requisicao_atual', default=None
+)
+
+
+def _antes_do_statement(conn, **kw):
+    conn.info.setdefault('inicio_statement', []).append(perf_counter())
+
+
+def _plano(conn, statement: str, parameters) -> str:
+    """EXPLAIN do statement por um cursor cru, fora dos eventos da engine.
+
+    Um EXPLAIN que falhe não pode abortar a transação da requisição, por
+    isso roda dentro de um SAVEPOINT quando há transação aberta.
+    """
+    dbapi_connection = conn.connection.dbapi_connection
+    em_transacao = not dbapi_connection.autocommit
+    cursor = dbapi_connection.cursor()
+    try:
+        if em_transacao:
+            cursor.execute('SAVEPOINT explain_consulta_lenta')
+        try:
+            cursor.execute(f'EXPLAIN {statement}', parameters)
+            return '\n'.join(linha for (linha,) in cursor.fetchall())
+        except Exception as e:  # noqa: BLE001
+            if em_transacao:
+                cursor.execute('ROLLBACK TO SAVEPOINT explain_consulta_lenta')
+            return f'(EXPLAIN indisponível: {e})'
+        finally:
+            if em_transacao:
+                cursor.execute('RELEASE SAVEPOINT explain_consulta_lenta')
+    finally:
+        cursor.close()
+
+
+COMANDOS_EXPLICAVEIS = frozenset({
+    'SELECT',
+    'INSERT',
+    'UPDATE',
+    'DELETE',
+    'WITH',
+})
+
+
+def _registrar_consulta_lenta(
+    conn, statement: str, parameters, executemany: bool, duracao: float
+) -> None:
+    palavras = statement.split(None, 1)
+    explicavel = (
+        not executemany
+        and bool(palavras)
+        and palavras[0].upper() in COMANDOS_EXPLICAVEIS
+    )
+    plano = (
+        _plano(conn, statement, parameters) if explicavel else '(sem EXPLAIN)'
+    )
+    logger.warning(
+        'Consulta lenta (%.1f ms): %s\n%s', duracao * 1000, statement, plano
+    )
+
+
+def _depois_do_statement(conn, statement, parameters, executemany, **kw):
+    duracao = perf_counter() - conn.info['inicio_statement'].pop()
+    DURACAO_STATEMENT.observe(duracao)
+    estatisticas = requisicao_atual.get()
+    if estatisticas is not None:
+        estatisticas.queries += 1
+        estatisticas.tempo_db += duracao
+    limite = _limites_lentos.get(conn.engine)
+    if limite is not None and duracao >= limite:
+        _registrar_consulta_lenta(
+            conn, statement, parameters, executemany, duracao
+        )
+
+
+def _erro_no_statement(contexto_erro):
+    conn = contexto_erro.connection
+    if conn is not None and conn.info.get('inicio_statement'):
+        conn.info['inicio_statement'].pop()
+
+
+def instrumentar_engine(
+    engine: AsyncEngine,
+    nome: str = 'primario',
+    limite_consulta_lenta: Optional[float] = None,
+) -> None:
+    """Mede os statements de `engine` e os soma à requisição corrente.
+
+    Com `limite_consulta_lenta` (segundos), cada statement que demorar
+    pelo menos isso é logado junto com o seu EXPLAIN.
+    """
+    _engines[nome] = engine
+    sync_engine = engine.sync_engine
+    if limite_consulta_lenta is None:
+        _limites_lentos.pop(sync_engine, None)
+    else:
+        _limites_lentos[sync_engine] = limite_consulta_lenta
+    if event.contains(
+        sync_engine, 'before_cursor_execute', _antes_do_statement
+    ):
+        return
+    event.listen(
+        sync_engine,
+        'before_cursor_execute',
+        _antes_do_statement,
+        named=True,
+    )
+    event.listen(
+        sync_engine,
+        'after_cursor_execute',
+        _depois_do_statement,
+        named=True,
+    )
+    event.listen(sync_engine, 'handle_error', _erro_no_statement)
+
+
+def desinstrumentar_engine(engine: AsyncEngine, nome: str) -> None:
+    """Desfaz `instrumentar_engine` para a engine registrada como `nome`."""
+    _engines.pop(nome, None)
+    sync_engine = engine.sync_engine
+    _limites_lentos.pop(sync_engine, None)
+    for evento, funcao in (
+        ('before_cursor_execute', _antes_do_statement),
+        ('after_cursor_execute', _depois_do_statement),
+        ('handle_error', _erro_no_statement),
+    ):
+        if event.contains(sync_engine, evento, funcao):
+            event.remove(sync_engine, evento, funcao)
+
+
+def server_timing(estatisticas: EstatisticasRequisicao, total: float) -> str:
+    """Statements e tempo de banco da requisição até o início da resposta."""
+    return (
+        f'db;dur={estatisticas.tempo_db * 1000:.1f};'
+        f'desc="{estatisticas.queries} queries", '
+        f'app;dur={total * 1000:.1f}'
+    )
+
+
+class MetricasMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        estatisticas = EstatisticasRequisicao()
+        token = requisicao_atual.set(estatisticas)
+        status_code = 500
+        inicio = perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                MutableHeaders(scope=message).append(
+                    'Server-Timing',
+                    server_timing(estatisticas, perf_counter() - inicio),
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            requisicao_atual.reset(token)
+            route = scope.get('route')
+            rota = getattr(route, 'path', 'desconhecida')
+            LATENCIA_HTTP.observe(
+                perf_counter() - inicio,
+                method=scope['method'],
+                route=rota,
+                status=str(status_code),
+            )
+            ROUND_TRIPS.observe(estatisticas.queries, route=rota)
+
+
+router = APIRouter()
+
+
+@router.get('/metrics', include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        REGISTRY.render(), media_type='text/plain; version=0.0.4'
+    )
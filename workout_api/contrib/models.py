@@ -1,11 +1,43 @@
 from uuid import uuid4
 
-from sqlalchemy import UUID
+from sqlalchemy import DDL, UUID, event
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
 class BaseModel(DeclarativeBase):
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), default=uuid4, nullable=False
+        PG_UUID(as_uuid=True),
+        default=uuid4,
+        nullable=False,
+        unique=True,
+        index=True,
     )
+
+
+# Extensões usadas pelos índices trigram e pela busca sem acento.
+EXTENSOES = ('pg_trgm', 'unaccent')
+
+for extensao in EXTENSOES:
+    event.listen(
+        BaseModel.metadata,
+        'before_create',
+        DDL(f'CREATE EXTENSION IF NOT EXISTS {extensao}').execute_if(
+            dialect='postgresql'
+        ),
+    )
+
+# `unaccent` é só STABLE (depende do dicionário em uso) e não pode entrar
+# em índice. Com o dicionário fixo, o resultado não muda: o wrapper
+# IMMUTABLE permite indexar `f_unaccent(coluna)`.
+F_UNACCENT = """
+CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+"""
+
+event.listen(
+    BaseModel.metadata,
+    'before_create',
+    DDL(F_UNACCENT).execute_if(dialect='postgresql'),
+)
@@ -0,0 +1,214 @@
+import json
+from datetime import datetime
+from typing import (
+    Annotated,
+    Any,
+    Generic,
+    Literal,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from fastapi import HTTPException, status
+from fastapi_pagination import Page, Params
+from fastapi_pagination.cursor import CursorPage, CursorParams
+from pydantic import Field
+from sqlalchemy import Join, Row, Select, Table, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from workout_api.configs.settings import settings
+from workout_api.contrib.cache import TTLCache
+
+T = TypeVar('T')
+
+ModoContagem = Literal['exata', 'estimada', 'cache']
+
+_contagens = TTLCache(
+    maxsize=settings.CACHE_CONTAGEM_TAMANHO, ttl=settings.CACHE_CONTAGEM_TTL
+)
+
+
+class Pagina(Page[T], Generic[T]):
+    contagem: Annotated[
+        ModoContagem,
+        Field(
+            description='Como `total` foi obtido; só `exata` é garantido '
+            'estar em dia com o banco'
+        ),
+    ] = 'exata'
+
+
+def _itens(linhas: Sequence[Row], colunas: list[dict]) -> list[Any]:
+    qtd_colunas = len(colunas)
+    # `select(Modelo)` devolve a entidade; projeções, um dict por linha
+    # (inclusive as de uma coluna só, como `select(Modelo.id)`).
+    if qtd_colunas == 1 and colunas[0]['expr'] is colunas[0]['entity']:
+        return [linha[0] for linha in linhas]
+    return [
+        dict(zip(linha._fields[:qtd_colunas], linha[:qtd_colunas]))
+        for linha in linhas
+    ]
+
+
+def _codificar_cursor(valores: Sequence[Any]) -> str:
+    return json.dumps([
+        valor.isoformat() if isinstance(valor, datetime) else valor
+        for valor in valores
+    ])
+
+
+def _decodificar_cursor(
+    cursor: str, ordem: Sequence[InstrumentedAttribute]
+) -> list[Any]:
+    try:
+        valores = json.loads(cursor)
+        if not isinstance(valores, list) or len(valores) != len(ordem):
+            raise ValueError(cursor)
+        # Converte cada valor para o tipo da coluna: um cursor forjado
+        # não pode chegar ao banco com tipos trocados.
+        return [
+            datetime.fromisoformat(valor)
+            if coluna.type.python_type is datetime
+            else coluna.type.python_type(valor)
+            for coluna, valor in zip(ordem, valores)
+        ]
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Cursor inválido.',
+        )
+
+
+async def paginate_cursor(
+    session: AsyncSession,
+    stmt: Select,
+    params: CursorParams,
+    ordem: Sequence[InstrumentedAttribute],
+    page_cls: type[CursorPage[T]],
+) -> CursorPage[T]:
+    """Pagina por keyset: `WHERE (ordem) > (cursor) ORDER BY ordem LIMIT n`.
+
+    O custo de cada página independe da profundidade e não há `COUNT(*)`.
+    """
+    raw_params = params.to_raw_params()
+    if raw_params.cursor:
+        valores = _decodificar_cursor(str(raw_params.cursor), ordem)
+        stmt = stmt.where(tuple_(*ordem) > tuple_(*valores))
+
+    colunas = stmt.column_descriptions
+    qtd_colunas = len(colunas)
+    stmt = stmt.add_columns(*ordem).order_by(*ordem).limit(params.size + 1)
+    linhas = (await session.execute(stmt)).all()
+
+    proximo = None
+    if len(linhas) > params.size:
+        linhas = linhas[: params.size]
+        # `size=0` é aceito pelo CursorParams: página vazia, sem cursor.
+        if linhas:
+            proximo = _codificar_cursor(linhas[-1][qtd_colunas:])
+
+    itens = _itens(linhas, colunas)
+    return page_cls.create(itens, params, next_=proximo)
+
+
+async def _contar_exato(session: AsyncSession, stmt: Select) -> int:
+    subquery = stmt.order_by(None).subquery()
+    stmt_total = select(func.count()).select_from(subquery)
+    return (await session.execute(stmt_total)).scalar_one()
+
+
+async def _contar_cache(session: AsyncSession, stmt: Select) -> int:
+    # Sem o ORDER BY, ordenações diferentes dividem a mesma contagem.
+    compilado = stmt.order_by(None).compile(dialect=session.bind.dialect)
+    chave = (str(compilado), tuple(sorted(compilado.params.items())))
+    total = _contagens.get(chave)
+    if total is None:
+        total = await _contar_exato(session, stmt)
+        _contagens.set(chave, total)
+    return total
+
+
+def _tabela_principal(stmt: Select) -> Optional[Table]:
+    """Tabela na ponta esquerda do FROM, a que os JOINs só acrescentam.
+
+    Não vale a entidade da primeira coluna: numa projeção ela pode ser
+    a de uma relação (`?fields=categoria`).
+    """
+    froms = stmt.get_final_froms()
+    if not froms:
+        return None
+    origem = froms[0]
+    while isinstance(origem, Join):
+        origem = origem.left
+    return origem if isinstance(origem, Table) else None
+
+
+async def _contar_estimado(session: AsyncSession, stmt: Select) -> int:
+    """Estimativa do planner, sem ler a tabela.
+
+    Sem filtro, `pg_class.reltuples` da tabela principal (mantido pelo
+    ANALYZE/autovacuum); com filtro, ou se a tabela nunca foi analisada,
+    as linhas previstas por `EXPLAIN`.
+    """
+    tabela = _tabela_principal(stmt)
+    if stmt.whereclause is None and tabela is not None:
+        reltuples = (
+            await session.execute(
+                text(
+                    'SELECT reltuples::bigint FROM pg_class '
+                    'WHERE oid = CAST(:tabela AS regclass)'
+                ),
+                {'tabela': tabela.name},
+            )
+        ).scalar()
+        if reltuples is not None and reltuples >= 0:
+            return reltuples
+
+    conn = await session.connection()
+    compilado = stmt.order_by(None).compile(dialect=conn.dialect)
+    resultado = await conn.exec_driver_sql(
+        f'EXPLAIN (FORMAT JSON) {compilado}', compilado.params
+    )
+    plano = resultado.scalar()
+    if isinstance(plano, str):
+        plano = json.loads(plano)
+    return int(plano[0]['Plan']['Plan Rows'])
+
+
+CONTADORES = {
+    'exata': _contar_exato,
+    'estimada': _contar_estimado,
+    'cache': _contar_cache,
+}
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select,
+    params: Params,
+    contagem: ModoContagem,
+    page_cls: type[Pagina[T]],
+) -> Pagina[T]:
+    """Pagina por limit/offset escolhendo como obter o `total`.
+
+    Uma página incompleta já revela o total exato, então a contagem só
+    roda quando a página vem cheia (ou vazia além do fim).
+    """
+    raw_params = params.to_raw_params()
+    offset = raw_params.offset or 0
+    linhas = (
+        await session.execute(stmt.limit(raw_params.limit).offset(offset))
+    ).all()
+    itens = _itens(linhas, stmt.column_descriptions)
+
+    if len(itens) < params.size and (itens or offset == 0):
+        total = offset + len(itens)
+        contagem = 'exata'
+    else:
+        total = await CONTADORES[contagem](session, stmt)
+        if contagem == 'estimada':
+            total = max(total, offset + len(itens))
+
+    return page_cls.create(itens, params, total=total, contagem=contagem)
@@ -0,0 +1,93 @@
+from http import HTTPStatus
+from itertools import cycle
+from math import ceil, isfinite
+from time import time
+from typing import Literal, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+EstrategiaReplica = Literal['round_robin', 'menos_ocupada']
+
+COOKIE_ESCRITA = 'workout_ultima_escrita'
+# Chave em `request.state` com a janela de leitura no primário.
+ESTADO_ESCRITA = 'janela_escrita'
+
+
+def _em_uso(engine: AsyncEngine) -> int:
+    pool = engine.pool
+    return pool.checkedout() if hasattr(pool, 'checkedout') else 0
+
+
+class RoteadorReplicas:
+    """Escolhe a engine das leituras: uma réplica ou o primário.
+
+    Depois de uma escrita o cliente recebe o cookie `COOKIE_ESCRITA` e,
+    enquanto durar a `janela`, continua lendo do primário para enxergar o
+    que acabou de gravar (read-your-writes).
+    """
+
+    def __init__(
+        self,
+        primario: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        estrategia: EstrategiaReplica = 'round_robin',
+        janela: float = 5.0,
+    ):
+        self.primario = primario
+        self.replicas = list(replicas)
+        self.estrategia = estrategia
+        self.janela = janela
+        self._proxima = cycle(self.replicas)
+
+    def leitura_no_primario(self, ultima_escrita: Optional[str]) -> bool:
+        if not ultima_escrita:
+            return False
+        try:
+            decorrido = time() - float(ultima_escrita)
+        except ValueError:
+            return False
+        # O cookie vem do cliente: uma data no futuro, `inf` ou `nan` não
+        # podem prender as leituras no primário.
+        return isfinite(decorrido) and 0 <= decorrido < self.janela
+
+    def escolher(self, ultima_escrita: Optional[str] = None) -> AsyncEngine:
+        if not self.replicas or self.leitura_no_primario(ultima_escrita):
+            return self.primario
+        if self.estrategia == 'menos_ocupada':
+            return min(self.replicas, key=_em_uso)
+        return next(self._proxima)
+
+
+class LeituraAposEscritaMiddleware:
+    """Grava `COOKIE_ESCRITA` nas respostas de escritas bem-sucedidas.
+
+    A dependência de sessão de escrita marca `request.state` com a janela
+    do roteador; sem réplicas configuradas nada é marcado e nenhum cookie
+    é enviado.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            janela = scope.get('state', {}).get(ESTADO_ESCRITA)
+            if (
+                message['type'] == 'http.response.start'
+                and janela
+                and message['status'] < HTTPStatus.BAD_REQUEST
+            ):
+                MutableHeaders(scope=message).append(
+                    'Set-Cookie',
+                    f'{COOKIE_ESCRITA}={time():.3f}; Max-Age={ceil(janela)}; '
+                    'Path=/; HttpOnly; SameSite=Lax',
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
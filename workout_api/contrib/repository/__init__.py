@@ -0,0 +1,3 @@
+from workout_api.contrib.repository.escrita import atualizar, remover
+
+__all__ = ['atualizar', 'remover']
@@ -0,0 +1,47 @@
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import ColumnElement, RowMapping, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.contrib.models import BaseModel
+
+
+async def atualizar(
+    db_session: AsyncSession,
+    modelo: type[BaseModel],
+    id: Any,
+    valores: dict[str, Any],
+    colunas: Sequence[ColumnElement],
+    *filtros: ColumnElement[bool],
+) -> Optional[RowMapping]:
+    """`UPDATE ... WHERE id = :id RETURNING <colunas>` em um round trip.
+
+    Colunas de outras tabelas em `colunas`, ligadas por `filtros`, viram
+    um `UPDATE ... FROM`, o que traz junto, por exemplo, o nome das
+    relações. Sem `valores` não há o que gravar e a mesma linha é lida
+    com um SELECT. Devolve `None` quando o id não existe.
+    """
+    if valores:
+        stmt = (
+            update(modelo)
+            .where(modelo.id == id, *filtros)
+            .values(**valores)
+            .returning(*colunas)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        stmt = select(*colunas).where(modelo.id == id, *filtros)
+    return (await db_session.execute(stmt)).mappings().first()
+
+
+async def remover(
+    db_session: AsyncSession, modelo: type[BaseModel], id: Any
+) -> Optional[int]:
+    """`DELETE ... WHERE id = :id RETURNING pk_id`; `None` se não existia."""
+    stmt = (
+        delete(modelo)
+        .where(modelo.id == id)
+        .returning(modelo.pk_id)
+        .execution_options(synchronize_session=False)
+    )
+    return (await db_session.execute(stmt)).scalar()
@@ -0,0 +1,86 @@
+from typing import Literal
+
+from sqlalchemy import ColumnElement, func, literal
+from sqlalchemy.orm import InstrumentedAttribute
+
+ModoBusca = Literal['contem', 'prefixo']
+
+
+def _escapar_like(termo: str) -> str:
+    return termo.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class EstrategiaBusca:
+    nome: str
+    casa_substring: bool
+    ignora_acentos: bool
+
+    def atende(self, prefixo: bool, sem_acento: bool) -> bool:
+        return (prefixo or self.casa_substring) and (
+            self.ignora_acentos or not sem_acento
+        )
+
+    def normalizar(self, expressao: ColumnElement) -> ColumnElement:
+        return func.f_unaccent(expressao) if self.ignora_acentos else expressao
+
+    def filtro(
+        self, coluna: InstrumentedAttribute, termo: str, prefixo: bool
+    ) -> ColumnElement[bool]:
+        termo = _escapar_like(termo)
+        padrao = f'{termo}%' if prefixo else f'%{termo}%'
+        return self.normalizar(coluna).ilike(
+            self.normalizar(literal(padrao)), escape='\\'
+        )
+
+
+class BuscaPrefixo(EstrategiaBusca):
+    """`ILIKE 'termo%'`: a mais barata, servida pelo índice GIN trigram."""
+
+    nome = 'prefixo'
+    casa_substring = False
+    ignora_acentos = False
+
+
+class BuscaSubstring(EstrategiaBusca):
+    """`ILIKE '%termo%'`, também servida pelo índice GIN trigram."""
+
+    nome = 'contem'
+    casa_substring = True
+    ignora_acentos = False
+
+
+class BuscaSemAcento(EstrategiaBusca):
+    """`f_unaccent(coluna) ILIKE f_unaccent(padrao)`.
+
+    Servida pelo índice GIN trigram sobre `f_unaccent(nome)`; fica por
+    último porque só ela precisa tirar os acentos de cada termo.
+    """
+
+    nome = 'sem_acento'
+    casa_substring = True
+    ignora_acentos = True
+
+
+# Ordenadas da mais barata para a mais cara.
+ESTRATEGIAS: tuple[EstrategiaBusca, ...] = (
+    BuscaPrefixo(),
+    BuscaSubstring(),
+    BuscaSemAcento(),
+)
+
+
+def escolher_estrategia(
+    modo: ModoBusca = 'contem', sem_acento: bool = False
+) -> EstrategiaBusca:
+    prefixo = modo == 'prefixo'
+    return next(e for e in ESTRATEGIAS if e.atende(prefixo, sem_acento))
+
+
+def filtro_busca(
+    coluna: InstrumentedAttribute,
+    termo: str,
+    modo: ModoBusca = 'contem',
+    sem_acento: bool = False,
+) -> ColumnElement[bool]:
+    estrategia = escolher_estrategia(modo, sem_acento)
+    return estrategia.filtro(coluna, termo, prefixo=modo == 'prefixo')
@@ -1,11 +1,40 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi_pagination import add_pagination
 
+from workout_api.configs.cache import cache
+from workout_api.configs.settings import settings
+from workout_api.contrib.cache import escutar_invalidacoes
+from workout_api.contrib.metrics import MetricasMiddleware
+from workout_api.contrib.metrics import router as metricas
+from workout_api.contrib.replicas import LeituraAposEscritaMiddleware
 from workout_api.routers import api_router
 
-app = FastAPI(title='WorkoutApi')
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):  # pragma: no cover
+    if not settings.CACHE_NOTIFY:
+        yield
+        await cache.fechar()
+        return
+    # Backend em memória: cada worker também avança a própria versão.
+    ao_notificar = cache.invalidar if cache.backend.local else None
+    tarefa = asyncio.create_task(escutar_invalidacoes(ao_notificar))
+    yield
+    tarefa.cancel()
+    with suppress(asyncio.CancelledError):
+        await tarefa
+    await cache.fechar()
+
+
+app = FastAPI(title='WorkoutApi', lifespan=lifespan)
+app.add_middleware(LeituraAposEscritaMiddleware)
+app.add_middleware(MetricasMiddleware)
 
 
 app.include_router(api_router)
+app.include_router(metricas)
 
 add_pagination(app)